@@ -1,7 +1,11 @@
+import atexit
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+import queue
+import threading
+import time
 import requests
 
 # --- COLORES Y HANDLER ---
@@ -22,59 +26,367 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 class TelegramHandler(logging.Handler):
+    """Envía los registros a Telegram sin bloquear al hilo que hace el logging.
+
+    ``emit`` solo formatea el registro y lo pone en una cola acotada; un hilo
+    en segundo plano agrupa las ráfagas en un solo mensaje y las envía con una
+    ``requests.Session`` reutilizada, respetando el límite de mensajes por
+    segundo y reintentando con espera exponencial. ``flush``/``close`` vacían
+    la cola antes de terminar.
+
+    ``politica``: qué hacer con la cola llena: "descartar_nuevos" o
+    "descartar_antiguos". ``url_base`` permite apuntar a un servidor local de
+    pruebas.
+    """
     EMOJIS = {'DEBUG': '🔍', 'INFO': 'ℹ️', 'WARNING': '⚠️', 'ERROR': '❌', 'CRITICAL': '🚨'}
-    
-    def __init__(self, bot_token, chat_id, level=logging.WARNING):
+    MAX_CARACTERES = 4096  # límite de Telegram por mensaje
+
+    def __init__(self, bot_token, chat_id, level=logging.WARNING, max_cola=1000,
+                 politica='descartar_antiguos', ventana=1.0, max_por_lote=20,
+                 mensajes_por_segundo=1.0, max_reintentos=5, timeout=5.0,
+                 url_base='https://api.telegram.org', verificar=True):
         super().__init__(level)
+        assert politica in ('descartar_nuevos', 'descartar_antiguos'), \
+            "politica debe ser 'descartar_nuevos' o 'descartar_antiguos'."
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        self._verificar_conexion()
-    
-    def _verificar_conexion(self):
-        try:
-            payload = {'chat_id': self.chat_id, 'text': "✅ Sistema de logging conectado"}
-            requests.post(self.url, data=payload, timeout=5)
-            print(f"✓ Telegram conectado correctamente")
-        except Exception as e:
-            print(f"⚠ Error de conexión Telegram: {e}")
+        self.url = f"{url_base}/bot{bot_token}/sendMessage"
+        self.politica = politica
+        self.ventana = ventana
+        self.max_por_lote = max_por_lote
+        self.intervalo_min = 1.0 / mensajes_por_segundo
+        self.max_reintentos = max_reintentos
+        self.timeout = timeout
+
+        # métricas
+        self.enviados = 0
+        self.descartados = 0
+        self.fallidos = 0
+
+        self._cola = queue.Queue(maxsize=max_cola)
+        self._pendientes = 0  # registros en la cola o en el lote que se está enviando
+        self._cond = threading.Condition()
+        self._detener = threading.Event()
+        self._ultimo_envio = 0.0
+        self._session = requests.Session()
+        adaptador = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self._session.mount('https://', adaptador)
+        self._session.mount('http://', adaptador)
+        self._hilo = threading.Thread(target=self._enviar_en_segundo_plano, name='TelegramHandler', daemon=True)
+        self._hilo.start()
+        if verificar:
+            # ya no bloquea el constructor: el mensaje de prueba va por la cola
+            self._encolar((logging.INFO, 'INFO', "✅ Sistema de logging conectado"))
+
+    # --- lado del que hace logging ---
 
     def emit(self, record):
         try:
-            log_entry = self.format(record)
-            emoji = self.EMOJIS.get(record.levelname, '📝')
-            message = f"{emoji} *{record.levelname}*\n\n```\n{log_entry}\n```"
-            payload = {'chat_id': self.chat_id, 'text': message, 'parse_mode': 'Markdown'}
-            requests.post(self.url, data=payload, timeout=5)
+            self._encolar((record.levelno, record.levelname, self.format(record)))
         except Exception:
+            self.handleError(record)
+
+    def _encolar(self, entrada):
+        with self._cond:
+            self._pendientes += 1
+        try:
+            self._cola.put_nowait(entrada)
+            return
+        except queue.Full:
             pass
+        if self.politica == 'descartar_antiguos':
+            try:
+                self._cola.get_nowait()
+                self._cola.put_nowait(entrada)
+                self._descartar(1)
+                return
+            except (queue.Empty, queue.Full):
+                pass
+        self._descartar(1)
+
+    def _descartar(self, k):
+        with self._cond:
+            self.descartados += k
+            self._pendientes -= k
+            self._cond.notify_all()
+
+    # --- hilo de envío ---
+
+    def _enviar_en_segundo_plano(self):
+        while not (self._detener.is_set() and self._cola.empty()):
+            try:
+                lote = [self._cola.get(timeout=0.1)]
+            except queue.Empty:
+                continue
+            # agrupar la ráfaga: lo que llegue durante la ventana
+            limite = time.monotonic() + (0 if self._detener.is_set() else self.ventana)
+            while len(lote) < self.max_por_lote:
+                try:
+                    lote.append(self._cola.get(timeout=max(0.0, limite - time.monotonic())))
+                except queue.Empty:
+                    break
+            for texto in self._mensajes(lote):
+                if self._enviar(texto):
+                    self.enviados += 1
+                else:
+                    self.fallidos += 1
+            with self._cond:
+                self._pendientes -= len(lote)
+                self._cond.notify_all()
+
+    def _mensajes(self, lote):
+        _, nivel, _ = max(lote, key=lambda entrada: entrada[0])
+        emoji = self.EMOJIS.get(nivel, '📝')
+        titulo = f"{emoji} *{nivel}*" + (f" ({len(lote)} registros)" if len(lote) > 1 else "")
+        cuerpo = "\n".join(texto for _, _, texto in lote)
+        espacio = self.MAX_CARACTERES - len(titulo) - 16
+        for i in range(0, max(len(cuerpo), 1), espacio):
+            yield f"{titulo}\n\n```\n{cuerpo[i:i + espacio]}\n```"
+
+    def _enviar(self, texto):
+        payload = {'chat_id': self.chat_id, 'text': texto, 'parse_mode': 'Markdown'}
+        espera = 1.0
+        for _ in range(self.max_reintentos):
+            # límite de mensajes por segundo
+            pausa = self._ultimo_envio + self.intervalo_min - time.monotonic()
+            if pausa > 0:
+                time.sleep(pausa)
+            self._ultimo_envio = time.monotonic()
+            try:
+                r = self._session.post(self.url, data=payload, timeout=self.timeout)
+                if r.status_code == 200:
+                    return True
+                if r.status_code == 429:
+                    # Telegram indica cuánto esperar
+                    try:
+                        espera = float(r.json()['parameters']['retry_after'])
+                    except Exception:
+                        pass
+                elif r.status_code < 500:
+                    return False  # error del pedido; reintentar no sirve
+            except requests.RequestException:
+                pass
+            if self._detener.is_set():
+                espera = min(espera, 1.0)
+            time.sleep(espera)
+            espera = min(espera * 2, 60.0)
+        return False
+
+    # --- vaciado y cierre ---
+
+    def flush(self, timeout=10.0):
+        with self._cond:
+            self._cond.wait_for(lambda: self._pendientes <= 0, timeout=timeout)
+
+    def close(self):
+        self.flush()
+        self._detener.set()
+        self._hilo.join(timeout=10.0)
+        self._session.close()
+        super().close()
+
+    def metricas(self):
+        return {
+            'en_cola': self._cola.qsize(),
+            'enviados': self.enviados,
+            'descartados': self.descartados,
+            'fallidos': self.fallidos,
+        }
+
+# --- LOGGING ASÍNCRONO ---
+
+class ArchivoBufferizado(RotatingFileHandler):
+    """RotatingFileHandler que escribe a través de un búfer grande y solo lo
+    vacía al disco cada ``intervalo_flush`` segundos (y al cerrar)."""
+
+    def __init__(self, filename, intervalo_flush=1.0, tam_bufer=64 * 1024, **kwargs):
+        self.intervalo_flush = intervalo_flush
+        self.tam_bufer = tam_bufer
+        self._ultimo_flush = time.monotonic()
+        super().__init__(filename, **kwargs)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.tam_bufer,
+                      encoding=self.encoding, errors=self.errors)
+        self._escritos = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record):
+        # sin seek/tell en cada registro (vaciarían el búfer): se cuentan los
+        # bytes del mensaje codificado; el texto se guarda para no formatearlo
+        # otra vez en emit
+        if self.stream is None:
+            self.stream = self._open()
+        self._mensaje = self.format(record) + self.terminator
+        self._ultimo = len(self._mensaje.encode(self.stream.encoding or "utf-8", self.stream.errors or "strict"))
+        return self.maxBytes > 0 and self._escritos + self._ultimo >= self.maxBytes
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(self._mensaje)
+            self._escritos += self._ultimo
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self, forzar=False):
+        # StreamHandler llama a flush en cada registro; aquí solo se vacía periódicamente
+        if forzar or time.monotonic() - self._ultimo_flush >= self.intervalo_flush:
+            super().flush()
+            self._ultimo_flush = time.monotonic()
+
+    def close(self):
+        self.flush(forzar=True)
+        super().close()
+
+
+class QueueHandlerAcotado(QueueHandler):
+    """QueueHandler que no bloquea con la cola llena: descarta el registro y lo cuenta.
+    [IMPORTANTE] Los argumentos del mensaje se formatean en el listener; no se
+    deben modificar los objetos pasados como argumentos después de la llamada."""
+
+    def __init__(self, cola):
+        super().__init__(cola)
+        self.descartados = 0
+        self.listener = None
+
+    def prepare(self, record):
+        # la cola es entre hilos (no se serializa): el mensaje se formatea en el
+        # listener y no en el hilo que hace logging
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+    def close(self):
+        # logging.shutdown cierra este handler: se vacía la cola y se cierran los destinos
+        _detener_listener(self)
+        super().close()
+
+
+class ListenerMedido(QueueListener):
+    """QueueListener que mide la latencia de cada destino (por handler, aunque
+    haya dos del mismo tipo) y vacía los búferes de los archivos cuando no
+    llegan registros durante ``intervalo_flush``."""
+
+    def __init__(self, cola, *handlers, intervalo_flush=1.0):
+        super().__init__(cola, *handlers, respect_handler_level=True)
+        self.intervalo_flush = intervalo_flush
+        self.latencias = {h: {'registros': 0, 'total_s': 0.0, 'max_s': 0.0} for h in handlers}
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.intervalo_flush)
+            except queue.Empty:
+                for handler in self.handlers:
+                    if isinstance(handler, ArchivoBufferizado):
+                        handler.flush(forzar=True)
+
+    def handle(self, record):
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if record.levelno < handler.level:
+                continue
+            inicio = time.perf_counter()
+            handler.handle(record)
+            duracion = time.perf_counter() - inicio
+            m = self.latencias[handler]
+            m['registros'] += 1
+            m['total_s'] += duracion
+            m['max_s'] = max(m['max_s'], duracion)
+
+
+def metricas_logger(logger):
+    """Profundidad de la cola, registros descartados y latencia por destino de
+    un logger configurado con ``configurar_logger(..., asincrono=True)``. Las
+    latencias se identifican por el nombre del handler (o tipo e índice)."""
+    for handler in logger.handlers:
+        if isinstance(handler, QueueHandlerAcotado) and handler.listener is not None:
+            latencias = {
+                (h.get_name() or f"{type(h).__name__}#{i}"):
+                    dict(m, promedio_s=m['total_s'] / m['registros'] if m['registros'] else 0.0)
+                for i, (h, m) in enumerate(handler.listener.latencias.items())
+            }
+            return {'en_cola': handler.queue.qsize(), 'descartados': handler.descartados,
+                    'latencias': latencias}
+    return None
+
+
+def _detener_listener(handler):
+    if isinstance(handler, QueueHandlerAcotado) and handler.listener is not None:
+        handler.listener.stop()
+        for h in handler.listener.handlers:
+            h.close()
+        handler.listener = None
+
 
 # --- CONFIGURACIÓN DEL LOGGER ---
 
 def configurar_logger(nombre='app', nivel_consola=logging.INFO, nivel_archivo=logging.DEBUG, 
-                     telegram_token=None, telegram_chat_id=None):
+                     telegram_token=None, telegram_chat_id=None,
+                     asincrono=False, max_cola=10000, intervalo_flush=1.0):
+    """Con ``asincrono=True`` el logger solo pone cada registro en una cola
+    acotada (unos microsegundos por llamada) y un hilo QueueListener lo
+    reparte a la consola, al archivo (con escritura bufferizada y vaciado cada
+    ``intervalo_flush`` segundos) y a Telegram. Ver ``metricas_logger``.
+    Con ``nombre=None`` se configura el logger raíz (p. ej. para los
+    ``logging.debug`` de los métodos numéricos)."""
     logger = logging.getLogger(nombre)
     logger.setLevel(logging.DEBUG)
     
     if logger.handlers:
+        for handler in logger.handlers:
+            _detener_listener(handler)
         logger.handlers.clear()
 
+    handlers = []
+
     # Consola
     console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.set_name('consola')
+    console_handler.setLevel(nivel_consola)
     console_handler.setFormatter(ColoredFormatter('%(asctime)s | %(levelname)-8s | %(message)s', '%H:%M:%S'))
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # Archivo
     os.makedirs('logs', exist_ok=True)
-    file_handler = RotatingFileHandler('logs/aplicacion.log', maxBytes=2*1024*1024, backupCount=3)
+    if asincrono:
+        file_handler = ArchivoBufferizado('logs/aplicacion.log', intervalo_flush=intervalo_flush,
+                                          maxBytes=2*1024*1024, backupCount=3)
+    else:
+        file_handler = RotatingFileHandler('logs/aplicacion.log', maxBytes=2*1024*1024, backupCount=3)
+    file_handler.set_name('archivo')
+    file_handler.setLevel(nivel_archivo)
     file_handler.setFormatter(logging.Formatter('%(asctime)s | %(levelname)s | %(message)s'))
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
 
     # Telegram (Solo si hay Token e ID)
     if telegram_token and telegram_chat_id:
         t_handler = TelegramHandler(telegram_token, telegram_chat_id, level=logging.ERROR)
-        logger.addHandler(t_handler)
-    
+        t_handler.set_name('telegram')
+        handlers.append(t_handler)
+
+    if not asincrono:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return logger
+
+    # Cola: el hilo que hace logging solo encola; el listener reparte a los destinos
+    q_handler = QueueHandlerAcotado(queue.Queue(maxsize=max_cola))
+    q_handler.listener = ListenerMedido(q_handler.queue, *handlers, intervalo_flush=intervalo_flush)
+    q_handler.listener.start()
+    atexit.register(_detener_listener, q_handler)
+    logger.addHandler(q_handler)
     return logger
 
 # --- FUNCIONES DE EJEMPLO ---
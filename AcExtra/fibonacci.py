@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Números de Fibonacci compartidos por los scripts de AcExtra.
+
+- ``fibonacci(n)``: un solo valor en O(log n) con duplicación rápida
+  (F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)² + F(k+1)²) y caché acotada.
+- ``generar_fibonacci(N)``: F(0..N) en una sola pasada lineal.
+- ``serie_fibonacci(N)``: F(0..N) como arreglo, float64 mientras es exacto y
+  enteros exactos de Python después.
+- ``cocientes_fibonacci(n_max)``: F(n)/F(n-1) en una sola pasada.
+"""
+
+from functools import lru_cache
+from typing import Iterator
+
+import numpy as np
+
+
+# F(78) es el último valor menor que 2**53: hasta ahí float64 es exacto.
+MAX_EXACTO_FLOAT = 78
+TAM_CACHE = 1024
+
+
+# --- Un valor ---
+@lru_cache(maxsize=TAM_CACHE)
+def _duplicacion(n: int) -> tuple[int, int]:
+    """Retorna (F(n), F(n+1))."""
+    if n == 0:
+        return 0, 1
+    a, b = _duplicacion(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if n & 1:
+        return d, c + d
+    return c, d
+
+
+def fibonacci(n: int) -> int:
+    """n-ésimo número de Fibonacci exacto (F(0) = 0, F(1) = 1) en O(log n)."""
+    assert n >= 0, "n debe ser un entero no negativo."
+    return _duplicacion(int(n))[0]
+
+
+# --- Rangos ---
+def generar_fibonacci(N: int) -> Iterator[int]:
+    """Genera F(0), F(1), ..., F(N) con una suma por término."""
+    x, y = 0, 1
+    for _ in range(N + 1):
+        yield x
+        x, y = y, x + y
+
+
+def serie_fibonacci(N: int) -> np.ndarray:
+    """F(0..N) en un arreglo: float64 si N <= MAX_EXACTO_FLOAT, si no un
+    arreglo ``object`` con enteros exactos."""
+    if N <= MAX_EXACTO_FLOAT:
+        return np.fromiter(generar_fibonacci(N), dtype=np.float64, count=N + 1)
+    serie = np.empty(N + 1, dtype=object)
+    serie[:] = list(generar_fibonacci(N))
+    return serie
+
+
+def cocientes_fibonacci(n_max: int, n_min: int = 2) -> np.ndarray:
+    """Cocientes F(n)/F(n-1) para n = n_min..n_max, que tienden al número áureo.
+    Empiezan en n = 2 porque F(0) = 0. Con enteros grandes se usa la división
+    exacta de Python, que redondea correctamente aunque F(n) no quepa en float64."""
+    assert 2 <= n_min <= n_max, "Se necesita 2 <= n_min <= n_max (F(1)/F(0) no está definido)."
+    if n_max <= MAX_EXACTO_FLOAT:
+        serie = serie_fibonacci(n_max)
+        return serie[n_min:] / serie[n_min - 1:-1]
+    cocientes = np.empty(n_max - n_min + 1)
+    anterior = None
+    for n, valor in enumerate(generar_fibonacci(n_max)):
+        if n >= n_min:
+            cocientes[n - n_min] = valor / anterior
+        anterior = valor
+    return cocientes
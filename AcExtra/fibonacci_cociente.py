@@ -1,20 +1,11 @@
 import matplotlib.pyplot as plt
 import math
 
-def fibonacci(n):
-    if n == 0:
-        return 0
-    x = 0
-    y = 1
-    for i in range(1, n):
-        z = x + y
-        x = y
-        y = z
-    return y
+from fibonacci import cocientes_fibonacci
 
 # Generar datos del cociente
 n_values = list(range(2, 21))
-ratio_values = [fibonacci(n) / fibonacci(n-1) for n in n_values]
+ratio_values = cocientes_fibonacci(20)
 
 # Número áureo
 phi = (1 + math.sqrt(5)) / 2
@@ -22,8 +13,7 @@ phi = (1 + math.sqrt(5)) / 2
 # Imprimir tabla
 print("| n  | fib(n)/fib(n-1) |")
 print("|----|-----------------|")
-for n in range(2, 12):
-    ratio = fibonacci(n) / fibonacci(n-1)
+for n, ratio in zip(n_values[:10], ratio_values):
     print(f"| {n:<2} | {ratio:.6f}      |")
 
 # Gráfica
@@ -1,19 +1,10 @@
 import matplotlib.pyplot as plt
 
-def fibonacci(n):
-    if n == 0:
-        return 0
-    x = 0
-    y = 1
-    for i in range(1, n):
-        z = x + y
-        x = y
-        y = z
-    return y
+from fibonacci import serie_fibonacci
 
 # Generar datos
 n_values = list(range(0, 21))
-fib_values = [fibonacci(n) for n in n_values]
+fib_values = serie_fibonacci(20)
 
 # Gráfica
 plt.figure(figsize=(8, 6))
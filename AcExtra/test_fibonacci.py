@@ -0,0 +1,55 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from fibonacci import MAX_EXACTO_FLOAT, cocientes_fibonacci, fibonacci, generar_fibonacci, serie_fibonacci
+
+
+def fibonacci_lineal(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def test_valores_conocidos():
+    assert [fibonacci(n) for n in range(11)] == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55]
+    assert fibonacci(100) == 354224848179261915075
+    f_1531 = fibonacci(1531)
+    assert f_1531 == fibonacci_lineal(1531)
+    assert len(str(f_1531)) == 320
+    assert f_1531 % 10**10 == fibonacci_lineal(1531) % 10**10
+
+
+def test_generador_coincide_con_duplicacion():
+    assert list(generar_fibonacci(200)) == [fibonacci(n) for n in range(201)]
+
+
+def test_frontera_float_entero_exacto():
+    assert MAX_EXACTO_FLOAT == 78
+    assert fibonacci(78) < 2**53 < fibonacci(79)
+
+    serie = serie_fibonacci(78)
+    assert serie.dtype == np.float64
+    assert [int(v) for v in serie] == [fibonacci(n) for n in range(79)]
+
+    serie = serie_fibonacci(79)
+    assert serie.dtype == object
+    assert serie[79] == 14472334024676221
+    assert float(serie[79]) != serie[79]  # F(79) ya no es exacto en float64
+
+
+@pytest.mark.parametrize("n_max", [20, 78, 79, 300])
+def test_tabla_de_cocientes(n_max):
+    cocientes = cocientes_fibonacci(n_max)
+    assert cocientes.shape == (n_max - 1,)
+    esperado = [float(Fraction(fibonacci(n), fibonacci(n - 1))) for n in range(2, n_max + 1)]
+    assert np.array_equal(cocientes, esperado)
+    assert cocientes[-1] == pytest.approx((1 + np.sqrt(5)) / 2)
+
+
+def test_cocientes_empiezan_en_2():
+    assert np.array_equal(cocientes_fibonacci(5, 3), [2.0, 1.5, 5 / 3])
+    with pytest.raises(AssertionError):
+        cocientes_fibonacci(10, 1)
@@ -0,0 +1,118 @@
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+from ModuloTelegram import TelegramHandler
+
+
+class ServidorFalso:
+    """Servidor HTTP local que imita ``sendMessage``: guarda cada pedido y
+    responde con los códigos de ``respuestas`` en orden (luego 200)."""
+
+    def __init__(self, respuestas=()):
+        self.pedidos = []
+        self.respuestas = list(respuestas)
+        servidor = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            def do_POST(self):
+                largo = int(self.headers['Content-Length'])
+                datos = parse_qs(self.rfile.read(largo).decode())
+                servidor.pedidos.append((self.path, {k: v[0] for k, v in datos.items()}))
+                codigo, cuerpo = servidor.respuestas.pop(0) if servidor.respuestas else (200, {'ok': True})
+                contenido = json.dumps(cuerpo).encode()
+                self.send_response(codigo)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(contenido)))
+                self.end_headers()
+                self.wfile.write(contenido)
+
+            def log_message(self, *args):
+                pass
+
+        self.http = ThreadingHTTPServer(('127.0.0.1', 0), Manejador)
+        self.url = f"http://127.0.0.1:{self.http.server_address[1]}"
+        self._hilo = threading.Thread(target=self.http.serve_forever, daemon=True)
+        self._hilo.start()
+
+    def cerrar(self):
+        self.http.shutdown()
+        self.http.server_close()
+
+
+@pytest.fixture
+def crear_servidor():
+    servidores = []
+
+    def crear(respuestas=()):
+        servidores.append(ServidorFalso(respuestas))
+        return servidores[-1]
+
+    yield crear
+    for s in servidores:
+        s.cerrar()
+
+
+def crear_handler(servidor, **kwargs):
+    opciones = dict(ventana=0.2, mensajes_por_segundo=100.0, verificar=False, url_base=servidor.url)
+    opciones.update(kwargs)
+    handler = TelegramHandler('TOKEN', 'CHAT', **opciones)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger = logging.getLogger(f'prueba_telegram_{id(handler)}')
+    logger.propagate = False
+    logger.addHandler(handler)
+    return handler, logger
+
+
+def test_agrupa_rafaga_en_un_mensaje(crear_servidor):
+    servidor = crear_servidor()
+    handler, logger = crear_handler(servidor)
+    for i in range(5):
+        logger.error("registro %d", i)
+    handler.close()
+
+    assert len(servidor.pedidos) == 1
+    ruta, datos = servidor.pedidos[0]
+    assert ruta == '/botTOKEN/sendMessage'
+    assert datos['chat_id'] == 'CHAT'
+    assert '(5 registros)' in datos['text']
+    assert all(f"registro {i}" in datos['text'] for i in range(5))
+    assert handler.metricas() == {'en_cola': 0, 'enviados': 1, 'descartados': 0, 'fallidos': 0}
+
+
+def test_reintenta_429_y_errores_del_servidor(crear_servidor):
+    servidor = crear_servidor([(429, {'ok': False, 'parameters': {'retry_after': 0.05}}), (502, {'ok': False})])
+    handler, logger = crear_handler(servidor)
+    logger.error("importante")
+    handler.close()
+
+    assert len(servidor.pedidos) == 3
+    assert all(datos['text'] == servidor.pedidos[0][1]['text'] for _, datos in servidor.pedidos)
+    assert handler.enviados == 1 and handler.fallidos == 0
+
+
+def test_no_reintenta_errores_del_pedido(crear_servidor):
+    servidor = crear_servidor([(400, {'ok': False})])
+    handler, logger = crear_handler(servidor)
+    logger.error("mal formado")
+    handler.close()
+
+    assert len(servidor.pedidos) == 1
+    assert handler.enviados == 0 and handler.fallidos == 1
+
+
+def test_close_vacia_la_cola(crear_servidor):
+    servidor = crear_servidor()
+    handler, logger = crear_handler(servidor, max_por_lote=2)
+    for i in range(6):
+        logger.critical("pendiente %d", i)
+    handler.close()
+
+    textos = "\n".join(datos['text'] for _, datos in servidor.pedidos)
+    assert len(servidor.pedidos) == 3
+    assert all(f"pendiente {i}" in textos for i in range(6))
+    assert handler.metricas()['en_cola'] == 0
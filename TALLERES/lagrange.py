@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Interpolación de Lagrange en forma baricéntrica.
+
+Los pesos w_k = 1 / Π_{j≠k} (x_k - x_j) se calculan una sola vez en O(n²) y
+cada evaluación cuesta O(n) por punto con la segunda fórmula baricéntrica
+
+    P(x) = Σ w_k y_k / (x - x_k)  /  Σ w_k / (x - x_k).
+
+Agregar un nodo actualiza los pesos en O(n), y varios conjuntos de ``y``
+sobre los mismos nodos se evalúan sin recalcularlos.
+"""
+
+import numpy as np
+
+
+# Número máximo de elementos (puntos × nodos) de la matriz temporal de
+# evaluación; los puntos se procesan en bloques para acotar la memoria.
+ELEMENTOS_BLOQUE = 1 << 20
+
+
+# ####################################################################
+class InterpoladorLagrange:
+    """Polinomio interpolante de Lagrange en los nodos ``x_data``.
+
+    ## Parameters
+    ``x_data``: nodos distintos entre sí.
+    ``y_data``: (opcional) valores en los nodos, de tamaño (n,) o (m, n) para
+                m series sobre los mismos nodos.
+    """
+    def __init__(self, x_data: np.ndarray | list, y_data: np.ndarray | list | None = None):
+        self.x = np.asarray(x_data, dtype=float).ravel()
+        assert len(np.unique(self.x)) == len(self.x), "Los nodos deben ser distintos."
+        dif = self.x[:, None] - self.x[None, :]
+        np.fill_diagonal(dif, 1.0)
+        # El producto Π (x_k - x_j) se desborda con pocos cientos de nodos; se
+        # acumula en escala logarítmica con el signo aparte.
+        signo = np.prod(np.sign(dif), axis=1)
+        log_producto = np.sum(np.log(np.abs(dif)), axis=1)
+        self._log_escala = np.min(log_producto)
+        self.w = self._escalar(signo * np.exp(self._log_escala - log_producto))
+        self.y = None
+        if y_data is not None:
+            self.fijar_y(y_data)
+
+    def _escalar(self, w: np.ndarray) -> np.ndarray:
+        # La fórmula baricéntrica no cambia al multiplicar todos los pesos por
+        # una constante; se normalizan para evitar desbordamientos al agregar
+        # nodos y se guarda el factor aplicado (w = w_real * exp(_log_escala)).
+        maximo = np.max(np.abs(w))
+        self._log_escala -= np.log(maximo)
+        return w / maximo
+
+    @property
+    def n(self) -> int:
+        return len(self.x)
+
+    def fijar_y(self, y_data: np.ndarray | list) -> None:
+        """Cambia los valores interpolados sin recalcular los pesos."""
+        y = np.asarray(y_data, dtype=float)
+        assert y.shape[-1] == self.n, "y_data debe tener un valor por nodo."
+        self.y = y
+
+    def agregar_nodo(self, x_nuevo: float, y_nuevo: float | np.ndarray | None = None) -> None:
+        """Agrega un nodo actualizando los pesos en O(n).
+
+        ## Parameters
+        ``x_nuevo``: nuevo nodo, distinto de los existentes.
+        ``y_nuevo``: valor (o valores, uno por serie) en el nuevo nodo; es
+                     obligatorio si ya se fijaron valores ``y``.
+        """
+        x_nuevo = float(x_nuevo)
+        dif = self.x - x_nuevo
+        assert np.all(dif != 0), "El nodo ya existe."
+        w_nuevo = np.prod(np.sign(-dif)) * np.exp(self._log_escala - np.sum(np.log(np.abs(dif))))
+        self.w = self._escalar(np.append(self.w / dif, w_nuevo))
+        self.x = np.append(self.x, x_nuevo)
+        if self.y is not None:
+            assert y_nuevo is not None, "Se necesita el valor y del nuevo nodo."
+            y_nuevo = np.asarray(y_nuevo, dtype=float)
+            self.y = np.concatenate([self.y, y_nuevo[..., None]], axis=-1)
+
+    def evaluar(self, x: np.ndarray | list | float, y_data: np.ndarray | list | None = None) -> np.ndarray:
+        """Evalúa el polinomio interpolante en ``x``.
+
+        ## Parameters
+        ``x``: punto o arreglo de puntos de cualquier forma.
+        ``y_data``: (opcional) valores a interpolar en lugar de los fijados,
+                    de tamaño (n,) o (m, n).
+
+        ## Return
+        Arreglo con la forma de ``x``, precedida por (m,) si hay varias series.
+        """
+        y = self.y if y_data is None else np.asarray(y_data, dtype=float)
+        assert y is not None, "No hay valores y para interpolar."
+        assert y.shape[-1] == self.n, "y_data debe tener un valor por nodo."
+        x = np.asarray(x, dtype=float)
+        puntos = x.ravel()
+        Y = y.reshape(-1, self.n)
+        resultado = np.empty((Y.shape[0], puntos.size))
+
+        paso = max(1, ELEMENTOS_BLOQUE // self.n)
+        for inicio in range(0, puntos.size, paso):
+            p = puntos[inicio:inicio + paso]
+            dif = p[:, None] - self.x[None, :]
+            exacto = dif == 0
+            dif[exacto] = 1.0
+            t = self.w / dif  # (puntos, n)
+            valores = (t @ Y.T) / np.sum(t, axis=1)[:, None]
+            # puntos que coinciden con un nodo: el valor es el dato
+            fila, col = np.nonzero(exacto)
+            valores[fila] = Y[:, col].T
+            resultado[:, inicio:inicio + paso] = valores.T
+
+        return resultado.reshape(y.shape[:-1] + x.shape)
+
+    def __call__(self, x, y_data=None) -> np.ndarray:
+        return self.evaluar(x, y_data)
+
+
+# ####################################################################
+def L_k(x: np.ndarray | float, x_data: np.ndarray | list, k: int) -> np.ndarray:
+    """Polinomio base L_k de Lagrange evaluado en ``x`` (escalar o arreglo)."""
+    e_k = np.zeros(len(x_data))
+    e_k[k] = 1.0
+    return InterpoladorLagrange(x_data).evaluar(x, e_k)
+
+
+def P(x: np.ndarray | float, x_data: np.ndarray | list, y_data: np.ndarray | list) -> np.ndarray:
+    """Polinomio interpolante de Lagrange evaluado en ``x`` (escalar o arreglo).
+    Para evaluar muchas veces sobre los mismos nodos conviene crear un
+    ``InterpoladorLagrange`` y reutilizarlo."""
+    return InterpoladorLagrange(x_data, y_data).evaluar(x)
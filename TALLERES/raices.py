@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Búsqueda de raíces por lotes: bisección, Newton, secante y un método híbrido
+tipo Brent, resolviendo muchos intervalos o puntos iniciales a la vez.
+
+Cada elemento (carril) tiene su propia máscara de convergencia y deja de
+iterar en cuanto converge; la función solo se evalúa en los carriles activos.
+Los carriles que no convergen se reportan en el resultado, sin lanzar
+excepciones.
+
+La función ``f`` debe aceptar arreglos y operar elemento a elemento. Si la
+ecuación depende de parámetros por carril, se pasan en ``args`` y ``f`` se
+llama como ``f(x, *args)`` con los parámetros de los carriles activos.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+
+EPS = np.finfo(float).eps
+
+
+# ####################################################################
+class ResultadoRaices:
+    """Resultado de una búsqueda de raíces por lotes.
+
+    ``raiz``: aproximación de cada carril (NaN si el intervalo no tenía cambio de signo).
+    ``convergio``: máscara booleana de los carriles que cumplieron la tolerancia.
+    ``iteraciones``: iteraciones realizadas por cada carril.
+    ``fx``: f evaluada en ``raiz``.
+    ``metodo``: nombre del método usado.
+    ``historial``: (opcional) lista con las aproximaciones de cada iteración.
+    """
+    def __init__(self, raiz, convergio, iteraciones, fx, metodo: str, historial=None):
+        self.raiz = raiz
+        self.convergio = convergio
+        self.iteraciones = iteraciones
+        self.fx = fx
+        self.metodo = metodo
+        self.historial = historial
+
+    @property
+    def no_convergidos(self) -> np.ndarray:
+        """Índices (sobre el arreglo aplanado) de los carriles que no convergieron."""
+        return np.flatnonzero(~self.convergio)
+
+    def __repr__(self):
+        return (
+            f"ResultadoRaices(metodo={self.metodo!r}, carriles={self.convergio.size}, "
+            f"no_convergidos={self.no_convergidos.size}, "
+            f"max_iteraciones={int(np.max(self.iteraciones, initial=0))})"
+        )
+
+
+def _preparar(valores: tuple, args: tuple) -> tuple[tuple, list[np.ndarray], tuple]:
+    """Lleva los valores iniciales y los parámetros a la forma común y los aplana."""
+    arreglos = [np.asarray(v, dtype=float) for v in valores]
+    parametros = [np.asarray(p) for p in args]
+    forma = np.broadcast_shapes(*(v.shape for v in arreglos + parametros))
+    planos = tuple(np.broadcast_to(v, forma).astype(float).ravel() for v in arreglos)
+    parametros = [np.broadcast_to(p, forma).ravel() for p in parametros]
+    return planos, parametros, forma
+
+
+def _evaluar(f: Callable, x: np.ndarray, parametros: list[np.ndarray], idx: np.ndarray) -> np.ndarray:
+    return np.asarray(f(x, *(p[idx] for p in parametros)), dtype=float)
+
+
+def _resultado(f, raiz, convergio, iteraciones, parametros, forma, metodo, historial=None) -> ResultadoRaices:
+    todos = np.arange(raiz.size)
+    fx = np.full(raiz.size, np.nan)
+    validos = np.isfinite(raiz)
+    if np.any(validos):
+        fx[validos] = _evaluar(f, raiz[validos], parametros, todos[validos])
+    fallidos = int(np.count_nonzero(~convergio))
+    if fallidos:
+        logging.warning(f"{metodo}: {fallidos} de {raiz.size} carriles no convergieron.")
+    return ResultadoRaices(
+        raiz.reshape(forma), convergio.reshape(forma), iteraciones.reshape(forma),
+        fx.reshape(forma), metodo, historial,
+    )
+
+
+# ####################################################################
+def biseccion(
+    f: Callable[..., np.ndarray],
+    a: np.ndarray | float,
+    b: np.ndarray | float,
+    tol: float = 1e-6,
+    max_iter: int = 1000,
+    args: tuple = (),
+) -> ResultadoRaices:
+    """Método de bisección sobre muchos intervalos [a, b] a la vez.
+
+    Un carril converge cuando |f(c)| < tol o (b - a)/2 < tol. Los intervalos
+    sin cambio de signo quedan como no convergidos con raíz NaN.
+
+    ## Parameters
+    ``f``: función vectorizada, ``f(x, *args)``.
+    ``a``, ``b``: extremos de los intervalos (escalares o arreglos).
+    ``tol``: tolerancia.
+    ``max_iter``: número máximo de iteraciones.
+    ``args``: parámetros por carril que se pasan a ``f``.
+
+    ## Return
+    ``ResultadoRaices``.
+    """
+    (a, b), parametros, forma = _preparar((a, b), args)
+    N = a.size
+    todos = np.arange(N)
+    fa = _evaluar(f, a, parametros, todos)
+    fb = _evaluar(f, b, parametros, todos)
+    raiz = np.full(N, np.nan)
+    convergio = np.zeros(N, dtype=bool)
+    iteraciones = np.zeros(N, dtype=int)
+
+    act = np.flatnonzero(fa * fb <= 0)
+    for i in range(1, max_iter + 1):
+        if act.size == 0:
+            break
+        aa, bb = a[act], b[act]
+        c = (aa + bb) / 2
+        fc = _evaluar(f, c, parametros, act)
+        raiz[act] = c
+        iteraciones[act] = i
+        hecho = (np.abs(fc) < tol) | ((bb - aa) / 2 < tol)
+        izquierda = fa[act] * fc < 0
+        b[act] = np.where(izquierda, c, bb)
+        a[act] = np.where(izquierda, aa, c)
+        fa[act] = np.where(izquierda, fa[act], fc)
+        convergio[act[hecho]] = True
+        act = act[~hecho]
+    raiz[act] = (a[act] + b[act]) / 2
+
+    return _resultado(f, raiz, convergio, iteraciones, parametros, forma, "biseccion")
+
+
+def newton(
+    f: Callable[..., np.ndarray],
+    df: Callable[..., np.ndarray],
+    p0: np.ndarray | float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    args: tuple = (),
+    tol_f: float | None = None,
+    historial: bool = False,
+) -> ResultadoRaices:
+    """Método de Newton desde muchos puntos iniciales a la vez.
+
+    Un carril converge cuando |p_{k+1} - p_k| < tol, o cuando |f(p_k)| < tol_f
+    si se da ``tol_f`` (criterio de ``newton_tabla``). Los carriles con
+    derivada nula o valores no finitos se detienen como no convergidos.
+
+    ## Parameters
+    ``f``, ``df``: función y derivada vectorizadas, ``f(x, *args)``.
+    ``p0``: puntos iniciales (escalar o arreglo).
+    ``tol``: tolerancia sobre el paso.
+    ``max_iter``: número máximo de iteraciones.
+    ``args``: parámetros por carril que se pasan a ``f`` y ``df``.
+    ``tol_f``: (opcional) tolerancia sobre |f(p)|.
+    ``historial``: si es True se guarda la aproximación de cada iteración.
+
+    ## Return
+    ``ResultadoRaices``.
+    """
+    (p,), parametros, forma = _preparar((p0,), args)
+    N = p.size
+    convergio = np.zeros(N, dtype=bool)
+    iteraciones = np.zeros(N, dtype=int)
+    pasos = [p.reshape(forma).copy()] if historial else None
+
+    act = np.arange(N)
+    for i in range(1, max_iter + 1):
+        if act.size == 0:
+            break
+        pa = p[act]
+        fp = _evaluar(f, pa, parametros, act)
+        d = _evaluar(df, pa, parametros, act)
+        valido = (d != 0) & np.isfinite(d) & np.isfinite(fp)
+        p_nuevo = pa - fp / np.where(valido, d, 1.0)
+        residuo = (np.abs(fp) < tol_f) if tol_f is not None else (fp == 0)
+        # un carril que ya está en la raíz converge aunque la derivada sea nula
+        hecho = residuo | (valido & (np.abs(p_nuevo - pa) < tol))
+        p[act] = np.where(valido & ~residuo, p_nuevo, pa)
+        iteraciones[act] = i
+        convergio[act[hecho]] = True
+        act = act[valido & ~hecho]
+        if historial:
+            pasos.append(p.reshape(forma).copy())
+
+    return _resultado(f, p, convergio, iteraciones, parametros, forma, "newton", pasos)
+
+
+def secante(
+    f: Callable[..., np.ndarray],
+    p0: np.ndarray | float,
+    p1: np.ndarray | float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    args: tuple = (),
+) -> ResultadoRaices:
+    """Método de la secante desde muchos pares iniciales a la vez.
+
+    Un carril converge cuando |p_{k+1} - p_k| < tol; si el denominador
+    f(p1) - f(p0) se anula el carril se detiene como no convergido.
+
+    ## Parameters
+    ``f``: función vectorizada, ``f(x, *args)``.
+    ``p0``, ``p1``: aproximaciones iniciales (escalares o arreglos).
+    ``tol``: tolerancia sobre el paso.
+    ``max_iter``: número máximo de iteraciones.
+    ``args``: parámetros por carril que se pasan a ``f``.
+
+    ## Return
+    ``ResultadoRaices``.
+    """
+    (p0, p1), parametros, forma = _preparar((p0, p1), args)
+    N = p0.size
+    todos = np.arange(N)
+    q0 = _evaluar(f, p0, parametros, todos)
+    q1 = _evaluar(f, p1, parametros, todos)
+    convergio = np.zeros(N, dtype=bool)
+    iteraciones = np.zeros(N, dtype=int)
+
+    act = todos
+    for i in range(1, max_iter + 1):
+        if act.size == 0:
+            break
+        x0, x1, y0, y1 = p0[act], p1[act], q0[act], q1[act]
+        den = y1 - y0
+        valido = (den != 0) & np.isfinite(den)
+        p = x1 - y1 * (x1 - x0) / np.where(valido, den, 1.0)
+        hecho = valido & (np.abs(p - x1) < tol)
+        iteraciones[act] = i
+        p0[act] = np.where(valido, x1, x0)
+        q0[act] = np.where(valido, y1, y0)
+        p1[act] = np.where(valido, p, x1)
+        convergio[act[hecho]] = True
+        sigue = valido & ~hecho
+        act = act[sigue]
+        q1[act] = _evaluar(f, p[sigue], parametros, act)
+
+    return _resultado(f, p1, convergio, iteraciones, parametros, forma, "secante")
+
+
+def brent(
+    f: Callable[..., np.ndarray],
+    a: np.ndarray | float,
+    b: np.ndarray | float,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    args: tuple = (),
+) -> ResultadoRaices:
+    """Método híbrido de Brent sobre muchos intervalos [a, b] a la vez.
+
+    Combina interpolación cuadrática inversa y secante con pasos de bisección
+    cuando la interpolación no reduce el intervalo lo suficiente, por lo que
+    converge siempre que haya cambio de signo y casi tan rápido como la
+    secante cerca de la raíz. Los intervalos sin cambio de signo quedan como
+    no convergidos con raíz NaN.
+
+    ## Parameters
+    ``f``: función vectorizada, ``f(x, *args)``.
+    ``a``, ``b``: extremos de los intervalos (escalares o arreglos).
+    ``tol``: tolerancia sobre el ancho del intervalo.
+    ``max_iter``: número máximo de iteraciones.
+    ``args``: parámetros por carril que se pasan a ``f``.
+
+    ## Return
+    ``ResultadoRaices``.
+    """
+    (a, b), parametros, forma = _preparar((a, b), args)
+    N = a.size
+    todos = np.arange(N)
+    fa = _evaluar(f, a, parametros, todos)
+    fb = _evaluar(f, b, parametros, todos)
+    convergio = np.zeros(N, dtype=bool)
+    iteraciones = np.zeros(N, dtype=int)
+    raiz = np.full(N, np.nan)
+
+    # c es el extremo que mantiene el cambio de signo con b; d y e son el
+    # último paso y el anterior.
+    c, fc = b.copy(), fb.copy()
+    d = b - a
+    e = d.copy()
+
+    act = np.flatnonzero(fa * fb <= 0)
+    for i in range(0, max_iter + 1):
+        if act.size == 0:
+            break
+        A, B, C = a[act], b[act], c[act]
+        FA, FB, FC = fa[act], fb[act], fc[act]
+        D, E = d[act], e[act]
+
+        # recuperar el cambio de signo entre b y c
+        mismo = np.sign(FB) == np.sign(FC)
+        C = np.where(mismo, A, C)
+        FC = np.where(mismo, FA, FC)
+        D = np.where(mismo, B - A, D)
+        E = np.where(mismo, B - A, E)
+        # b debe ser el mejor extremo
+        cambio = np.abs(FC) < np.abs(FB)
+        A, B, C = np.where(cambio, B, A), np.where(cambio, C, B), np.where(cambio, B, C)
+        FA, FB, FC = np.where(cambio, FB, FA), np.where(cambio, FC, FB), np.where(cambio, FB, FC)
+
+        tol1 = 2 * EPS * np.abs(B) + 0.5 * tol
+        xm = 0.5 * (C - B)
+        hecho = (np.abs(xm) <= tol1) | (FB == 0)
+        raiz[act] = B
+        iteraciones[act] = i
+
+        # interpolación (secante si a == c, cuadrática inversa si no)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = FB / FA
+            q_ = FA / FC
+            r = FB / FC
+            secante_ = A == C
+            p = np.where(secante_, 2 * xm * s, s * (2 * xm * q_ * (q_ - r) - (B - A) * (r - 1)))
+            q = np.where(secante_, 1 - s, (q_ - 1) * (r - 1) * (s - 1))
+        q = np.where(p > 0, -q, q)
+        p = np.abs(p)
+        interpolar = (np.abs(E) >= tol1) & (np.abs(FA) > np.abs(FB))
+        with np.errstate(invalid="ignore"):
+            aceptar = interpolar & (2 * p < np.minimum(3 * xm * q - np.abs(tol1 * q), np.abs(E * q)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            E = np.where(aceptar, D, xm)
+            D = np.where(aceptar, p / q, xm)
+
+        A, FA = B, FB
+        B = B + np.where(np.abs(D) > tol1, D, np.copysign(tol1, xm))
+
+        a[act], fa[act], c[act], fc[act], d[act], e[act] = A, FA, C, FC, D, E
+        convergio[act[hecho]] = True
+        sigue = ~hecho
+        act = act[sigue]
+        b[act] = B[sigue]
+        fb[act] = _evaluar(f, B[sigue], parametros, act)
+
+    return _resultado(f, raiz, convergio, iteraciones, parametros, forma, "brent")
+
+
+# ####################################################################
+# Localización de raíces en una rejilla
+# ####################################################################
+# Puntos por tramo al recorrer la rejilla; acota la memoria en rangos grandes.
+TAM_BLOQUE_REJILLA = 1 << 20
+RAZON_AUREA = (np.sqrt(5) - 1) / 2
+
+
+def _clasificar(X: np.ndarray, FX: np.ndarray, tramo: np.ndarray | None = None) -> tuple[np.ndarray, ...]:
+    """Clasifica los puntos ordenados ``X`` con valores ``FX``. Si se da
+    ``tramo`` (etiqueta de la sub-rejilla contigua de cada punto), solo se
+    comparan puntos vecinos del mismo tramo.
+
+    Retorna los extremos de las celdas con cambio de signo, los puntos donde f
+    es exactamente cero y los mínimos locales de |f| sin cambio de signo a los
+    lados (posibles raíces tangentes).
+    """
+    sigue = np.ones(max(X.size - 1, 0), dtype=bool) if tramo is None else tramo[:-1] == tramo[1:]
+    cambio = sigue & (FX[:-1] * FX[1:] < 0)
+    af = np.abs(FX)
+    centro = af[1:-1]
+    minimo = (
+        sigue[:-1] & sigue[1:]
+        & (centro < af[:-2]) & (centro <= af[2:])
+        & (FX[:-2] * FX[1:-1] > 0) & (FX[1:-1] * FX[2:] > 0)
+    )
+    return X[:-1][cambio], X[1:][cambio], X[FX == 0], X[1:-1][minimo]
+
+
+def _escanear_tramo(f, x_min: float, x_max: float, paso: float, inicio: int, fin: int) -> tuple[np.ndarray, ...]:
+    """Evalúa f en los puntos ``inicio..fin`` de la rejilla en una sola llamada."""
+    X = np.minimum(x_min + paso * np.arange(inicio, fin + 1), x_max)
+    FX = np.asarray(f(X), dtype=float)
+    return _clasificar(X, FX)
+
+
+def _subrejillas(celdas: np.ndarray, h: float, refinamiento: int, x_max: float) -> tuple[np.ndarray, np.ndarray]:
+    """Subdivide las celdas [c, c + h] en ``refinamiento`` partes. Las celdas
+    contiguas forman una sola sub-rejilla (``tramo``), de modo que un mínimo
+    de |f| en el borde entre dos celdas conserva sus vecinos a ambos lados.
+
+    ## Return
+    ``X``: puntos ordenados de todas las sub-rejillas.
+    ``tramo``: índice de la sub-rejilla de cada punto.
+    """
+    if celdas.size == 0:
+        return celdas, np.zeros(0, dtype=int)
+    h_fino = h / refinamiento
+    celdas = celdas[np.r_[True, np.diff(celdas) > 1e-9 * h]]
+    tramo_celda = np.cumsum(np.r_[True, np.diff(celdas) > h * (1 + 1e-9)]) - 1
+    ultima = np.r_[tramo_celda[1:] != tramo_celda[:-1], True]
+    X = np.concatenate([(celdas[:, None] + h_fino * np.arange(refinamiento)).ravel(), celdas[ultima] + h])
+    tramo = np.concatenate([np.repeat(tramo_celda, refinamiento), tramo_celda[ultima]])
+    orden = np.lexsort((X, tramo))
+    X, tramo = np.minimum(X[orden], x_max), tramo[orden]
+    distinto = np.r_[True, (np.diff(X) > 1e-9 * h_fino) | (np.diff(tramo) != 0)]
+    return X[distinto], tramo[distinto]
+
+
+def _unir(partes: list[tuple[np.ndarray, ...]]) -> tuple[np.ndarray, ...]:
+    """Une los resultados de varios tramos sin repetir los puntos compartidos."""
+    a, b, ceros, minimos = (np.concatenate(p) for p in zip(*partes))
+    a, idx = np.unique(a, return_index=True)
+    return a, b[idx], np.unique(ceros), np.unique(minimos)
+
+
+def _escanear(f, x_min, x_max, paso, tam_bloque, pool) -> tuple[np.ndarray, ...]:
+    """Recorre la rejilla uniforme por tramos que se solapan en dos puntos, de
+    modo que cada celda y cada terna de puntos consecutivos se clasifica."""
+    n = int(np.ceil((x_max - x_min) / paso - 1e-9)) + 1
+    tam_bloque = max(tam_bloque, 3)
+    tramos = []
+    inicio = 0
+    while True:
+        fin = min(inicio + tam_bloque - 1, n - 1)
+        tramos.append((inicio, fin))
+        if fin == n - 1:
+            break
+        inicio = fin - 1
+    if pool is None:
+        partes = [_escanear_tramo(f, x_min, x_max, paso, s, e) for s, e in tramos]
+    else:
+        partes = list(pool.map(
+            _escanear_tramo, *zip(*[(f, x_min, x_max, paso, s, e) for s, e in tramos])
+        ))
+    return _unir(partes)
+
+
+def _evaluar_puntos(f, x: np.ndarray, pool, procesos: int) -> np.ndarray:
+    if pool is None or x.size < 2 * procesos:
+        return np.asarray(f(x), dtype=float)
+    return np.concatenate(list(pool.map(f, np.array_split(x, procesos))))
+
+
+def _minimizar_abs(f, a: np.ndarray, b: np.ndarray, tol: float) -> tuple[np.ndarray, np.ndarray]:
+    """Búsqueda de la sección áurea de |f| en todos los intervalos [a, b] a la vez."""
+    c = b - RAZON_AUREA * (b - a)
+    d = a + RAZON_AUREA * (b - a)
+    fc, fd = np.abs(f(c)), np.abs(f(d))
+    while np.max(b - a, initial=0.0) > tol:
+        izquierda = fc < fd
+        a, b = np.where(izquierda, a, c), np.where(izquierda, d, b)
+        c, d = np.where(izquierda, b - RAZON_AUREA * (b - a), d), np.where(izquierda, c, a + RAZON_AUREA * (b - a))
+        nuevo = np.abs(f(np.where(izquierda, c, d)))
+        fc, fd = np.where(izquierda, nuevo, fd), np.where(izquierda, fc, nuevo)
+    x = (a + b) / 2
+    return x, np.abs(np.asarray(f(x), dtype=float))
+
+
+def _refinar(f, a: np.ndarray, b: np.ndarray, tol: float, max_iter: int) -> ResultadoRaices:
+    return brent(f, a, b, tol=tol, max_iter=max_iter)
+
+
+def localizar_raices(
+    f: Callable[[np.ndarray], np.ndarray],
+    x_min: float,
+    x_max: float,
+    paso: float = 0.1,
+    tol: float = 1e-8,
+    tol_tangente: float | None = 1e-6,
+    adaptativo: bool = False,
+    niveles: int = 2,
+    refinamiento: int = 10,
+    procesos: int | None = None,
+    tam_bloque: int = TAM_BLOQUE_REJILLA,
+    max_iter: int = 100,
+) -> ResultadoRaices:
+    """Encuentra las raíces de ``f`` en [x_min, x_max] con una rejilla de paso ``paso``.
+
+    1. Evalúa ``f`` sobre la rejilla en llamadas vectorizadas, por tramos de
+       ``tam_bloque`` puntos.
+    2. Detecta cambios de signo, ceros exactos y mínimos locales de |f| (raíces
+       tangentes, donde f no cambia de signo).
+    3. Refina todos los intervalos a la vez con ``brent`` y los mínimos con una
+       búsqueda de la sección áurea; un mínimo se acepta como raíz si
+       |f| <= ``tol_tangente``.
+
+    Con ``adaptativo=True`` la rejilla empieza con paso
+    ``paso * refinamiento**niveles`` y solo las celdas sospechosas (cambio de
+    signo o junto a un mínimo de |f|) se subdividen ``niveles`` veces hasta
+    llegar a ``paso``. Dos raíces dentro de una misma celda gruesa sin cambio
+    de signo ni mínimo visible en la rejilla gruesa no se detectan.
+
+    ## Parameters
+    ``f``: función vectorizada de una variable.
+    ``x_min``, ``x_max``: intervalo de búsqueda.
+    ``paso``: paso de la rejilla (el más fino si ``adaptativo``).
+    ``tol``: tolerancia del refinamiento.
+    ``tol_tangente``: umbral de |f| para aceptar raíces tangentes; None las ignora.
+    ``adaptativo``: refina la rejilla solo donde puede haber raíces.
+    ``niveles``, ``refinamiento``: número de subdivisiones y factor de cada una.
+    ``procesos``: (opcional) número de procesos para evaluar la rejilla y
+                  refinar; ``f`` debe poder serializarse (función de módulo).
+    ``tam_bloque``: puntos por tramo al recorrer la rejilla.
+    ``max_iter``: iteraciones máximas de ``brent``.
+
+    ## Return
+    ``ResultadoRaices`` con las raíces ordenadas. Los intervalos en los que
+    ``brent`` no convergió se reportan con ``convergio`` en False.
+    """
+    assert x_max > x_min and paso > 0, "Se necesita x_max > x_min y paso > 0."
+    pool = ProcessPoolExecutor(max_workers=procesos) if procesos else None
+    try:
+        if not adaptativo:
+            a, b, ceros, minimos = _escanear(f, x_min, x_max, paso, tam_bloque, pool)
+            h = paso
+        else:
+            h = paso * refinamiento ** niveles
+            a, b, ceros, minimos = _escanear(f, x_min, x_max, h, tam_bloque, pool)
+            todos_ceros = [ceros]
+            for _ in range(niveles):
+                celdas = np.unique(np.clip(np.concatenate([a, minimos - h, minimos]), x_min, x_max))
+                X, tramo = _subrejillas(celdas, h, refinamiento, x_max)
+                h /= refinamiento
+                FX = _evaluar_puntos(f, X, pool, procesos or 1)
+                a, b, ceros, minimos = _unir([_clasificar(X, FX, tramo)])
+                todos_ceros.append(ceros)
+                logging.debug(f"Rejilla adaptativa: {celdas.size} celdas con paso {h:.3e}.")
+            ceros = np.unique(np.concatenate(todos_ceros))
+
+        # --- refinamiento de todos los intervalos a la vez
+        if pool is None or a.size < 2 * procesos:
+            intervalos = [_refinar(f, a, b, tol, max_iter)]
+        else:
+            grupos = np.array_split(np.arange(a.size), procesos)
+            intervalos = list(pool.map(
+                _refinar, *zip(*[(f, a[g], b[g], tol, max_iter) for g in grupos])
+            ))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    raiz = [r.raiz for r in intervalos] + [ceros]
+    convergio = [r.convergio for r in intervalos] + [np.ones(ceros.size, dtype=bool)]
+    iteraciones = [r.iteraciones for r in intervalos] + [np.zeros(ceros.size, dtype=int)]
+    fx = [r.fx for r in intervalos] + [np.zeros(ceros.size)]
+
+    # --- raíces tangentes
+    if tol_tangente is not None and minimos.size:
+        x, fm = _minimizar_abs(
+            f, np.maximum(minimos - h, x_min), np.minimum(minimos + h, x_max), tol
+        )
+        tangente = fm <= tol_tangente
+        raiz.append(x[tangente])
+        convergio.append(np.ones(np.count_nonzero(tangente), dtype=bool))
+        iteraciones.append(np.zeros(np.count_nonzero(tangente), dtype=int))
+        fx.append(fm[tangente])
+
+    raiz = np.concatenate(raiz)
+    orden = np.argsort(raiz)
+    return ResultadoRaices(
+        raiz[orden], np.concatenate(convergio)[orden], np.concatenate(iteraciones)[orden],
+        np.concatenate(fx)[orden], "localizar_raices",
+    )
+
+
+def find_roots_bruteforce(
+    f: Callable[[np.ndarray], np.ndarray],
+    x_min: float,
+    x_max: float,
+    step: float = 0.1,
+    tol: float = 1e-8,
+) -> list[tuple[float, float]]:
+    """Intervalos [a, b] de la rejilla con cambio de signo, y (a, a) donde
+    f(a) = 0, como en la Tarea05, pero evaluando ``f`` de forma vectorizada.
+    Para obtener las raíces refinadas usar ``localizar_raices``."""
+    a, b, ceros, _ = _escanear(f, x_min, x_max, step, TAM_BLOQUE_REJILLA, None)
+    intervalos = [(float(x), float(y)) for x, y in zip(a, b)] + [(float(c), float(c)) for c in ceros]
+    return sorted(intervalos)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Splines cúbicos (frontera natural y condicionada) vectorizados.
+
+Los coeficientes se guardan en un arreglo compacto ``coef`` de tamaño (n, 4)
+con las columnas ``a, b, c, d`` de cada tramo
+``S_j(x) = a_j + b_j (x - x_j) + c_j (x - x_j)² + d_j (x - x_j)³``.
+Se pueden construir a la vez varias series de ``ys`` con los mismos nodos:
+``coef`` es entonces de tamaño (m, n, 4).
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# El algoritmo de Thomas está en el taller de eliminación gaussiana, cuyos
+# módulos no forman un paquete: se agrega su carpeta al path.
+_DIR_GAUSS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "taller1b-gauss-FA")
+if _DIR_GAUSS not in sys.path:
+    sys.path.append(_DIR_GAUSS)
+
+from matrices_dispersas import thomas
+
+
+# ####################################################################
+def _coeficientes(xs, ys, frontera: str, B0=None, Bn=None) -> np.ndarray:
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    una_serie = ys.ndim == 1
+    Y = ys.reshape(-1, ys.shape[-1]).T  # (n+1, m): cada columna es una serie
+    n = len(xs) - 1
+    assert n >= 1, "Se necesitan al menos dos nodos."
+    assert Y.shape[0] == n + 1, "xs y ys deben tener la misma longitud."
+    h = np.diff(xs)
+    assert np.all(h > 0), "xs debe ser estrictamente creciente."
+
+    # --- lado derecho α (todas las series a la vez)
+    pendiente = np.diff(Y, axis=0) / h[:, None]  # (n, m)
+    alpha = np.zeros((n + 1, Y.shape[1]))
+    alpha[1:n] = 3 * (pendiente[1:] - pendiente[:-1])
+    if frontera == "condicionada":
+        alpha[0] = 3 * (pendiente[0] - np.asarray(B0, dtype=float))
+        alpha[n] = 3 * (np.asarray(Bn, dtype=float) - pendiente[-1])
+
+    # --- sistema tridiagonal para c en O(n), una sola eliminación para todas las series
+    diagonal = np.empty(n + 1)
+    diagonal[1:n] = 2 * (h[:-1] + h[1:])
+    inferior, superior = h.copy(), h.copy()
+    if frontera == "natural":
+        diagonal[0] = diagonal[n] = 1.0
+        inferior[-1] = superior[0] = 0.0
+    else:
+        diagonal[0], diagonal[n] = 2 * h[0], 2 * h[-1]
+    c = thomas(inferior, diagonal, superior, alpha)
+
+    # --- a, b, d
+    coef = np.empty((Y.shape[1], n, 4))
+    coef[..., 0] = Y[:-1].T
+    coef[..., 1] = (pendiente - h[:, None] * (c[1:] + 2 * c[:-1]) / 3).T
+    coef[..., 2] = c[:-1].T
+    coef[..., 3] = ((c[1:] - c[:-1]) / (3 * h[:, None])).T
+    if una_serie:
+        return coef[0]
+    return coef.reshape(ys.shape[:-1] + (n, 4))
+
+
+def cubic_spline_natural(xs: np.ndarray | list, ys: np.ndarray | list) -> np.ndarray:
+    """Spline cúbico con frontera natural (S''(x₀) = S''(xₙ) = 0).
+
+    ## Parameters
+    ``xs``: nodos estrictamente crecientes, n+1 valores.
+    ``ys``: valores en los nodos, de tamaño (n+1,) o (m, n+1) para m series.
+
+    ## Return
+    ``coef``: arreglo (n, 4) o (m, n, 4) con las columnas a, b, c, d.
+    """
+    return _coeficientes(xs, ys, "natural")
+
+
+def cubic_spline_clamped(
+    xs: np.ndarray | list,
+    ys: np.ndarray | list,
+    B0: float | np.ndarray,
+    Bn: float | np.ndarray,
+) -> np.ndarray:
+    """Spline cúbico con frontera condicionada (S'(x₀) = B0, S'(xₙ) = Bn).
+
+    ## Parameters
+    ``xs``: nodos estrictamente crecientes, n+1 valores.
+    ``ys``: valores en los nodos, de tamaño (n+1,) o (m, n+1) para m series.
+    ``B0``, ``Bn``: derivadas en los extremos; escalares o de tamaño (m,).
+
+    ## Return
+    ``coef``: arreglo (n, 4) o (m, n, 4) con las columnas a, b, c, d.
+    """
+    return _coeficientes(xs, ys, "condicionada", B0, Bn)
+
+
+# ####################################################################
+def evaluate_spline(
+    xs: np.ndarray | list,
+    coef: np.ndarray,
+    x_eval: np.ndarray | list | float,
+    derivada: int = 0,
+) -> np.ndarray:
+    """Evalúa el spline (o su primera o segunda derivada) en ``x_eval``.
+    El tramo de cada punto se busca con ``np.searchsorted`` y el polinomio se
+    evalúa con Horner para todos los puntos a la vez, en O(N log n). Fuera de
+    [x₀, xₙ] se extrapola con el primer o el último tramo.
+
+    ## Parameters
+    ``xs``: nodos usados para construir el spline.
+    ``coef``: coeficientes (n, 4) o (m, n, 4).
+    ``x_eval``: puntos donde evaluar (escalar o arreglo de cualquier forma).
+    ``derivada``: 0, 1 o 2.
+
+    ## Return
+    ``y``: arreglo con la forma de ``x_eval``, precedida por (m,) si hay varias series.
+    """
+    assert derivada in (0, 1, 2), "derivada debe ser 0, 1 o 2."
+    xs = np.asarray(xs, dtype=float)
+    x = np.asarray(x_eval, dtype=float)
+    n = coef.shape[-2]
+    j = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, n - 1)
+    dx = x - xs[j]
+    a, b, c, d = np.moveaxis(coef[..., j, :], -1, 0)
+    if derivada == 0:
+        return a + dx * (b + dx * (c + dx * d))
+    if derivada == 1:
+        return b + dx * (2 * c + dx * 3 * d)
+    return 2 * c + 6 * d * dx
+
+
+class SplineCubico:
+    """Spline cúbico listo para evaluar: ``s = SplineCubico(xs, ys)`` y ``s(x)``.
+
+    ## Parameters
+    ``xs``: nodos estrictamente crecientes.
+    ``ys``: valores en los nodos, (n+1,) o (m, n+1) para m series.
+    ``frontera``: "natural" o "condicionada".
+    ``B0``, ``Bn``: derivadas en los extremos para la frontera condicionada.
+    """
+    def __init__(self, xs, ys, frontera: str = "natural", B0=None, Bn=None):
+        assert frontera in ("natural", "condicionada"), "frontera debe ser 'natural' o 'condicionada'."
+        if frontera == "condicionada":
+            assert B0 is not None and Bn is not None, "La frontera condicionada requiere B0 y Bn."
+        self.xs = np.asarray(xs, dtype=float)
+        self.frontera = frontera
+        self.coef = _coeficientes(self.xs, ys, frontera, B0, Bn)
+
+    def __call__(self, x, derivada: int = 0) -> np.ndarray:
+        return evaluate_spline(self.xs, self.coef, x, derivada)
+
+    def __repr__(self):
+        return f"SplineCubico(tramos={self.coef.shape[-2]}, series={self.coef.shape[:-2]}, frontera={self.frontera!r})"
@@ -1 +1,12 @@
-from .min_cuadrados import ajustar_min_cuadrados
+from .min_cuadrados import (
+    ajustar_min_cuadrados,
+    ajustar_min_cuadrados_base,
+    matriz_diseno,
+    resolver_ecuaciones_normales,
+)
+from .ajuste_incremental import (
+    AjusteIncremental,
+    ajustar_min_cuadrados_incremental,
+    bloques_de_archivo,
+    bloques_de_arreglo,
+)
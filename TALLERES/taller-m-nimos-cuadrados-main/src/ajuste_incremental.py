@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+Python 3
+Ajuste por mínimos cuadrados incremental: las ecuaciones normales se acumulan
+por bloques de datos, sin mantener todo el conjunto en memoria.
+"""
+
+
+import logging
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from .min_cuadrados import resolver_ecuaciones_normales
+
+
+# ####################################################################
+def bloques_de_arreglo(datos: np.ndarray, tam_bloque: int = 100_000) -> Iterator[tuple]:
+    """Recorre un arreglo de tamaño (n, 2) (p. ej. un ``np.memmap`` o un ``.npy``
+    abierto con ``mmap_mode='r'``) por bloques de filas ``(xs, ys)``, sin copiarlo."""
+    assert datos.ndim == 2 and datos.shape[1] == 2, "datos debe ser de tamaño (n, 2)."
+    for ini in range(0, datos.shape[0], tam_bloque):
+        bloque = datos[ini:ini + tam_bloque]
+        yield bloque[:, 0], bloque[:, 1]
+
+
+def bloques_de_archivo(
+    ruta: str, tam_bloque: int = 100_000, delimitador: str | None = ",", saltar: int = 0
+) -> Iterator[tuple]:
+    """Lee un archivo de texto con dos columnas ``x, y`` por bloques de líneas.
+    Los archivos ``.npy`` se abren como memoria mapeada."""
+    if ruta.endswith(".npy"):
+        yield from bloques_de_arreglo(np.load(ruta, mmap_mode="r"), tam_bloque)
+        return
+
+    with open(ruta, encoding="utf-8") as f:
+        for _ in range(saltar):
+            next(f, None)
+        while True:
+            lineas = list(islice(f, tam_bloque))
+            if not lineas:
+                break
+            bloque = np.loadtxt(lineas, delimiter=delimitador, ndmin=2)
+            yield bloque[:, 0], bloque[:, 1]
+
+
+# ####################################################################
+class AjusteIncremental:
+    """Acumula las ecuaciones normales ``A p = b`` del ajuste por bloques.
+
+    Se puede definir el modelo de dos formas:
+
+    ``gradiente``: la misma lista de derivadas parciales que usa
+    ``ajustar_min_cuadrados``; cada una retorna la fila de la matriz aumentada
+    para los datos dados. Como esas filas son sumas sobre los datos, la
+    contribución de cada bloque se suma a lo acumulado.
+
+    ``base``: lista de funciones ``phi_k(xs) -> array`` del modelo lineal
+    ``y = sum(p_k * phi_k(x))``. Cada bloque se evalúa una sola vez y se
+    acumulan ``Φᵀ Φ`` y ``Φᵀ y``.
+
+    ``olvido``: factor ``0 < λ <= 1``. Antes de agregar un bloque lo acumulado se
+    multiplica por ``λ``, de modo que los bloques antiguos pierden peso
+    (ventana deslizante exponencial). Con ``λ = 1`` el ajuste es exacto.
+    ``n`` cuenta todos los datos agregados y ``n_efectivo`` los ponderados por
+    el olvido.
+    """
+    def __init__(
+        self,
+        gradiente: list[Callable] | None = None,
+        base: list[Callable[[np.ndarray], np.ndarray]] | None = None,
+        olvido: float = 1.0,
+    ):
+        assert (gradiente is None) != (base is None), "Se debe dar gradiente o base (solo uno)."
+        assert 0 < olvido <= 1, "olvido debe estar en (0, 1]."
+        funciones = gradiente if gradiente is not None else base
+        for fcn in funciones:
+            assert callable(fcn), "Cada elemento debe ser una función."
+
+        self.gradiente = gradiente
+        self.base = base
+        self.olvido = olvido
+        self.num_pars = len(funciones)
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Descarta todo lo acumulado."""
+        self.Ab = np.zeros((self.num_pars, self.num_pars + 1), dtype=float)
+        self.n = 0
+        self._peso = 0.0
+
+    def actualizar(self, xs, ys) -> "AjusteIncremental":
+        """Agrega un bloque de datos."""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        assert len(xs) == len(ys), "xs y ys deben tener la misma longitud."
+
+        if self.gradiente is not None:
+            bloque = np.array([der_parcial(xs, ys) for der_parcial in self.gradiente], dtype=float)
+        else:
+            Phi = np.column_stack([np.broadcast_to(phi(xs), xs.shape) for phi in self.base])
+            bloque = np.empty_like(self.Ab)
+            bloque[:, :-1] = Phi.T @ Phi
+            bloque[:, -1] = Phi.T @ ys
+
+        if self.olvido < 1:
+            self.Ab *= self.olvido
+            self._peso *= self.olvido
+        self.Ab += bloque
+        self.n += len(xs)
+        self._peso += len(xs)
+        return self
+
+    @property
+    def n_efectivo(self) -> float:
+        """Número efectivo de datos en las ecuaciones acumuladas: la suma de
+        λ^k por cada dato, con k los bloques agregados después del suyo. Con
+        ``λ = 1`` coincide con ``n``; con datos continuos tiende a
+        ``tam_bloque / (1 - λ)``. Sirve, p. ej., para escalar ``Ab`` a promedios."""
+        return self._peso
+
+    def consumir(self, fuente: Iterable[tuple]) -> "AjusteIncremental":
+        """Agrega todos los bloques ``(xs, ys)`` de un iterable, p. ej. un
+        generador, ``bloques_de_archivo`` o ``bloques_de_arreglo``."""
+        for xs, ys in fuente:
+            self.actualizar(xs, ys)
+        return self
+
+    def parametros(self, metodo: str = "cholesky") -> np.ndarray:
+        """Resuelve las ecuaciones normales acumuladas hasta el momento, por
+        defecto con ``factorizar_cholesky`` (con ``base`` la matriz ΦᵀΦ es
+        simétrica definida positiva), ver ``resolver_ecuaciones_normales``."""
+        if self.n == 0:
+            raise ValueError("No se han agregado datos.")
+        return resolver_ecuaciones_normales(self.Ab[:, :-1], self.Ab[:, -1], metodo)
+
+
+# ####################################################################
+def ajustar_min_cuadrados_incremental(
+    fuente: Iterable[tuple] | np.ndarray | str,
+    gradiente: list[Callable] | None = None,
+    base: list[Callable[[np.ndarray], np.ndarray]] | None = None,
+    tam_bloque: int = 100_000,
+    olvido: float = 1.0,
+) -> np.ndarray:
+    """Ajuste por mínimos cuadrados sobre datos que no caben en memoria.
+
+    ## Parameters
+
+    ``fuente``: iterable de bloques ``(xs, ys)``, arreglo (n, 2) (puede ser un
+    ``np.memmap``) o ruta a un archivo de texto de dos columnas o ``.npy``.
+
+    ``gradiente``/``base``: definición del modelo, ver ``AjusteIncremental``.
+
+    ``tam_bloque``: filas por bloque cuando ``fuente`` es un arreglo o archivo.
+
+    ``olvido``: factor de olvido exponencial por bloque.
+
+    ## Return
+
+    ``solucion``: vector con los parámetros ajustados.
+    """
+    if isinstance(fuente, str):
+        fuente = bloques_de_archivo(fuente, tam_bloque)
+    elif isinstance(fuente, np.ndarray):
+        fuente = bloques_de_arreglo(fuente, tam_bloque)
+
+    ajuste = AjusteIncremental(gradiente, base, olvido).consumir(fuente)
+    logging.info(f"Se ajustaron {ajuste.num_pars} parámetros con {ajuste.n} datos.")
+    return ajuste.parametros()
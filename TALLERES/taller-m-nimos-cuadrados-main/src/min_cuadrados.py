@@ -13,6 +13,7 @@ Python 3
 
 # ----------------------------- logging --------------------------
 import logging
+import sys
 from sys import stdout
 from datetime import datetime
 import os
@@ -29,11 +30,75 @@ logging.basicConfig(
 logging.info(f"{os.getlogin()}| {datetime.now()}")
 
 
+# ####################################################################
+# Las factorizaciones simétricas por bloques están en el taller de eliminación
+# gaussiana, cuyos módulos no forman un paquete: se agrega su carpeta al path.
+_DIR_GAUSS = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "taller1b-gauss-FA")
+)
+if _DIR_GAUSS not in sys.path:
+    sys.path.append(_DIR_GAUSS)
+
+from linear_sist_methods import factorizar_LDLt, factorizar_cholesky
+
+
+# ####################################################################
+def resolver_ecuaciones_normales(
+    A: np.ndarray, b: np.ndarray, metodo: str = "cholesky"
+) -> np.ndarray:
+    """Resuelve el sistema de ecuaciones normales ``A p = b``.
+
+    ## Parameters
+
+    ``A``: matriz de tamaño (p, p).
+
+    ``b``: vector de tamaño (p,).
+
+    ``metodo``: "cholesky" (``factorizar_cholesky``, A = G Gᵀ), "LDLt"
+    (``factorizar_LDLt``, A = L D Lᵀ sin raíces) o "LU" (``np.linalg.solve``).
+    Cholesky y LDLᵀ hacen la mitad de operaciones que LU y solo leen el
+    triángulo inferior, por lo que requieren ``A`` simétrica; si no lo es (p. ej.
+    ecuaciones en otro orden que los parámetros) se usa LU. Si Cholesky falla
+    (``A`` no definida positiva, p. ej. datos insuficientes para el número de
+    parámetros) se intenta LDLᵀ y luego LU.
+
+    ## Return
+
+    ``solucion``: vector de tamaño (p,).
+
+    """
+    assert metodo in ("cholesky", "LDLt", "LU"), "metodo debe ser 'cholesky', 'LDLt' o 'LU'."
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if metodo != "LU" and not np.allclose(A, A.T):
+        logging.debug("La matriz no es simétrica; se usa LU.")
+        metodo = "LU"
+
+    if metodo == "cholesky":
+        try:
+            return factorizar_cholesky(A).resolver(b)
+        except ValueError:
+            logging.warning("La matriz no es definida positiva; se intenta LDLᵀ.")
+            metodo = "LDLt"
+
+    if metodo == "LDLt":
+        try:
+            x = factorizar_LDLt(A).resolver(b)
+            if np.all(np.isfinite(x)):
+                return x
+        except ValueError:
+            pass
+        logging.warning("No se pudo factorizar con LDLᵀ; se usa LU.")
+
+    return np.linalg.solve(A, b)
+
+
 # ####################################################################
 def ajustar_min_cuadrados(
     xs: list,
     ys: list,
     gradiente: list[Callable[[list[float], list[float]], tuple]],
+    metodo: str = "cholesky",
 ) -> np.ndarray:
     """Resuelve el sistema de ecuaciones para encontrar los parámetros del método de mínimos cuadrados. Plantea el sistema de ecuaciones lineales al reemplazar los valores de ``xs`` y ``ys`` en las derivadas parciales.
 
@@ -46,6 +111,10 @@ def ajustar_min_cuadrados(
     ``gradiente``: lista con las funciones de derivadas parciales de ``fcn``.
     [IMPORTANTE] Cada función debe ser de la forma ``der_parcial(xi, yi)->``.
 
+    ``metodo``: cómo se resuelve el sistema, ver ``resolver_ecuaciones_normales``.
+    Por defecto Cholesky, que se aplica cuando la fila k es la derivada respecto
+    al parámetro k (sistema simétrico); con las filas en otro orden se usa LU.
+
     ## Return
 
     ``solucion``: vector con la solución del sistema de ecuaciones lineales.
@@ -66,7 +135,88 @@ def ajustar_min_cuadrados(
 
         Ab[i, :] = der_parcial(xs, ys)
 
-    # Solve the linear system using NumPy
     A = Ab[:, :-1]
     b = Ab[:, -1]
-    return np.linalg.solve(A, b)
+    return resolver_ecuaciones_normales(A, b, metodo)
+
+
+# ####################################################################
+def matriz_diseno(
+    xs: np.ndarray | list,
+    base: list[Callable[[np.ndarray], np.ndarray]],
+) -> np.ndarray:
+    """Construye la matriz de diseño evaluando cada función de la base sobre
+    todos los ``xs`` a la vez.
+
+    ## Parameters
+
+    ``xs``: valores de x, de tamaño (n,) o (m, n) para m conjuntos de datos.
+
+    ``base``: lista de funciones ``phi_k(xs) -> array`` del modelo
+    ``y = sum(p_k * phi_k(x))``. Pueden retornar un escalar (p. ej. la constante).
+
+    ## Return
+
+    ``Phi``: matriz de tamaño (n, p) o (m, n, p).
+
+    """
+    xs = np.asarray(xs, dtype=float)
+    return np.stack([np.broadcast_to(phi(xs), xs.shape) for phi in base], axis=-1)
+
+
+def ajustar_min_cuadrados_base(
+    xs: np.ndarray | list,
+    ys: np.ndarray | list,
+    base: list[Callable[[np.ndarray], np.ndarray]],
+    pesos: np.ndarray | list | None = None,
+) -> np.ndarray:
+    """Ajusta un modelo lineal en los parámetros por mínimos cuadrados mediante
+    la factorización QR de la matriz de diseño. A diferencia de las ecuaciones
+    normales, no se eleva al cuadrado el número de condición.
+
+    Se pueden ajustar varios conjuntos de datos con la misma base en una sola
+    llamada: si comparten ``xs`` (y ``pesos``) se factoriza una sola vez.
+
+    ## Parameters
+
+    ``xs``: valores de x, de tamaño (n,) o (m, n).
+
+    ``ys``: valores de y, de tamaño (n,) o (m, n); cada fila es un conjunto de datos.
+
+    ``base``: lista de funciones de la base, ver ``matriz_diseno``.
+
+    ``pesos``: (opcional) pesos no negativos de cada dato, de tamaño (n,) o (m, n).
+
+    ## Return
+
+    ``solucion``: parámetros de tamaño (p,) o (m, p).
+
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    assert xs.shape[-1] == ys.shape[-1], "xs y ys deben tener la misma longitud."
+    for phi in base:
+        assert callable(phi), "Cada función de la base debe ser callable."
+
+    num_pars = len(base)
+    logging.info(f"Se ajustarán {num_pars} parámetros.")
+
+    Phi = matriz_diseno(xs, base)
+    if pesos is not None:
+        raiz = np.sqrt(np.asarray(pesos, dtype=float))
+        assert raiz.shape[-1] == ys.shape[-1], "pesos y ys deben tener la misma longitud."
+        Phi = Phi * raiz[..., None]
+        ys = ys * raiz
+
+    if Phi.ndim == 2:
+        # una sola factorización para todos los conjuntos de datos
+        Q, R = np.linalg.qr(Phi)
+        c = ys @ Q  # (p,) o (m, p)
+        return np.linalg.solve(R, c.T).T
+
+    # conjuntos con distintos xs o pesos: QR por lotes
+    Phi = np.broadcast_to(Phi, ys.shape + (num_pars,))
+    ys = np.broadcast_to(ys, Phi.shape[:-1])
+    Q, R = np.linalg.qr(Phi)
+    c = np.einsum("...np,...n->...p", Q, ys)
+    return np.linalg.solve(R, c[..., None])[..., 0]
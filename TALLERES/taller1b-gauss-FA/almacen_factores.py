@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Almacenamiento en disco de factorizaciones para reutilizarlas entre procesos.
+Los factores se guardan en un formato binario compacto (encabezado, vector de
+permutación y L/U empaquetadas en un solo arreglo) y se cargan como memoria
+mapeada de solo lectura, sin copiar.
+"""
+
+import logging
+import os
+import struct
+import tempfile
+from typing import Callable
+
+import numpy as np
+
+from cache_factores import clave_matriz
+from linear_sist_methods import (
+    FactorCholesky,
+    FactorLDLt,
+    FactorLU,
+    factorizar_LU,
+)
+
+
+MAGICO = b"MNFACTOR"
+VERSION = 1
+TAM_ENCABEZADO = 4096  # los datos quedan alineados a página
+# mágico, versión, tipo, dtype, n, intercambios, offset piv, offset datos, digest
+FORMATO_ENCABEZADO = "<8sII2sxxQQQQ16s"
+TIPOS = {FactorLU: 0, FactorCholesky: 1, FactorLDLt: 2}
+CLASES = {v: k for k, v in TIPOS.items()}
+
+
+def _alinear(offset: int) -> int:
+    return -(-offset // TAM_ENCABEZADO) * TAM_ENCABEZADO
+
+
+# ####################################################################
+def empaquetar_LU(L: np.ndarray, U: np.ndarray) -> FactorLU:
+    """Empaqueta los factores de ``descomposicion_LU`` (sin pivoteo) en un
+    FactorLU compacto: L estrictamente inferior y U en el mismo arreglo."""
+    L = np.asarray(L, dtype=float)
+    U = np.asarray(U, dtype=float)
+    assert L.shape == U.shape, "L y U deben tener el mismo tamaño."
+    return FactorLU(np.tril(L, -1) + np.triu(U), np.arange(L.shape[0]))
+
+
+def guardar_factor(
+    factor: FactorLU | FactorCholesky | FactorLDLt | tuple[np.ndarray, np.ndarray],
+    ruta: str,
+    digest: bytes = b"",
+) -> None:
+    """Guarda una factorización en ``ruta``.
+
+    El archivo se escribe primero con un nombre temporal y luego se renombra,
+    de modo que otros procesos nunca ven un archivo incompleto.
+
+    ## Parameters
+    ``factor``: FactorLU, FactorCholesky, FactorLDLt o la tupla ``(L, U)`` de
+                ``descomposicion_LU``.
+    ``ruta``: archivo de destino.
+    ``digest``: (opcional) hasta 16 bytes para identificar la matriz original.
+    """
+    if isinstance(factor, tuple):
+        factor = empaquetar_LU(*factor)
+    datos = factor.LU if isinstance(factor, FactorLU) else factor.datos
+    datos = np.ascontiguousarray(datos)
+    assert datos.dtype in (np.float64, np.float32), "Los factores deben ser float64 o float32."
+    n = datos.shape[0]
+    piv = np.ascontiguousarray(
+        factor.piv if isinstance(factor, FactorLU) else np.arange(n), dtype="<i8"
+    )
+    intercambios = factor.intercambios if isinstance(factor, FactorLU) else 0
+
+    offset_piv = TAM_ENCABEZADO
+    offset_datos = _alinear(offset_piv + piv.nbytes)
+    encabezado = struct.pack(
+        FORMATO_ENCABEZADO, MAGICO, VERSION, TIPOS[type(factor)],
+        datos.dtype.newbyteorder("<").str[1:].encode(), n, intercambios,
+        offset_piv, offset_datos, digest[:16],
+    )
+
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    fd, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encabezado.ljust(TAM_ENCABEZADO, b"\0"))
+            f.write(piv.tobytes())
+            f.seek(offset_datos)
+            datos.astype(datos.dtype.newbyteorder("<"), copy=False).tofile(f)
+        os.replace(temporal, ruta)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+def leer_encabezado(ruta: str) -> dict:
+    """Lee y valida el encabezado de un archivo de factores."""
+    with open(ruta, "rb") as f:
+        crudo = f.read(struct.calcsize(FORMATO_ENCABEZADO))
+    if len(crudo) < struct.calcsize(FORMATO_ENCABEZADO):
+        raise ValueError(f"{ruta}: archivo de factores incompleto.")
+    magico, version, tipo, dtype, n, intercambios, offset_piv, offset_datos, digest = \
+        struct.unpack(FORMATO_ENCABEZADO, crudo)
+    if magico != MAGICO:
+        raise ValueError(f"{ruta}: no es un archivo de factores.")
+    if version != VERSION:
+        raise ValueError(f"{ruta}: versión {version} no soportada.")
+    return {
+        "tipo": CLASES[tipo],
+        "dtype": np.dtype("<" + dtype.decode()),
+        "n": n,
+        "intercambios": intercambios,
+        "offset_piv": offset_piv,
+        "offset_datos": offset_datos,
+        "digest": digest,
+    }
+
+
+def cargar_factor(ruta: str) -> FactorLU | FactorCholesky | FactorLDLt:
+    """Carga una factorización guardada con ``guardar_factor`` como memoria
+    mapeada de solo lectura: no se copia nada y el sistema operativo comparte
+    las páginas entre todos los procesos que abren el mismo archivo.
+    Se puede resolver con ``factor.resolver(b)`` o ``resolver_LU(factor, None, b)``.
+    """
+    info = leer_encabezado(ruta)
+    n = info["n"]
+    piv = np.memmap(ruta, dtype="<i8", mode="r", offset=info["offset_piv"], shape=(n,))
+    datos = np.memmap(ruta, dtype=info["dtype"], mode="r", offset=info["offset_datos"], shape=(n, n))
+    clase = info["tipo"]
+    if clase is FactorLU:
+        return FactorLU(datos, piv, info["intercambios"])
+    return clase(datos)
+
+
+# ####################################################################
+class AlmacenFactores:
+    """Directorio de factorizaciones indexadas por el contenido de la matriz.
+    Un proceso que encuentra los factores de ``A`` en el directorio los carga
+    mapeados en memoria en lugar de volver a factorizar.
+
+    ## Parameters
+    ``directorio``: carpeta donde se guardan los archivos ``<digest>.fac``.
+    ``factorizar``: función que factoriza una matriz; por defecto
+                    ``factorizar_LU``. También ``factorizar_cholesky``,
+                    ``factorizar_LDLt`` o ``descomposicion_LU``. Se debe usar
+                    un directorio distinto para cada función.
+    """
+    def __init__(
+        self,
+        directorio: str,
+        factorizar: Callable[[np.ndarray], object] = factorizar_LU,
+    ):
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self.factorizar = factorizar
+
+    def ruta(self, A: np.ndarray) -> str:
+        _, _, digest = clave_matriz(np.asarray(A, dtype=float))
+        return os.path.join(self.directorio, f"{digest}.fac")
+
+    def __contains__(self, A) -> bool:
+        return os.path.exists(self.ruta(A))
+
+    def obtener(self, A: np.ndarray | list[list[float | int]]):
+        """Retorna los factores de ``A`` mapeados desde disco; si no existen, se
+        factoriza y se guardan primero."""
+        A = np.asarray(A, dtype=float)
+        ruta = self.ruta(A)
+        if not os.path.exists(ruta):
+            logging.info(f"Factorizando matriz {A.shape} y guardando en {ruta}.")
+            digest = bytes.fromhex(os.path.basename(ruta)[:-4])
+            guardar_factor(self.factorizar(A), ruta, digest)
+        factor = cargar_factor(ruta)
+        assert factor.n == A.shape[0], f"{ruta}: el tamaño no coincide con la matriz."
+        return factor
+
+    def resolver(self, A: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Resuelve Ax = b con los factores guardados (o recién calculados)."""
+        return self.obtener(A).resolver(b)
+
+    def invalidar(self, A: np.ndarray | None = None) -> None:
+        """Borra los factores de ``A``, o todos los del directorio si ``A`` es None."""
+        if A is not None:
+            rutas = [self.ruta(A)]
+        else:
+            rutas = [
+                os.path.join(self.directorio, f)
+                for f in os.listdir(self.directorio) if f.endswith(".fac")
+            ]
+        for ruta in rutas:
+            if os.path.exists(ruta):
+                os.remove(ruta)
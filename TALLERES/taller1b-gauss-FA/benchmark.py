@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Banco de pruebas de los métodos directos: tiempo, memoria pico y conteo de
+operaciones medido vs teórico, con resultados en CSV/JSON comparables entre
+ejecuciones.
+
+Uso:
+    python benchmark.py --n 10 50 100 200 --salida resultados.json
+    python benchmark.py --comparar base.json resultados.json
+"""
+
+import argparse
+import csv
+import json
+import logging
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+
+from linear_sist_methods import (
+    ContadorOperaciones,
+    complejidad_teorica_LU,
+    complejidad_teorica_gauss,
+    complejidad_teorica_gauss_jordan,
+    descomposicion_LU,
+    eliminacion_gaussiana,
+    factorizar_LU,
+    gauss_jordan,
+    matriz_aumentada,
+    resolver_LU,
+)
+
+
+CAMPOS = [
+    "metodo",
+    "familia",
+    "n",
+    "tiempo_s",
+    "memoria_pico_bytes",
+    "mult_div",
+    "sumas_restas",
+    "intercambios",
+    "teorico_mult_div",
+    "teorico_sumas_restas",
+    "residuo",
+    "error",
+]
+
+
+# ####################################################################
+def matriz_aleatoria(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Matriz con entradas uniformes en [-1, 1]."""
+    return rng.uniform(-1, 1, (n, n))
+
+
+def matriz_diagonal_dominante(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Matriz aleatoria con diagonal estrictamente dominante (bien condicionada)."""
+    A = rng.uniform(-1, 1, (n, n))
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1
+    return A
+
+
+def matriz_hilbert(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Matriz de Hilbert, mal condicionada incluso para n pequeño."""
+    i = np.arange(n)
+    return 1.0 / (i[:, None] + i[None, :] + 1)
+
+
+FAMILIAS: dict[str, Callable[[int, np.random.Generator], np.ndarray]] = {
+    "aleatoria": matriz_aleatoria,
+    "diagonal_dominante": matriz_diagonal_dominante,
+    "hilbert": matriz_hilbert,
+}
+
+
+# ####################################################################
+# Cada función retorna la solución y, si ``contar_ops``, el contador de
+# operaciones del proceso completo (factorización + resolución).
+def _correr_gauss(A, b, contar_ops):
+    return eliminacion_gaussiana(matriz_aumentada(A, b), contar_ops=contar_ops)
+
+
+def _correr_gauss_jordan(A, b, contar_ops):
+    return gauss_jordan(matriz_aumentada(A, b), contar_ops=contar_ops)
+
+
+def _correr_LU(A, b, contar_ops):
+    if not contar_ops:
+        L, U = descomposicion_LU(A)
+        return resolver_LU(L, U, b).ravel()
+    L, U, c1 = descomposicion_LU(A, contar_ops=True)
+    x, c2 = resolver_LU(L, U, b, contar_ops=True)
+    return x.ravel(), _sumar_contadores(c1, c2)
+
+
+def _correr_factorizar_LU(A, b, contar_ops):
+    # la corrida contada sigue el mismo camino que la cronometrada (factores
+    # compactos, sin copias densas de L y U) para que la memoria pico sea la misma
+    if not contar_ops:
+        return factorizar_LU(A).resolver(b)
+    factor, c1 = factorizar_LU(A, contar_ops=True)
+    x, c2 = factor.resolver(b, contar_ops=True)
+    return x, _sumar_contadores(c1, c2)
+
+
+def _sumar_contadores(*contadores: ContadorOperaciones) -> ContadorOperaciones:
+    total = ContadorOperaciones()
+    for c in contadores:
+        total.sumas_restas += c.sumas_restas
+        total.mult_div += c.mult_div
+        total.intercambios += c.intercambios
+    return total
+
+
+def _teorico_LU(n: int) -> dict:
+    return complejidad_teorica_LU(n)["total"]
+
+
+METODOS: dict[str, tuple[Callable, Callable[[int], dict]]] = {
+    "eliminacion_gaussiana": (_correr_gauss, complejidad_teorica_gauss),
+    "gauss_jordan": (_correr_gauss_jordan, complejidad_teorica_gauss_jordan),
+    "descomposicion_LU": (_correr_LU, _teorico_LU),
+    "factorizar_LU": (_correr_factorizar_LU, _teorico_LU),
+}
+
+
+# ####################################################################
+def medir(
+    metodo: str, A: np.ndarray, b: np.ndarray, repeticiones: int = 1
+) -> dict:
+    """Mide un método sobre el sistema Ax = b.
+
+    El tiempo es el mínimo de ``repeticiones`` corridas. La memoria pico (con
+    ``tracemalloc``) y el conteo de operaciones se toman en una corrida aparte
+    para no contaminar el tiempo.
+    """
+    correr, teorico = METODOS[metodo]
+    n = A.shape[0]
+    fila = {campo: "" for campo in CAMPOS}
+    fila.update(metodo=metodo, n=n)
+
+    try:
+        tiempos = []
+        for _ in range(max(repeticiones, 1)):
+            t0 = time.perf_counter()
+            correr(A, b, False)
+            tiempos.append(time.perf_counter() - t0)
+
+        tracemalloc.start()
+        try:
+            x, contador = correr(A, b, True)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except ValueError as e:
+        fila["error"] = str(e)
+        return fila
+
+    t = teorico(n)
+    fila.update(
+        tiempo_s=min(tiempos),
+        memoria_pico_bytes=pico,
+        mult_div=contador.mult_div,
+        sumas_restas=contador.sumas_restas,
+        intercambios=contador.intercambios,
+        teorico_mult_div=t["mult_div"],
+        teorico_sumas_restas=t["sumas_restas"],
+        residuo=float(np.max(np.abs(A @ x - b))) if n else 0.0,
+    )
+    return fila
+
+
+def ejecutar(
+    ns: list[int],
+    metodos: list[str] | None = None,
+    familias: list[str] | None = None,
+    repeticiones: int = 1,
+    tiempo_max: float = 60.0,
+    semilla: int = 0,
+) -> list[dict]:
+    """Recorre todos los tamaños ``ns``, métodos y familias de matrices.
+
+    Si una corrida de un método supera ``tiempo_max`` segundos, los tamaños
+    mayores se omiten para ese método y familia.
+    """
+    metodos = metodos or list(METODOS)
+    familias = familias or list(FAMILIAS)
+    resultados = []
+
+    for familia in familias:
+        for metodo in metodos:
+            for n in sorted(ns):
+                rng = np.random.default_rng(semilla + n)
+                A = FAMILIAS[familia](n, rng)
+                b = rng.uniform(-1, 1, n)
+
+                fila = medir(metodo, A, b, repeticiones)
+                fila["familia"] = familia
+                resultados.append(fila)
+                logging.info(
+                    f"{metodo:>22} | {familia:>18} | n={n:<5} | "
+                    f"t={fila['tiempo_s'] or '-'} | {fila['error']}"
+                )
+                if fila["tiempo_s"] != "" and fila["tiempo_s"] > tiempo_max:
+                    logging.info(f"{metodo}: se omiten tamaños mayores a {n}.")
+                    break
+    return resultados
+
+
+# ####################################################################
+def guardar(resultados: list[dict], ruta: str) -> None:
+    """Guarda los resultados en CSV o JSON según la extensión de ``ruta``."""
+    if ruta.endswith(".csv"):
+        with open(ruta, "w", newline="", encoding="utf-8") as f:
+            escritor = csv.DictWriter(f, fieldnames=CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(resultados)
+    else:
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2)
+
+
+def cargar(ruta: str) -> list[dict]:
+    """Carga resultados guardados con ``guardar``."""
+    if ruta.endswith(".csv"):
+        with open(ruta, newline="", encoding="utf-8") as f:
+            filas = list(csv.DictReader(f))
+        for fila in filas:
+            for campo in CAMPOS[2:-1]:
+                if fila[campo] != "":
+                    fila[campo] = float(fila[campo])
+        return filas
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def verificar_conteos(resultados: list[dict]) -> list[dict]:
+    """Filas cuyo conteo medido no coincide con la fórmula teórica."""
+    return [
+        fila
+        for fila in resultados
+        if fila["error"] == ""
+        and (
+            fila["mult_div"] != fila["teorico_mult_div"]
+            or fila["sumas_restas"] != fila["teorico_sumas_restas"]
+        )
+    ]
+
+
+def comparar(
+    base: list[dict], nuevo: list[dict], tolerancia: float = 0.2
+) -> list[str]:
+    """Compara dos ejecuciones y retorna las regresiones encontradas.
+
+    Se reporta una regresión si el tiempo crece más de ``tolerancia`` (relativo),
+    si la memoria pico crece más de ``tolerancia`` o si cambia el conteo de
+    operaciones.
+    """
+    def clave(fila):
+        return fila["metodo"], fila["familia"], int(fila["n"])
+
+    referencia = {clave(fila): fila for fila in base}
+    regresiones = []
+    for fila in nuevo:
+        ref = referencia.get(clave(fila))
+        if ref is None or ref["error"] != "" or fila["error"] != "":
+            continue
+        nombre = "{} | {} | n={}".format(*clave(fila))
+
+        for campo in ("tiempo_s", "memoria_pico_bytes"):
+            if fila[campo] > (1 + tolerancia) * ref[campo]:
+                regresiones.append(
+                    f"{nombre}: {campo} {ref[campo]:.4g} -> {fila[campo]:.4g}"
+                )
+        for campo in ("mult_div", "sumas_restas"):
+            if fila[campo] != ref[campo]:
+                regresiones.append(
+                    f"{nombre}: {campo} {ref[campo]} -> {fila[campo]}"
+                )
+    return regresiones
+
+
+# ####################################################################
+if __name__ == "__main__":
+    # el primer párrafo del docstring (sin la línea "Python 3") es la
+    # descripción y el segundo, los ejemplos de uso
+    resumen, uso = __doc__.strip().split("\n\n")[:2]
+    parser = argparse.ArgumentParser(
+        description="\n".join(resumen.split("\n")[1:]),
+        epilog=uso,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--n", type=int, nargs="+", default=[10, 50, 100, 200, 500, 1000, 2000])
+    parser.add_argument("--metodos", nargs="+", choices=list(METODOS))
+    parser.add_argument("--familias", nargs="+", choices=list(FAMILIAS))
+    parser.add_argument("--repeticiones", type=int, default=1)
+    parser.add_argument("--tiempo-max", type=float, default=60.0)
+    parser.add_argument("--salida", default="resultados_benchmark.json")
+    parser.add_argument("--comparar", nargs=2, metavar=("BASE", "NUEVO"))
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.comparar:
+        regresiones = comparar(cargar(args.comparar[0]), cargar(args.comparar[1]), args.tolerancia)
+        for r in regresiones:
+            logging.warning(r)
+        logging.info(f"{len(regresiones)} regresiones encontradas.")
+        raise SystemExit(1 if regresiones else 0)
+
+    resultados = ejecutar(
+        args.n, args.metodos, args.familias, args.repeticiones, args.tiempo_max
+    )
+    guardar(resultados, args.salida)
+    for fila in verificar_conteos(resultados):
+        logging.warning(
+            f"{fila['metodo']} | {fila['familia']} | n={fila['n']}: conteo medido "
+            f"({fila['mult_div']}, {fila['sumas_restas']}) != teórico "
+            f"({fila['teorico_mult_div']}, {fila['teorico_sumas_restas']})"
+        )
+    logging.info(f"Resultados guardados en {args.salida}")
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Caché de factorizaciones LU indexada por el contenido de la matriz, con
+presupuesto de memoria y desalojo LRU.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from linear_sist_methods import (
+    ContadorOperaciones,
+    FactorLU,
+    descomposicion_LU,
+    resolver_LU,
+)
+
+
+# ####################################################################
+def clave_matriz(A: np.ndarray) -> tuple:
+    """Clave de la caché: forma, tipo y un hash BLAKE2b del contenido de ``A``."""
+    A = np.ascontiguousarray(A)
+    digest = hashlib.blake2b(A.view(np.uint8).reshape(-1), digest_size=16).hexdigest()
+    return A.shape, A.dtype.str, digest
+
+
+def _arreglos(factores) -> list[np.ndarray]:
+    """Arreglos numpy contenidos en el resultado de una factorización."""
+    if isinstance(factores, np.ndarray):
+        return [factores]
+    if isinstance(factores, (tuple, list)):
+        return [a for f in factores for a in _arreglos(f)]
+    if hasattr(factores, "__dict__"):
+        return [a for f in vars(factores).values() for a in _arreglos(f)]
+    return []
+
+
+class CacheFactores:
+    """Caché LRU de factorizaciones con presupuesto de memoria.
+
+    ## Parameters
+    ``memoria_max``: bytes máximos ocupados por los factores guardados.
+    ``factorizar``: función que factoriza una matriz; por defecto
+                    ``descomposicion_LU``, que retorna ``(L, U)``. También puede
+                    ser ``factorizar_LU``, que retorna un FactorLU compacto.
+    """
+    def __init__(
+        self,
+        memoria_max: int = 512 * 1024**2,
+        factorizar: Callable[[np.ndarray], object] = descomposicion_LU,
+    ):
+        self.memoria_max = memoria_max
+        self.factorizar = factorizar
+        self._entradas: OrderedDict[tuple, tuple[object, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memoria_usada = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, A) -> bool:
+        return clave_matriz(np.asarray(A, dtype=float)) in self._entradas
+
+    def obtener(self, A: np.ndarray | list[list[float | int]]):
+        """Retorna los factores de ``A``; factoriza solo si no están en la caché.
+        Los arreglos retornados son de solo lectura porque se comparten."""
+        A = np.asarray(A, dtype=float)
+        clave = clave_matriz(A)
+
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return self._entradas[clave][0]
+            self.fallos += 1
+
+        factores = self.factorizar(A)
+        arreglos = _arreglos(factores)
+        for arr in arreglos:
+            arr.setflags(write=False)
+        tam = sum(arr.nbytes for arr in arreglos)
+
+        with self._lock:
+            if tam > self.memoria_max:
+                logging.debug("Factores de %d bytes exceden la caché; no se guardan.", tam)
+                return factores
+            if clave not in self._entradas:
+                self._entradas[clave] = (factores, tam)
+                self.memoria_usada += tam
+                self._desalojar()
+        return factores
+
+    def _desalojar(self):
+        while self.memoria_usada > self.memoria_max and self._entradas:
+            _, (_, tam) = self._entradas.popitem(last=False)
+            self.memoria_usada -= tam
+            self.desalojos += 1
+
+    def invalidar(self, A: np.ndarray | None = None) -> None:
+        """Elimina los factores de ``A``, o toda la caché si ``A`` es None."""
+        with self._lock:
+            if A is None:
+                self._entradas.clear()
+                self.memoria_usada = 0
+                return
+            entrada = self._entradas.pop(clave_matriz(np.asarray(A, dtype=float)), None)
+            if entrada is not None:
+                self.memoria_usada -= entrada[1]
+
+    def descomposicion_LU(self, A: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Reemplazo directo de ``descomposicion_LU`` que usa la caché."""
+        return self.obtener(A)
+
+    def resolver_LU(
+        self,
+        A: np.ndarray,
+        b: np.ndarray,
+        contar_ops: bool = False,
+        out: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, ContadorOperaciones] | np.ndarray:
+        """Resuelve Ax = b con ``resolver_LU`` sobre los factores en caché; si ya
+        estaban guardados solo se paga la sustitución O(n²).
+        Con factores FactorLU se usa ``FactorLU.resolver``."""
+        factores = self.obtener(A)
+        if isinstance(factores, FactorLU):
+            return factores.resolver(b, out=out, contar_ops=contar_ops)
+        L, U = factores
+        return resolver_LU(L, U, b, contar_ops=contar_ops, out=out)
+
+    def estadisticas(self) -> dict:
+        total = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._entradas),
+            "memoria_usada": self.memoria_usada,
+            "memoria_max": self.memoria_max,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+        }
+
+    def __str__(self):
+        return "\n".join(f"{k}: {v}" for k, v in self.estadisticas().items())
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Punto de entrada único para resolver Ax = b: se inspecciona la estructura de
+la matriz (simetría, definida positiva, ancho de banda, dispersión, dominancia
+diagonal), se estima el número de condición y se elige el algoritmo.
+"""
+
+import logging
+
+import numpy as np
+
+from linear_sist_methods import (
+    FactorLU,
+    _sustitucion_adelante,
+    _sustitucion_atras,
+    factorizar_LU,
+    factorizar_cholesky,
+)
+from matrices_dispersas import (
+    MatrizBanda,
+    MatrizCOO,
+    como_banda,
+    es_dispersa,
+    factorizar_banda,
+    resolver_banda,
+    resolver_banda_t,
+    thomas,
+)
+from metodos_iterativos import SolucionadorIterativo, _como_coo
+
+
+FRACCION_BANDA = 0.25  # banda estrecha si kl + ku + 1 <= FRACCION_BANDA * n
+DENSIDAD_ITERATIVO = 0.05  # fracción de entradas no nulas para preferir iterativo
+N_MIN_ITERATIVO = 500  # por debajo de este tamaño LU siempre es barata
+COND_MAX = 1 / np.finfo(np.float64).eps
+
+
+# ####################################################################
+class InformeResolucion:
+    """Qué algoritmo usó ``resolver`` y por qué.
+
+    ``metodo``: "thomas", "banda", "cholesky", "LU" o "iterativo".
+    ``motivo``: explicación de la elección.
+    ``propiedades``: resultado de la inspección de la matriz.
+    ``condicion``: estimación del número de condición en norma 1 (None si no
+                   se estimó).
+    """
+    def __init__(self, metodo: str, motivo: str, propiedades: dict, condicion: float | None = None):
+        self.metodo = metodo
+        self.motivo = motivo
+        self.propiedades = propiedades
+        self.condicion = condicion
+
+    def __str__(self):
+        cond = "no estimada" if self.condicion is None else f"{self.condicion:.3e}"
+        props = ", ".join(f"{k}={v}" for k, v in self.propiedades.items())
+        return f"Método: {self.metodo} ({self.motivo}); condición: {cond}; {props}"
+
+    def __repr__(self):
+        return f"InformeResolucion(metodo={self.metodo!r}, condicion={self.condicion})"
+
+
+# ####################################################################
+def _propiedades_densa(A: np.ndarray) -> dict:
+    n = A.shape[0]
+    filas, columnas = np.nonzero(A)
+    diagonal = np.abs(np.diagonal(A))
+    fuera = np.sum(np.abs(A), axis=1) - diagonal
+    escala = np.max(np.abs(A), initial=0.0)
+    return {
+        "n": n,
+        "densidad": len(filas) / n**2 if n else 0.0,
+        "kl": int(np.max(filas - columnas, initial=0)),
+        "ku": int(np.max(columnas - filas, initial=0)),
+        "simetrica": bool(np.allclose(A, A.T, rtol=1e-12, atol=1e-14 * escala)),
+        "diagonal_positiva": bool(np.all(np.diagonal(A) > 0)),
+        "diagonal_dominante": bool(np.all(diagonal > fuera)),
+    }
+
+
+def _propiedades_coo(M: MatrizCOO) -> dict:
+    n = M.shape[0]
+    f, c, v = M.filas, M.columnas, M.valores
+    en_diagonal = f == c
+    diagonal = np.bincount(f[en_diagonal], weights=v[en_diagonal], minlength=n)
+    fuera = np.bincount(f[~en_diagonal], weights=np.abs(v[~en_diagonal]), minlength=n)
+    # simétrica si las entradas (f, c, v) y (c, f, v) coinciden al ordenarlas
+    directo = np.lexsort((c, f))
+    traspuesto = np.lexsort((f, c))
+    simetrica = bool(
+        np.array_equal(f[directo], c[traspuesto])
+        and np.array_equal(c[directo], f[traspuesto])
+        and np.allclose(v[directo], v[traspuesto], rtol=1e-12)
+    )
+    return {
+        "n": n,
+        "densidad": M.nnz / n**2 if n else 0.0,
+        "kl": int(np.max(f - c, initial=0)),
+        "ku": int(np.max(c - f, initial=0)),
+        "simetrica": simetrica,
+        "diagonal_positiva": bool(np.all(diagonal > 0)),
+        "diagonal_dominante": bool(np.all(np.abs(diagonal) > fuera)),
+    }
+
+
+def estimar_condicion(norma_1: float, resolver, resolver_t, n: int) -> float:
+    """Estimación del número de condición κ₁(A) = ||A||₁ ||A⁻¹||₁ con el método
+    de Hager-Higham: ||A⁻¹||₁ se estima con unas pocas soluciones con A y Aᵀ,
+    en O(n²) si ya se tiene una factorización.
+
+    ## Parameters
+    ``norma_1``: ||A||₁.
+    ``resolver``, ``resolver_t``: funciones v -> A⁻¹ v y v -> A⁻ᵀ v.
+    ``n``: orden de la matriz.
+    """
+    x = np.full(n, 1.0 / n)
+    estimacion = 0.0
+    for k in range(5):
+        y = resolver(x)
+        estimacion = float(np.sum(np.abs(y)))
+        z = resolver_t(np.where(y >= 0, 1.0, -1.0))
+        j = int(np.argmax(np.abs(z)))
+        if k > 0 and abs(z[j]) <= z @ x:
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+    # vector alternativo para los casos en los que el método subestima
+    alterno = (-1.0) ** np.arange(n) * (1 + np.arange(n) / max(n - 1, 1))
+    estimacion = max(estimacion, 2 * float(np.sum(np.abs(resolver(alterno)))) / (3 * n))
+    return norma_1 * estimacion
+
+
+# ####################################################################
+def _resolver_banda(M: MatrizBanda, B: np.ndarray):
+    n = M.n
+    norma_1 = float(np.max(np.sum(np.abs(M.ab), axis=0), initial=0.0))
+    if M.es_tridiagonal:
+        ab = np.zeros((3, n))
+        ab[1 - M.ku:2 + M.kl] = M.ab
+        inferior, diagonal, superior = ab[2, :-1], ab[1], ab[0, 1:]
+        x = thomas(inferior, diagonal, superior, B)
+        condicion = estimar_condicion(
+            norma_1,
+            lambda v: thomas(inferior, diagonal, superior, v),
+            lambda v: thomas(superior, diagonal, inferior, v),
+            n,
+        )
+        return x, "thomas", condicion
+
+    L, U = factorizar_banda(M)
+    x = resolver_banda(L, U, B)
+    condicion = estimar_condicion(
+        norma_1, lambda v: resolver_banda(L, U, v), lambda v: resolver_banda_t(L, U, v), n
+    )
+    return x, "banda", condicion
+
+
+def _resolver_cholesky(A: np.ndarray, B: np.ndarray):
+    """Retorna None si A no es definida positiva."""
+    try:
+        factor = factorizar_cholesky(A)
+    except ValueError:
+        return None
+
+    condicion = estimar_condicion(
+        float(np.max(np.sum(np.abs(A), axis=0), initial=0.0)),
+        factor.resolver, factor.resolver, A.shape[0],
+    )
+    return factor.resolver(B), condicion
+
+
+def _resolver_LU_pivoteo(A: np.ndarray, B: np.ndarray):
+    factor: FactorLU = factorizar_LU(A)
+
+    def resolver_t(v):
+        # Aᵀ = Uᵀ Lᵀ P: Uᵀ y = v, Lᵀ z = y, x = Pᵀ z
+        v = np.array(v, dtype=float)
+        _sustitucion_adelante(factor.LU.T, v)
+        _sustitucion_atras(factor.LU.T, v, diagonal_unitaria=True)
+        x = np.empty_like(v)
+        x[factor.piv] = v
+        return x
+
+    condicion = estimar_condicion(
+        float(np.max(np.sum(np.abs(A), axis=0), initial=0.0)), factor.resolver, resolver_t, A.shape[0]
+    )
+    return factor.resolver(B), condicion
+
+
+def _resolver_iterativo(A, B: np.ndarray):
+    """Gauss-Seidel; converge para matrices estrictamente diagonal dominantes.
+    Retorna None si no converge."""
+    x, iteraciones, residuo = SolucionadorIterativo(A, "gauss_seidel").resolver(
+        B, tol=1e-12, max_iter=10_000
+    )
+    if residuo >= 1e-12:
+        return None
+    return x, iteraciones
+
+
+# ####################################################################
+def resolver(A, b: np.ndarray) -> tuple[np.ndarray, InformeResolucion]:
+    """Resuelve Ax = b eligiendo el algoritmo según la estructura de ``A``.
+
+    Reglas, en orden:
+    - tridiagonal y (diagonal dominante o simétrica con diagonal positiva):
+      Thomas, O(n).
+    - banda estrecha (kl + ku + 1 <= FRACCION_BANDA·n) con las mismas
+      condiciones: LU por bandas sin pivoteo, O(n kl ku).
+    - dispersa (o con densidad menor a DENSIDAD_ITERATIVO), n grande y diagonal
+      dominante: Gauss-Seidel, O(nnz) por iteración.
+    - simétrica definida positiva: Cholesky, n³/3.
+    - en otro caso: LU por bloques con pivoteo parcial, 2n³/3.
+    Los métodos sin pivoteo e iterativos pasan a LU con pivoteo si fallan.
+
+    ## Parameters
+    ``A``: matriz cuadrada n-by-n (densa, MatrizBanda, CSR, COO o scipy.sparse).
+    ``b``: términos independientes de tamaño (n,) o (n, k).
+
+    ## Return
+    ``solucion``: arreglo con la forma de ``b``.
+    ``informe``: InformeResolucion con el método usado, el motivo, las
+                 propiedades de la matriz y la condición estimada.
+    """
+    disperso = es_dispersa(A)
+    if disperso:
+        coo = _como_coo(A)
+        props = _propiedades_coo(coo)
+    else:
+        A = np.asarray(A, dtype=float)
+        assert A.ndim == 2 and A.shape[0] == A.shape[1], "La matriz A debe ser cuadrada."
+        props = _propiedades_densa(A)
+    n, kl, ku = props["n"], props["kl"], props["ku"]
+
+    B = np.asarray(b, dtype=float)
+    assert B.shape[0] == n, "Las dimensiones de A y b no coinciden."
+
+    spd_probable = props["simetrica"] and props["diagonal_positiva"]
+    sin_pivoteo = props["diagonal_dominante"] or spd_probable
+    motivos = []
+
+    # --- Thomas o LU por bandas
+    if sin_pivoteo and kl + ku + 1 <= max(3, FRACCION_BANDA * n):
+        M = como_banda(A) if disperso else MatrizBanda.desde_densa(A, kl, ku)
+        try:
+            x, metodo, condicion = _resolver_banda(M, B)
+            if not props["diagonal_dominante"]:
+                # sin dominancia diagonal no hay garantía de estabilidad sin pivoteo
+                r = np.max(np.abs(B - M @ x), initial=0.0)
+                if r > np.sqrt(np.finfo(float).eps) * max(np.max(np.abs(B), initial=0.0), 1.0):
+                    raise ValueError("Residuo grande sin pivoteo.")
+            motivo = (
+                f"banda kl={kl}, ku={ku}, "
+                + ("diagonal dominante" if props["diagonal_dominante"] else "simétrica con diagonal positiva")
+                + "; no requiere pivoteo"
+            )
+            return _terminar(x, metodo, motivo, props, condicion)
+        except ValueError:
+            motivos.append("la factorización por bandas sin pivoteo falló")
+
+    # --- iterativo para matrices dispersas grandes y diagonal dominantes
+    if (
+        props["diagonal_dominante"]
+        and n >= N_MIN_ITERATIVO
+        and (disperso or props["densidad"] <= DENSIDAD_ITERATIVO)
+    ):
+        resultado = _resolver_iterativo(coo if disperso else MatrizCOO.desde_densa(A), B)
+        if resultado is not None:
+            x, iteraciones = resultado
+            motivo = (
+                f"dispersa (densidad {props['densidad']:.3g}) y diagonal dominante; "
+                f"Gauss-Seidel convergió en {iteraciones} iteraciones"
+            )
+            return _terminar(x, "iterativo", motivo, props, None)
+        motivos.append("Gauss-Seidel no convergió")
+
+    # --- métodos densos
+    if disperso:
+        A = coo.a_densa()
+    if spd_probable:
+        resultado = _resolver_cholesky(A, B)
+        if resultado is not None:
+            x, condicion = resultado
+            return _terminar(x, "cholesky", "simétrica definida positiva", props, condicion)
+        motivos.append("simétrica pero no definida positiva")
+
+    x, condicion = _resolver_LU_pivoteo(A, B)
+    motivos.append("matriz general: LU con pivoteo parcial")
+    return _terminar(x, "LU", "; ".join(motivos), props, condicion)
+
+
+def _terminar(x, metodo, motivo, props, condicion):
+    informe = InformeResolucion(metodo, motivo, props, condicion)
+    logging.debug("resolver: %s", informe)
+    if condicion is not None and condicion >= COND_MAX:
+        logging.warning(
+            f"La matriz está mal condicionada (κ₁ ≈ {condicion:.3e}); la solución puede no ser confiable."
+        )
+    return x, informe
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Lectura y escritura por bloques de archivos con miles de sistemas de
+ecuaciones. Los sistemas se entregan como lotes de matrices aumentadas de
+tamaño (k, n, n+1), listos para ``eliminacion_gaussiana_lote`` o
+``ResolutorParalelo``, sin pasar por listas de Python; las soluciones se
+escriben a disco a medida que se calculan.
+
+Formatos soportados:
+- ``.npy``: arreglo (lote, n, n+1) o una sola matriz (n, n+1); se mapea en memoria.
+- ``.npz``: con ``Ab`` (lote, n, n+1) o ``A`` (lote, n, n) y ``b`` (lote, n). Los
+  miembros sin compresión se mapean en memoria.
+- MatrixMarket (``.mtx``): un archivo por sistema (matriz aumentada, o matriz
+  cuadrada con su lado derecho en ``<nombre>_b.mtx``); se puede dar un
+  directorio o una lista de archivos.
+- Flujo binario (``.mnb`` o un objeto archivo): encabezado de 64 bytes y
+  registros de tamaño fijo uno tras otro, ver ``EscritorBinario``.
+"""
+
+import logging
+import os
+import struct
+import zipfile
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+from linear_sist_methods import eliminacion_gaussiana_lote, matriz_aumentada
+from paralelo import ResolutorParalelo
+
+
+MAGICO = b"MNBLOQ01"
+TAM_ENCABEZADO = 64
+MAX_DIMS = 4
+# mágico, dtype (p. ej. b"<f8"), número de dimensiones, dimensiones del registro
+FORMATO_ENCABEZADO = f"<8s4sI{MAX_DIMS}Q"
+
+
+# ####################################################################
+class EscritorBinario:
+    """Escribe registros de forma fija en el flujo binario, por bloques.
+    El archivo se puede leer mientras se escribe (``leer_binario`` ignora un
+    último registro incompleto) y se puede seguir agregando con ``modo="ab"``.
+
+    ## Parameters
+    ``destino``: ruta del archivo o un objeto archivo binario abierto.
+    ``forma_registro``: forma de cada registro, p. ej. (n, n+1) para sistemas o
+                        (n,) para soluciones.
+    ``dtype``: tipo de los datos, por defecto float64.
+    ``modo``: "wb" para crear el archivo o "ab" para agregar a uno existente.
+    """
+    def __init__(
+        self,
+        destino: str | BinaryIO,
+        forma_registro: tuple[int, ...],
+        dtype: type = np.float64,
+        modo: str = "wb",
+    ):
+        assert 1 <= len(forma_registro) <= MAX_DIMS, f"La forma debe tener de 1 a {MAX_DIMS} dimensiones."
+        self.forma_registro = tuple(int(d) for d in forma_registro)
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        self.registros = 0
+        self._propio = isinstance(destino, str)
+
+        if self._propio and modo == "ab" and os.path.exists(destino) and os.path.getsize(destino):
+            info = leer_encabezado_binario(destino)
+            assert info["forma"] == self.forma_registro and info["dtype"] == self.dtype, \
+                "La forma o el tipo no coinciden con el archivo existente."
+            self._f = open(destino, "ab")
+            return
+
+        self._f = open(destino, "wb") if self._propio else destino
+        dims = self.forma_registro + (0,) * (MAX_DIMS - len(self.forma_registro))
+        encabezado = struct.pack(
+            FORMATO_ENCABEZADO, MAGICO, self.dtype.str.encode(), len(self.forma_registro), *dims
+        )
+        self._f.write(encabezado.ljust(TAM_ENCABEZADO, b"\0"))
+
+    def escribir(self, bloque: np.ndarray) -> None:
+        """Agrega un registro, o un bloque de registros (k, *forma_registro)."""
+        bloque = np.ascontiguousarray(bloque, dtype=self.dtype)
+        if bloque.shape == self.forma_registro:
+            bloque = bloque[None]
+        assert bloque.shape[1:] == self.forma_registro, \
+            f"Se esperaban registros de forma {self.forma_registro}, no {bloque.shape[1:]}."
+        self._f.write(memoryview(bloque).cast("B"))
+        self.registros += bloque.shape[0]
+
+    def cerrar(self) -> None:
+        self._f.flush()
+        if self._propio:
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+
+def leer_encabezado_binario(fuente: str | BinaryIO) -> dict:
+    """Lee el encabezado del flujo binario: forma de cada registro y tipo."""
+    if isinstance(fuente, str):
+        with open(fuente, "rb") as f:
+            crudo = f.read(TAM_ENCABEZADO)
+    else:
+        crudo = fuente.read(TAM_ENCABEZADO)
+    if len(crudo) < TAM_ENCABEZADO or crudo[:8] != MAGICO:
+        raise ValueError("No es un flujo binario de sistemas.")
+    magico, dtype, ndim, *dims = struct.unpack_from(FORMATO_ENCABEZADO, crudo)
+    return {"dtype": np.dtype(dtype.rstrip(b"\0").decode()), "forma": tuple(dims[:ndim])}
+
+
+def leer_binario(fuente: str | BinaryIO, tam_bloque: int = 1024) -> Iterator[np.ndarray]:
+    """Lee el flujo binario por bloques de hasta ``tam_bloque`` registros.
+    Si ``fuente`` es una ruta el archivo se mapea en memoria y cada bloque es
+    una vista; si es un objeto archivo (p. ej. una tubería) se lee en un
+    búfer que se reutiliza entre bloques."""
+    if isinstance(fuente, str):
+        info = leer_encabezado_binario(fuente)
+        tam_registro = int(np.prod(info["forma"])) * info["dtype"].itemsize
+        total = (os.path.getsize(fuente) - TAM_ENCABEZADO) // tam_registro
+        if total == 0:
+            return
+        datos = np.memmap(
+            fuente, dtype=info["dtype"], mode="r", offset=TAM_ENCABEZADO,
+            shape=(total,) + info["forma"],
+        )
+        for ini in range(0, total, tam_bloque):
+            yield datos[ini:ini + tam_bloque]
+        return
+
+    info = leer_encabezado_binario(fuente)
+    bufer = np.empty((tam_bloque,) + info["forma"], dtype=info["dtype"])
+    tam_registro = bufer[0].nbytes
+    vista = memoryview(bufer).cast("B")
+    while True:
+        leidos = 0
+        while leidos < len(vista):
+            m = fuente.readinto(vista[leidos:])
+            if not m:
+                break
+            leidos += m
+        k = leidos // tam_registro
+        if k:
+            yield bufer[:k]
+        if leidos < len(vista):
+            return
+
+
+# ####################################################################
+def _memmap_npz(ruta: str, nombre: str) -> np.ndarray:
+    """Mapea en memoria un miembro ``nombre.npy`` de un ``.npz`` si no está
+    comprimido; si lo está, lo carga completo."""
+    with zipfile.ZipFile(ruta) as z:
+        info = z.getinfo(nombre + ".npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        logging.warning(f"{ruta}: '{nombre}' está comprimido; se carga completo en memoria.")
+        return np.load(ruta)[nombre]
+
+    with open(ruta, "rb") as f:
+        # encabezado local del zip: 30 bytes + nombre + campo extra
+        f.seek(info.header_offset)
+        local = f.read(30)
+        largo_nombre, largo_extra = struct.unpack("<HH", local[26:30])
+        f.seek(info.header_offset + 30 + largo_nombre + largo_extra)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            forma, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            forma, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    return np.memmap(
+        ruta, dtype=dtype, mode="r", offset=offset, shape=forma, order="F" if fortran else "C"
+    )
+
+
+def _bloques_de_pila(Ab: np.ndarray, tam_bloque: int) -> Iterator[np.ndarray]:
+    if Ab.ndim == 2:
+        Ab = Ab[None]
+    assert Ab.ndim == 3 and Ab.shape[1] == Ab.shape[2] - 1, \
+        "Se esperaba un arreglo de tamaño (lote, n, n+1)."
+    for ini in range(0, Ab.shape[0], tam_bloque):
+        yield Ab[ini:ini + tam_bloque]
+
+
+def _bloques_npz(ruta: str, tam_bloque: int) -> Iterator[np.ndarray]:
+    with zipfile.ZipFile(ruta) as z:
+        nombres = {n[:-4] for n in z.namelist() if n.endswith(".npy")}
+    if "Ab" in nombres:
+        yield from _bloques_de_pila(_memmap_npz(ruta, "Ab"), tam_bloque)
+        return
+    assert {"A", "b"} <= nombres, f"{ruta}: se esperaba 'Ab', o 'A' y 'b'."
+    A = _memmap_npz(ruta, "A")
+    b = _memmap_npz(ruta, "b")
+    if A.ndim == 2:
+        A, b = A[None], b.reshape(1, -1)
+    lote, n = A.shape[:2]
+    assert b.shape[0] == lote, f"{ruta}: A y b tienen distinto número de sistemas."
+    bufer = np.empty((min(tam_bloque, lote), n, n + 1))
+    for ini in range(0, lote, tam_bloque):
+        fin = min(ini + tam_bloque, lote)
+        yield matriz_aumentada(A[ini:fin], b[ini:fin], out=bufer[:fin - ini])
+
+
+# ####################################################################
+def leer_matrix_market(ruta: str) -> np.ndarray:
+    """Lee una matriz densa de un archivo MatrixMarket (formatos ``array`` y
+    ``coordinate``; real, entero o patrón; general, simétrica o antisimétrica)."""
+    with open(ruta, encoding="utf-8") as f:
+        cabecera = f.readline().lower().split()
+        assert cabecera[:2] == ["%%matrixmarket", "matrix"], f"{ruta}: no es MatrixMarket."
+        formato, campo, simetria = cabecera[2], cabecera[3], cabecera[4]
+        assert campo in ("real", "integer", "pattern", "double"), f"{ruta}: campo '{campo}' no soportado."
+        linea = f.readline()
+        while linea.startswith("%"):
+            linea = f.readline()
+        tam = [int(t) for t in linea.split()]
+        datos = np.loadtxt(f, ndmin=2) if formato == "coordinate" else np.loadtxt(f, ndmin=1)
+
+    m, n = tam[:2]
+    if formato == "array":
+        if simetria == "general":
+            return datos.reshape(n, m).T.copy()
+        # solo el triángulo inferior, por columnas; en las antisimétricas la
+        # diagonal (nula) no se guarda
+        M = np.zeros((m, n))
+        M[np.triu_indices(n, 1 if simetria == "skew-symmetric" else 0)[::-1]] = datos.ravel()
+    else:
+        M = np.zeros((m, n))
+        if len(datos):
+            filas = datos[:, 0].astype(np.intp) - 1
+            columnas = datos[:, 1].astype(np.intp) - 1
+            valores = np.ones(len(datos)) if campo == "pattern" else datos[:, 2]
+            np.add.at(M, (filas, columnas), valores)
+    if simetria == "symmetric":
+        M += np.tril(M, -1).T
+    elif simetria == "skew-symmetric":
+        M -= np.tril(M, -1).T
+    return M
+
+
+def _bloques_matrix_market(rutas: list[str], tam_bloque: int) -> Iterator[np.ndarray]:
+    """Agrupa archivos consecutivos con el mismo n en bloques (k, n, n+1)."""
+    pendientes: list[np.ndarray] = []
+    for ruta in rutas:
+        M = leer_matrix_market(ruta)
+        rhs = ruta[:-4] + "_b.mtx"
+        if M.shape[0] == M.shape[1] and os.path.exists(rhs):
+            M = matriz_aumentada(M, leer_matrix_market(rhs))
+        assert M.shape[1] == M.shape[0] + 1, f"{ruta}: se esperaba una matriz n-by-(n+1)."
+        if pendientes and (pendientes[0].shape != M.shape or len(pendientes) == tam_bloque):
+            yield np.stack(pendientes)
+            pendientes = []
+        pendientes.append(M)
+    if pendientes:
+        yield np.stack(pendientes)
+
+
+def _rutas_matrix_market(fuente: str | list[str]) -> list[str]:
+    if isinstance(fuente, str) and os.path.isdir(fuente):
+        fuente = [os.path.join(fuente, f) for f in sorted(os.listdir(fuente))]
+    elif isinstance(fuente, str):
+        fuente = [fuente]
+    return [r for r in fuente if r.endswith(".mtx") and not r.endswith("_b.mtx")]
+
+
+# ####################################################################
+def leer_sistemas(
+    fuente: str | list[str] | BinaryIO,
+    tam_bloque: int = 1024,
+) -> Iterator[np.ndarray]:
+    """Lee sistemas de ecuaciones por bloques.
+
+    ## Parameters
+    ``fuente``: ruta a un ``.npy``, ``.npz``, ``.mtx``, ``.mnb``, un directorio
+                con archivos ``.mtx``, una lista de archivos ``.mtx`` o un
+                objeto archivo binario con el flujo binario.
+    ``tam_bloque``: número máximo de sistemas por bloque.
+
+    ## Return
+    Iterador de bloques de matrices aumentadas de tamaño (k, n, n+1). Los
+    bloques pueden ser vistas de memoria mapeada o un búfer reutilizado, por lo
+    que se deben consumir (o copiar) antes de pedir el siguiente.
+    """
+    assert tam_bloque >= 1, "tam_bloque debe ser positivo."
+    if not isinstance(fuente, (str, list)):
+        yield from leer_binario(fuente, tam_bloque)
+    elif isinstance(fuente, list) or os.path.isdir(fuente) or fuente.endswith(".mtx"):
+        yield from _bloques_matrix_market(_rutas_matrix_market(fuente), tam_bloque)
+    elif fuente.endswith(".npy"):
+        yield from _bloques_de_pila(np.load(fuente, mmap_mode="r"), tam_bloque)
+    elif fuente.endswith(".npz"):
+        yield from _bloques_npz(fuente, tam_bloque)
+    else:
+        yield from leer_binario(fuente, tam_bloque)
+
+
+def resolver_flujo(
+    fuente: str | list[str] | BinaryIO,
+    destino: str | BinaryIO | EscritorBinario,
+    tam_bloque: int = 1024,
+    procesos: int | None = None,
+    metodo: str = "eliminacion_gaussiana",
+) -> tuple[int, int]:
+    """Resuelve todos los sistemas de ``fuente`` bloque a bloque y escribe las
+    soluciones en ``destino`` (flujo binario con registros de tamaño (n,)).
+    La memoria usada depende de ``tam_bloque`` y no del tamaño del archivo.
+
+    ## Parameters
+    ``fuente``: ver ``leer_sistemas``.
+    ``destino``: ruta, objeto archivo binario o EscritorBinario.
+    ``tam_bloque``: sistemas por bloque.
+    ``procesos``: si se da, los bloques se resuelven con un mismo
+                  ``ResolutorParalelo`` (un solo pool y los mismos segmentos de
+                  memoria compartida para todo el flujo) y ``metodo``; si no,
+                  con ``eliminacion_gaussiana_lote``.
+    ``metodo``: método para ``ResolutorParalelo``.
+
+    ## Return
+    ``total``: número de sistemas resueltos.
+    ``fallidos``: número de sistemas sin solución única (su fila es NaN).
+    """
+    escritor = destino if isinstance(destino, EscritorBinario) else None
+    total = fallidos = 0
+    resolutor = ResolutorParalelo(procesos, metodo) if procesos else None
+    try:
+        for bloque in leer_sistemas(fuente, tam_bloque):
+            n = bloque.shape[1]
+            if escritor is None:
+                escritor = EscritorBinario(destino, (n,))
+            assert escritor.forma_registro == (n,), \
+                "Todos los sistemas deben tener el mismo n para escribir las soluciones."
+
+            if resolutor is not None:
+                soluciones, errores = resolutor.resolver(bloque)
+                fallidos += sum(e is not None for e in errores)
+            else:
+                soluciones, singulares = eliminacion_gaussiana_lote(bloque)
+                fallidos += int(np.count_nonzero(singulares))
+            escritor.escribir(soluciones)
+            total += bloque.shape[0]
+    finally:
+        if resolutor is not None:
+            resolutor.cerrar()
+        if escritor is not None and escritor is not destino:
+            escritor.cerrar()
+
+    logging.info(f"Se resolvieron {total} sistemas ({fallidos} sin solución única).")
+    return total, fallidos
@@ -3,24 +3,106 @@ from linear_sist_methods import (
     eliminacion_gaussiana,
     descomposicion_LU,
     resolver_LU,
+    factorizar_LU,
+    FactorLU,
+    factorizar_cholesky,
+    factorizar_LDLt,
+    resolver_cholesky,
+    FactorCholesky,
+    FactorLDLt,
     matriz_aumentada,
     separar_m_aumentada,
     gauss_jordan,
+    eliminacion_gaussiana_lote,
     ContadorOperaciones,
     complejidad_teorica_gauss,
     complejidad_teorica_gauss_jordan,
-    complejidad_teorica_LU
+    complejidad_teorica_LU,
+    complejidad_teorica_cholesky,
+    complejidad_teorica_LDLt
 )
+from instrumentacion import Instrumentacion, SIN_INSTRUMENTACION
+from matrices_dispersas import (
+    MatrizBanda,
+    MatrizCSR,
+    MatrizCOO,
+    thomas,
+    factorizar_banda,
+    resolver_banda,
+    resolver_banda_t,
+    resolver_disperso
+)
+from metodos_iterativos import (
+    SolucionadorIterativo,
+    resolver_iterativo,
+    jacobi,
+    gauss_seidel,
+    sor
+)
+from cache_factores import CacheFactores
+from paralelo import ResolutorParalelo, resolver_en_paralelo
+from lu_fuera_de_memoria import factorizar_LU_fuera_de_memoria
+from precision_mixta import resolver_precision_mixta
+from almacen_factores import AlmacenFactores, cargar_factor, guardar_factor
+from flujo_sistemas import (
+    EscritorBinario,
+    leer_binario,
+    leer_matrix_market,
+    leer_sistemas,
+    resolver_flujo,
+)
+from despachador import InformeResolucion, estimar_condicion, resolver
 
 __all__ = [
     'eliminacion_gaussiana',
     'descomposicion_LU',
     'resolver_LU',
+    'factorizar_LU',
+    'FactorLU',
+    'factorizar_cholesky',
+    'factorizar_LDLt',
+    'resolver_cholesky',
+    'FactorCholesky',
+    'FactorLDLt',
     'matriz_aumentada',
     'separar_m_aumentada',
     'gauss_jordan',
+    'eliminacion_gaussiana_lote',
     'ContadorOperaciones',
     'complejidad_teorica_gauss',
     'complejidad_teorica_gauss_jordan',
-    'complejidad_teorica_LU'
+    'complejidad_teorica_LU',
+    'complejidad_teorica_cholesky',
+    'complejidad_teorica_LDLt',
+    'Instrumentacion',
+    'SIN_INSTRUMENTACION',
+    'MatrizBanda',
+    'MatrizCSR',
+    'MatrizCOO',
+    'thomas',
+    'factorizar_banda',
+    'resolver_banda',
+    'resolver_banda_t',
+    'resolver_disperso',
+    'SolucionadorIterativo',
+    'resolver_iterativo',
+    'jacobi',
+    'gauss_seidel',
+    'sor',
+    'CacheFactores',
+    'ResolutorParalelo',
+    'resolver_en_paralelo',
+    'factorizar_LU_fuera_de_memoria',
+    'resolver_precision_mixta',
+    'resolver',
+    'InformeResolucion',
+    'estimar_condicion',
+    'AlmacenFactores',
+    'guardar_factor',
+    'cargar_factor',
+    'EscritorBinario',
+    'leer_binario',
+    'leer_matrix_market',
+    'leer_sistemas',
+    'resolver_flujo'
 ]
\ No newline at end of file
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Instrumentación de los métodos directos: tiempos por fase, contadores e
+instantáneas de la matriz. Desactivada por defecto con costo prácticamente nulo.
+"""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Callable
+
+import numpy as np
+
+
+# un sumidero recibe (evento, nombre, valor); evento es "fase", "contador" o "instantanea"
+Sumidero = Callable[[str, str, object], None]
+
+
+# ####################################################################
+class Instrumentacion:
+    """Acumula tiempos por fase (búsqueda de pivote, eliminación, sustitución),
+    contadores de operaciones e instantáneas opcionales de la matriz.
+
+    ## Parameters
+    ``sumidero``: (opcional) función ``sumidero(evento, nombre, valor)`` a la que
+                  se reenvía cada medición, p. ej. para un perfilador o un
+                  sistema de métricas.
+    ``capturar_matrices``: si True, ``instantanea`` guarda una copia de la matriz.
+    """
+    activo = True
+
+    def __init__(self, sumidero: Sumidero | None = None, capturar_matrices: bool = False):
+        self.sumidero = sumidero
+        self.capturar_matrices = capturar_matrices
+        self.reset()
+
+    def reset(self):
+        self.tiempos = defaultdict(float)
+        self.llamadas = defaultdict(int)
+        self.contadores = defaultdict(int)
+        self.instantaneas = []
+
+    @contextmanager
+    def fase(self, nombre: str):
+        """Mide el tiempo del bloque ``with`` y lo acumula en ``tiempos[nombre]``."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t0
+            self.tiempos[nombre] += dt
+            self.llamadas[nombre] += 1
+            if self.sumidero is not None:
+                self.sumidero("fase", nombre, dt)
+
+    def contar(self, **incrementos: int):
+        """Suma los incrementos dados a ``contadores``."""
+        for nombre, valor in incrementos.items():
+            self.contadores[nombre] += valor
+            if self.sumidero is not None:
+                self.sumidero("contador", nombre, valor)
+
+    def agregar_contador(self, contador):
+        """Suma los totales de un ``ContadorOperaciones``."""
+        self.contar(
+            sumas_restas=contador.sumas_restas,
+            mult_div=contador.mult_div,
+            intercambios=contador.intercambios,
+        )
+
+    def instantanea(self, etiqueta: str, A: np.ndarray):
+        """Guarda una copia de ``A`` si ``capturar_matrices`` está activo."""
+        if not self.capturar_matrices:
+            return
+        copia = np.array(A, copy=True)
+        self.instantaneas.append((etiqueta, copia))
+        if self.sumidero is not None:
+            self.sumidero("instantanea", etiqueta, copia)
+
+    def __str__(self):
+        lineas = [
+            f"{nombre}: {t:.6f} s ({self.llamadas[nombre]} llamadas)"
+            for nombre, t in self.tiempos.items()
+        ]
+        lineas += [f"{nombre}: {valor}" for nombre, valor in self.contadores.items()]
+        return "\n".join(lineas)
+
+
+class _SinInstrumentacion:
+    """Instrumentación desactivada: todas las operaciones son no-op."""
+    activo = False
+    _contexto = nullcontext()
+
+    def fase(self, nombre: str):
+        return self._contexto
+
+    def contar(self, **incrementos: int):
+        pass
+
+    def agregar_contador(self, contador):
+        pass
+
+    def instantanea(self, etiqueta: str, A: np.ndarray):
+        pass
+
+
+SIN_INSTRUMENTACION = _SinInstrumentacion()
@@ -10,6 +10,16 @@ from sys import stdout
 from datetime import datetime
 import numpy as np
 
+from instrumentacion import Instrumentacion, SIN_INSTRUMENTACION
+from matrices_dispersas import (
+    MatrizBanda,
+    como_banda,
+    es_dispersa,
+    factorizar_banda,
+    resolver_banda,
+    resolver_disperso,
+)
+
 logging.basicConfig(
     level=logging.INFO,
     format="[%(asctime)s][%(levelname)s] %(message)s",
@@ -37,23 +47,66 @@ class ContadorOperaciones:
                 f"Intercambios de filas: {self.intercambios}")
 
 
+def _contar_banda(
+    contador: ContadorOperaciones, n: int, kl: int, ku: int,
+    factorizar: bool = True, columnas_b: int = 0,
+):
+    """Conteo en forma cerrada de LU por bandas sin pivoteo (y de Thomas, que
+    realiza las mismas operaciones para kl = ku = 1)."""
+    k = np.arange(n)
+    dl = np.minimum(kl, n - 1 - k)
+    du = np.minimum(ku, n - 1 - k)
+    if factorizar:
+        # por columna: dl divisiones y dl*du multiplicaciones y restas
+        contador.mult_div += int(np.sum(dl * (1 + du)))
+        contador.sumas_restas += int(np.sum(dl * du))
+    if columnas_b:
+        # sustituciones: dl y du mult./restas por columna, n divisiones
+        contador.mult_div += columnas_b * int(np.sum(dl) + np.sum(du) + n)
+        contador.sumas_restas += columnas_b * int(np.sum(dl) + np.sum(du))
+
+
 # ####################################################################
 def eliminacion_gaussiana(
     A: np.ndarray | list[list[float | int]], 
-    contar_ops: bool = False
+    contar_ops: bool = False,
+    instrumentacion: Instrumentacion | None = None,
+    b: np.ndarray | None = None,
 ) -> tuple[np.ndarray, ContadorOperaciones] | np.ndarray:
     """Resuelve un sistema de ecuaciones lineales mediante eliminación gaussiana.
+    La eliminación se realiza por bloques con numpy; con ``contar_ops`` el conteo
+    se obtiene en forma cerrada por cada paso de pivote.
 
     ## Parameters
     ``A``: matriz aumentada del sistema de ecuaciones lineales. 
            Debe ser de tamaño n-by-(n+1), donde n es el número de incógnitas.
+           También puede ser la matriz de coeficientes n-by-n por bandas
+           (MatrizBanda), CSR o COO; en ese caso se debe dar ``b``.
     ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``instrumentacion``: (opcional) objeto Instrumentacion que recibe los tiempos
+                         por fase, los conteos y las instantáneas de la matriz.
+    ``b``: términos independientes, solo para ``A`` por bandas o dispersa. Se usa
+           el algoritmo de Thomas si es tridiagonal y eliminación por bandas si no.
 
     ## Return
     ``solucion``: vector con la solución del sistema de ecuaciones lineales.
     ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
     """
     contador = ContadorOperaciones()
+    inst = instrumentacion if instrumentacion is not None else SIN_INSTRUMENTACION
+    contar = contar_ops or inst.activo
+
+    if es_dispersa(A):
+        assert b is not None, "Para A por bandas o dispersa se debe dar b."
+        M = como_banda(A)
+        with inst.fase("eliminacion"):
+            solucion = resolver_disperso(M, b)
+        if contar:
+            _contar_banda(contador, M.n, M.kl, M.ku, columnas_b=1)
+            inst.agregar_contador(contador)
+        if contar_ops:
+            return solucion, contador
+        return solucion
     
     if not isinstance(A, np.ndarray):
         logging.debug("Convirtiendo A a numpy array.")
@@ -67,65 +120,57 @@ def eliminacion_gaussiana(
     # Fase de eliminación
     for i in range(0, n - 1):  # loop por columna
 
-        # --- encontrar pivote
-        p = None
-        for pi in range(i, n):
-            if A[pi, i] == 0:
-                continue
-
-            if p is None:
-                p = pi
-                continue
-
-            if abs(A[pi, i]) < abs(A[p, i]):
-                p = pi
-
-        if p is None:
-            raise ValueError("No existe solución única.")
-
-        if p != i:
-            # swap rows
-            logging.debug(f"Intercambiando filas {i} y {p}")
-            _aux = A[i, :].copy()
-            A[i, :] = A[p, :].copy()
-            A[p, :] = _aux
-            contador.intercambios += 1
-
-        # --- Eliminación: loop por fila
-        for j in range(i + 1, n):
-            m = A[j, i] / A[i, i]
-            contador.mult_div += 1  # división para calcular m
-            
-            # A[j, i:] = A[j, i:] - m * A[i, i:]
-            # Desglosando las operaciones:
-            for k in range(i, n + 1):
-                # m * A[i, k]: 1 multiplicación
-                # A[j, k] - (m * A[i, k]): 1 resta
-                contador.mult_div += 1
-                contador.sumas_restas += 1
-                A[j, k] = A[j, k] - m * A[i, k]
-
-        logging.debug(f"Después de eliminar columna {i}:\n{A}")
+        # --- encontrar pivote (el menor no nulo en valor absoluto)
+        with inst.fase("busqueda_pivote"):
+            col = np.abs(A[i:, i])
+            no_nulos = col != 0
+            if not no_nulos.any():
+                raise ValueError("No existe solución única.")
+
+            p = i + int(np.argmin(np.where(no_nulos, col, np.inf)))
+
+            if p != i:
+                # swap rows
+                logging.debug("Intercambiando filas %d y %d", i, p)
+                A[[i, p], :] = A[[p, i], :]
+                contador.intercambios += 1
+
+        # --- Eliminación: todas las filas debajo del pivote en un solo bloque
+        # A[j, i+1:] = A[j, i+1:] - m_j * A[i, i+1:]  para j = i+1, ..., n-1
+        with inst.fase("eliminacion"):
+            m = A[i + 1:, i] / A[i, i]
+            A[i + 1:, i + 1:] -= np.multiply.outer(m, A[i, i + 1:])
+            A[i + 1:, i] = 0
+
+        if contar:
+            # filas = n - i - 1, columnas actualizadas = n - i
+            # por fila: 1 división (m) + (n - i) multiplicaciones y restas
+            filas = n - i - 1
+            contador.mult_div += filas * (n - i + 1)
+            contador.sumas_restas += filas * (n - i)
+
+        logging.debug("Después de eliminar columna %d:\n%s", i, A)
+        inst.instantanea(f"columna {i}", A)
 
     # BUG CORREGIDO: Removido el print inalcanzable después del raise
     if A[n - 1, n - 1] == 0:
         raise ValueError("No existe solución única.")
 
     # --- Sustitución hacia atrás
-    solucion = np.zeros(n)
-    solucion[n - 1] = A[n - 1, n] / A[n - 1, n - 1]
-    contador.mult_div += 1  # 1 división
-
-    for i in range(n - 2, -1, -1):
-        suma = 0
-        for j in range(i + 1, n):
-            suma += A[i, j] * solucion[j]
-            contador.mult_div += 1      # 1 multiplicación
-            contador.sumas_restas += 1  # 1 suma
-        
-        solucion[i] = (A[i, n] - suma) / A[i, i]
-        contador.sumas_restas += 1  # 1 resta
-        contador.mult_div += 1      # 1 división
+    with inst.fase("sustitucion"):
+        solucion = np.zeros(n)
+        solucion[n - 1] = A[n - 1, n] / A[n - 1, n - 1]
+
+        for i in range(n - 2, -1, -1):
+            suma = A[i, i + 1:n] @ solucion[i + 1:]
+            solucion[i] = (A[i, n] - suma) / A[i, i]
+
+    if contar:
+        # por fila i: (n - i - 1) multiplicaciones, (n - i - 2) sumas,
+        # 1 resta y 1 división; más la división de la última fila
+        contador.mult_div += n * (n + 1) // 2
+        contador.sumas_restas += n * (n - 1) // 2
+        inst.agregar_contador(contador)
 
     if contar_ops:
         return solucion, contador
@@ -135,14 +180,18 @@ def eliminacion_gaussiana(
 # ####################################################################
 def descomposicion_LU(
     A: np.ndarray,
-    contar_ops: bool = False
+    contar_ops: bool = False,
+    instrumentacion: Instrumentacion | None = None,
 ) -> tuple[np.ndarray, np.ndarray, ContadorOperaciones] | tuple[np.ndarray, np.ndarray]:
     """Realiza la descomposición LU de una matriz cuadrada A.
     [IMPORTANTE] No se realiza pivoteo.
 
     ## Parameters
-    ``A``: matriz cuadrada de tamaño n-by-n.
+    ``A``: matriz cuadrada de tamaño n-by-n. Si es una MatrizBanda, CSR o COO se
+           factoriza por bandas (el relleno queda dentro de la banda) y ``L`` y
+           ``U`` se retornan como MatrizBanda.
     ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``instrumentacion``: (opcional) objeto Instrumentacion.
 
     ## Return
     ``L``: matriz triangular inferior.
@@ -150,6 +199,19 @@ def descomposicion_LU(
     ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
     """
     contador = ContadorOperaciones()
+    inst = instrumentacion if instrumentacion is not None else SIN_INSTRUMENTACION
+    contar = contar_ops or inst.activo
+
+    if es_dispersa(A):
+        M = como_banda(A)
+        with inst.fase("eliminacion"):
+            L, U = factorizar_banda(M)
+        if contar:
+            _contar_banda(contador, M.n, M.kl, M.ku)
+            inst.agregar_contador(contador)
+        if contar_ops:
+            return L, U, contador
+        return L, U
     
     A = np.array(A, dtype=float).copy()
     assert A.shape[0] == A.shape[1], "La matriz A debe ser cuadrada."
@@ -163,97 +225,577 @@ def descomposicion_LU(
             raise ValueError("No existe solución única (pivote cero, se requiere pivoteo).")
 
         L[i, i] = 1
-        for j in range(i + 1, n):
-            m = A[j, i] / A[i, i]
-            contador.mult_div += 1  # 1 división
-            
-            # A[j, i:] = A[j, i:] - m * A[i, i:]
-            for k in range(i, n):
-                contador.mult_div += 1      # 1 multiplicación
-                contador.sumas_restas += 1  # 1 resta
-                A[j, k] = A[j, k] - m * A[i, k]
-            
-            L[j, i] = m
-
-        logging.debug(f"Después de procesar columna {i}:\n{A}")
+        with inst.fase("eliminacion"):
+            # A[j, i+1:] = A[j, i+1:] - m_j * A[i, i+1:]  para j = i+1, ..., n-1;
+            # la columna i queda en cero sin calcularla
+            m = A[i + 1:, i] / A[i, i]
+            A[i + 1:, i + 1:] -= np.multiply.outer(m, A[i, i + 1:])
+            A[i + 1:, i] = 0
+            L[i + 1:, i] = m
+
+        if contar:
+            # por fila: 1 división + (n - i - 1) multiplicaciones y restas
+            filas = n - i - 1
+            contador.mult_div += filas * (n - i)
+            contador.sumas_restas += filas * (n - i - 1)
+
+        logging.debug("Después de procesar columna %d:\n%s", i, A)
+        inst.instantanea(f"columna {i}", A)
 
     if A[n - 1, n - 1] == 0:
         raise ValueError("No existe solución única.")
 
+    if contar:
+        inst.agregar_contador(contador)
     if contar_ops:
         return L, A, contador
     return L, A
 
 
+# ####################################################################
+TAM_CACHE_BYTES = 256 * 1024  # tamaño aproximado de la caché L2 por núcleo
+
+
+def _tam_bloque(n: int) -> int:
+    """Ancho de panel tal que un panel n-by-nb de float64 quepa en caché."""
+    nb = TAM_CACHE_BYTES // (8 * max(n, 1))
+    return int(min(max(nb, 16), 256))
+
+
+def _bufer_trabajo(n: int, nb: int, B: np.ndarray, trabajo: np.ndarray | None) -> np.ndarray:
+    """Búfer para la contribución de un bloque de filas: ``trabajo`` si se
+    da (al menos min(nb, n) filas y las columnas de ``B``), si no uno nuevo."""
+    filas = min(nb, n)
+    if trabajo is None:
+        return np.empty((filas,) + B.shape[1:], dtype=B.dtype)
+    assert trabajo.shape[0] >= filas and trabajo.shape[1:] == B.shape[1:] and trabajo.dtype == B.dtype, \
+        f"trabajo debe tener al menos {filas} filas, las columnas de B y su mismo tipo."
+    return trabajo
+
+
+def _sustitucion_adelante(
+    T: np.ndarray,
+    B: np.ndarray,
+    diagonal_unitaria: bool = False,
+    tam_bloque: int | None = None,
+    trabajo: np.ndarray | None = None,
+) -> np.ndarray:
+    """Resuelve en sitio T Y = B con la parte triangular inferior de ``T``.
+    ``B`` puede ser de tamaño (n,) o (n, k); las filas se procesan por bloques
+    para que la contribución de las filas ya resueltas sea un solo producto.
+    """
+    n = T.shape[0]
+    nb = tam_bloque if tam_bloque is not None else _tam_bloque(n)
+    trabajo = _bufer_trabajo(n, nb, B, trabajo)
+
+    for r0 in range(0, n, nb):
+        r1 = min(r0 + nb, n)
+        if r0 > 0:
+            w = trabajo[: r1 - r0]
+            np.matmul(T[r0:r1, :r0], B[:r0], out=w)
+            B[r0:r1] -= w
+        for i in range(r0, r1):
+            if i > r0:
+                B[i] -= T[i, r0:i] @ B[r0:i]
+            if not diagonal_unitaria:
+                B[i] /= T[i, i]
+    return B
+
+
+def _sustitucion_atras(
+    T: np.ndarray,
+    B: np.ndarray,
+    tam_bloque: int | None = None,
+    diagonal_unitaria: bool = False,
+    trabajo: np.ndarray | None = None,
+) -> np.ndarray:
+    """Resuelve en sitio T X = B con la parte triangular superior de ``T``.
+    ``B`` puede ser de tamaño (n,) o (n, k).
+    """
+    n = T.shape[0]
+    nb = tam_bloque if tam_bloque is not None else _tam_bloque(n)
+    trabajo = _bufer_trabajo(n, nb, B, trabajo)
+
+    for r1 in range(n, 0, -nb):
+        r0 = max(r1 - nb, 0)
+        if r1 < n:
+            w = trabajo[: r1 - r0]
+            np.matmul(T[r0:r1, r1:], B[r1:], out=w)
+            B[r0:r1] -= w
+        for i in range(r1 - 1, r0 - 1, -1):
+            if i < r1 - 1:
+                B[i] -= T[i, i + 1:r1] @ B[i + 1:r1]
+            if not diagonal_unitaria:
+                B[i] /= T[i, i]
+    return B
+
+
+def _contar_sustituciones(contador: ContadorOperaciones, n: int, k: int, diagonal_unitaria: bool) -> None:
+    """Por columna: n(n-1)/2 multiplicaciones y restas en cada sustitución,
+    n divisiones hacia atrás (y hacia adelante si L no es unitaria)."""
+    por_sustitucion = n * (n - 1) // 2
+    divisiones = n if diagonal_unitaria else 2 * n
+    contador.mult_div += k * (2 * por_sustitucion + divisiones)
+    contador.sumas_restas += k * 2 * por_sustitucion
+
+
 # ####################################################################
 def resolver_LU(
-    L: np.ndarray, 
-    U: np.ndarray, 
+    L: "np.ndarray | FactorLU", 
+    U: np.ndarray | None, 
     b: np.ndarray,
-    contar_ops: bool = False
+    contar_ops: bool = False,
+    out: np.ndarray | None = None,
+    instrumentacion: Instrumentacion | None = None,
+    trabajo: np.ndarray | None = None,
 ) -> tuple[np.ndarray, ContadorOperaciones] | np.ndarray:
     """Resuelve un sistema de ecuaciones lineales mediante la descomposición LU.
+    Todas las columnas de ``b`` se resuelven en un mismo barrido triangular.
 
     ## Parameters
-    ``L``: matriz triangular inferior.
-    ``U``: matriz triangular superior.
-    ``b``: vector de términos independientes.
+    ``L``: matriz triangular inferior (densa o MatrizBanda), o un FactorLU
+           (p. ej. de ``factorizar_LU_fuera_de_memoria``, cuyos factores pueden
+           estar en un ``np.memmap``); en ese caso ``U`` debe ser None.
+    ``U``: matriz triangular superior (densa o MatrizBanda).
+    ``b``: vector de términos independientes de tamaño (n,) o (n, 1), o matriz
+           de tamaño (n, k) con k lados derechos.
     ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``out``: (opcional) arreglo float64 con la forma de ``b`` (o (n, k)) donde
+             se escribe la solución. Puede ser el mismo ``b`` para resolver en sitio.
+    ``instrumentacion``: (opcional) objeto Instrumentacion.
+    ``trabajo``: (opcional) búfer float64 de tamaño (m, k), m >= ``_tam_bloque(n)``
+                 o m >= n, para reutilizarlo entre llamadas en lugar de crear
+                 uno en cada sustitución.
 
     ## Return
-    ``solucion``: vector con la solución del sistema de ecuaciones lineales.
+    ``solucion``: arreglo de tamaño (n, k) con la solución (k = 1 para un
+                  vector); si se dio ``out`` es una vista de ``out``.
     ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
     """
     contador = ContadorOperaciones()
-    n = L.shape[0]
+    inst = instrumentacion if instrumentacion is not None else SIN_INSTRUMENTACION
+    n = L.n if isinstance(L, FactorLU) else L.shape[0]
+
+    b = np.asarray(b, dtype=float)
+    assert b.shape[0] == n, "Las dimensiones de L y b no coinciden."
+    B = b.reshape(n, -1)
+    k = B.shape[1]
 
-    # --- Sustitución hacia adelante (Ly = b)
+    if out is None:
+        sol = B.copy()
+    else:
+        assert out.shape in (b.shape, B.shape) and out.dtype == np.float64, \
+            "out debe ser un arreglo float64 con la forma de b o (n, k)."
+        sol = out.reshape(B.shape)
+        assert np.shares_memory(sol, out), "out debe poder verse como (n, k) sin copiar."
+        np.copyto(sol, B)
+
+    if isinstance(L, MatrizBanda):
+        with inst.fase("sustitucion"):
+            sol[...] = resolver_banda(L, U, sol)
+        if contar_ops or inst.activo:
+            _contar_banda(contador, n, L.kl, U.ku, factorizar=False, columnas_b=k)
+            inst.agregar_contador(contador)
+        if contar_ops:
+            return sol, contador
+        return sol
+
+    if isinstance(L, FactorLU):
+        assert U is None, "Con un FactorLU, U debe ser None."
+        # L y U compactas en el mismo arreglo; se recorren por bloques de filas
+        sol[...] = sol[L.piv]
+        L = U = L.LU
+        diagonal_unitaria = True
+    else:
+        diagonal_unitaria = bool(np.all(np.diagonal(L) == 1))
+
+    # --- Sustitución hacia adelante (Ly = b), y se guarda en sol
     logging.debug("Sustitución hacia adelante")
-    y = np.zeros((n, 1), dtype=float)
-    y[0] = b[0] / L[0, 0]
-    contador.mult_div += 1  # 1 división
-
-    for i in range(1, n):
-        suma = 0
-        for j in range(i):
-            suma += L[i, j] * y[j]
-            contador.mult_div += 1      # 1 multiplicación
-            contador.sumas_restas += 1  # 1 suma
-        
-        y[i] = (b[i] - suma) / L[i, i]
-        contador.sumas_restas += 1  # 1 resta
-        contador.mult_div += 1      # 1 división
-
-    logging.debug(f"y = \n{y}")
+    with inst.fase("sustitucion_adelante"):
+        _sustitucion_adelante(L, sol, diagonal_unitaria=diagonal_unitaria, trabajo=trabajo)
 
     # --- Sustitución hacia atrás (Ux = y)
     logging.debug("Sustitución hacia atrás")
-    sol = np.zeros((n, 1), dtype=float)
-    sol[-1] = y[-1] / U[-1, -1]
-    contador.mult_div += 1  # 1 división
-
-    for i in range(n - 2, -1, -1):
-        suma = 0
-        for j in range(i + 1, n):
-            suma += U[i, j] * sol[j]
-            contador.mult_div += 1      # 1 multiplicación
-            contador.sumas_restas += 1  # 1 suma
-        
-        sol[i] = (y[i] - suma) / U[i, i]
-        contador.sumas_restas += 1  # 1 resta
-        contador.mult_div += 1      # 1 división
-
-    logging.debug(f"x = \n{sol}")
-    
+    with inst.fase("sustitucion_atras"):
+        _sustitucion_atras(U, sol, trabajo=trabajo)
+
+    if contar_ops or inst.activo:
+        _contar_sustituciones(contador, n, k, diagonal_unitaria)
+        inst.agregar_contador(contador)
     if contar_ops:
         return sol, contador
     return sol
 
 
+# ####################################################################
+class FactorLU:
+    """Factorización PA = LU compacta.
+
+    ``L`` (diagonal unitaria implícita) y ``U`` se almacenan en un único
+    arreglo n-by-n. ``piv`` es el vector de permutación: la fila ``i`` de PA
+    es la fila ``piv[i]`` de A.
+    """
+    def __init__(self, LU: np.ndarray, piv: np.ndarray, intercambios: int = 0):
+        self.LU = LU
+        self.piv = piv
+        self.intercambios = intercambios
+
+    @property
+    def n(self) -> int:
+        return self.LU.shape[0]
+
+    @property
+    def L(self) -> np.ndarray:
+        """Matriz triangular inferior con diagonal unitaria (copia densa)."""
+        return np.tril(self.LU, -1) + np.eye(self.n)
+
+    @property
+    def U(self) -> np.ndarray:
+        """Matriz triangular superior (copia densa)."""
+        return np.triu(self.LU)
+
+    @property
+    def P(self) -> np.ndarray:
+        """Matriz de permutación tal que PA = LU (copia densa)."""
+        return np.eye(self.n)[self.piv]
+
+    def resolver(
+        self,
+        b: np.ndarray,
+        out: np.ndarray | None = None,
+        trabajo: np.ndarray | None = None,
+        contar_ops: bool = False,
+    ) -> tuple[np.ndarray, "ContadorOperaciones"] | np.ndarray:
+        """Resuelve Ax = b. ``b`` puede ser de tamaño (n,) o (n, k).
+        Se resuelve con la precisión de los factores (float64 o float32).
+        Si se da ``out`` (mismo tipo y forma que ``b``) la solución se escribe ahí;
+        ``trabajo`` es el búfer reutilizable de ``resolver_LU``. Con
+        ``contar_ops`` retorna también el conteo de las sustituciones.
+        """
+        b = np.asarray(b, dtype=self.LU.dtype)
+        x = np.empty_like(b) if out is None else out
+        np.take(b, self.piv, axis=0, out=x)
+        _sustitucion_adelante(self.LU, x, diagonal_unitaria=True, trabajo=trabajo)
+        _sustitucion_atras(self.LU, x, trabajo=trabajo)
+        if contar_ops:
+            contador = ContadorOperaciones()
+            _contar_sustituciones(contador, self.n, 1 if x.ndim == 1 else x.shape[1], True)
+            return x, contador
+        return x
+
+    def __repr__(self):
+        return f"FactorLU(n={self.n}, intercambios={self.intercambios})"
+
+
+def factorizar_LU(
+    A: np.ndarray | list[list[float | int]],
+    tam_bloque: int | None = None,
+    sobrescribir: bool = False,
+    contar_ops: bool = False,
+    instrumentacion: Instrumentacion | None = None,
+    dtype: type = np.float64,
+) -> tuple[FactorLU, ContadorOperaciones] | FactorLU:
+    """Descomposición LU por bloques (right-looking) con pivoteo parcial.
+
+    Cada panel de ``tam_bloque`` columnas se factoriza columna a columna; luego
+    se actualiza el bloque U12 y el resto de la matriz con un solo producto
+    matricial, de modo que el trabajo dominante ocurre sobre datos en caché.
+
+    ## Parameters
+    ``A``: matriz cuadrada de tamaño n-by-n.
+    ``tam_bloque``: ancho del panel. Si es None se elige según ``TAM_CACHE_BYTES``.
+    ``sobrescribir``: si True y ``A`` ya es un arreglo de tipo ``dtype``, se
+                      factoriza en sitio sin copiar.
+    ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``instrumentacion``: (opcional) objeto Instrumentacion.
+    ``dtype``: precisión de la factorización (np.float64 o np.float32).
+
+    ## Return
+    ``factor``: objeto FactorLU con L y U compactas y el vector de permutación.
+    ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
+    """
+    contador = ContadorOperaciones()
+    inst = instrumentacion if instrumentacion is not None else SIN_INSTRUMENTACION
+
+    if sobrescribir and isinstance(A, np.ndarray) and A.dtype == dtype:
+        LU = A
+    else:
+        LU = np.array(A, dtype=dtype)
+    assert LU.ndim == 2 and LU.shape[0] == LU.shape[1], "La matriz A debe ser cuadrada."
+    n = LU.shape[0]
+    nb = tam_bloque if tam_bloque is not None else _tam_bloque(n)
+    assert nb >= 1, "El tamaño de bloque debe ser positivo."
+
+    piv = np.arange(n)
+
+    for k0 in range(0, n, nb):
+        k1 = min(k0 + nb, n)
+
+        # --- factorización del panel LU[k0:, k0:k1]
+        for j in range(k0, k1):
+            with inst.fase("busqueda_pivote"):
+                p = j + int(np.argmax(np.abs(LU[j:, j])))
+                if LU[p, j] == 0:
+                    raise ValueError("No existe solución única.")
+
+                if p != j:
+                    LU[[j, p], :] = LU[[p, j], :]
+                    piv[[j, p]] = piv[[p, j]]
+                    contador.intercambios += 1
+
+            with inst.fase("eliminacion"):
+                LU[j + 1:, j] /= LU[j, j]
+                LU[j + 1:, j + 1:k1] -= np.multiply.outer(LU[j + 1:, j], LU[j, j + 1:k1])
+
+        if k1 < n:
+            with inst.fase("actualizacion_bloque"):
+                # --- U12 = L11^{-1} A12
+                for j in range(k0, k1 - 1):
+                    LU[j + 1:k1, k1:] -= np.multiply.outer(LU[j + 1:k1, j], LU[j, k1:])
+
+                # --- actualización del complemento de Schur: A22 -= L21 U12
+                LU[k1:, k1:] -= LU[k1:, k0:k1] @ LU[k0:k1, k1:]
+
+        inst.instantanea(f"panel {k0}:{k1}", LU)
+
+    if contar_ops or inst.activo:
+        # el orden por bloques no cambia el número de operaciones:
+        # por columna i, (n-i-1) divisiones y (n-i-1)² multiplicaciones y restas
+        contador.mult_div += (n**3 - n) // 3
+        contador.sumas_restas += (n - 1) * n * (2 * n - 1) // 6
+        inst.agregar_contador(contador)
+
+    factor = FactorLU(LU, piv, contador.intercambios)
+    if contar_ops:
+        return factor, contador
+    return factor
+
+
+# ####################################################################
+class FactorCholesky:
+    """Factorización A = G Gᵀ de una matriz simétrica definida positiva.
+    ``G`` (triangular inferior) ocupa el triángulo inferior de ``datos``; el
+    triángulo superior no se usa.
+    """
+    def __init__(self, datos: np.ndarray):
+        self.datos = datos
+
+    @property
+    def n(self) -> int:
+        return self.datos.shape[0]
+
+    @property
+    def G(self) -> np.ndarray:
+        """Matriz triangular inferior G (copia densa)."""
+        return np.tril(self.datos)
+
+    def resolver(self, b: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Resuelve Ax = b con G y = b, Gᵀ x = y. ``b`` de tamaño (n,) o (n, k)."""
+        b = np.asarray(b, dtype=self.datos.dtype)
+        x = np.array(b) if out is None else out
+        if out is not None:
+            np.copyto(x, b)
+        _sustitucion_adelante(self.datos, x)
+        _sustitucion_atras(self.datos.T, x)
+        return x
+
+    def __repr__(self):
+        return f"FactorCholesky(n={self.n})"
+
+
+class FactorLDLt:
+    """Factorización A = L D Lᵀ de una matriz simétrica. ``L`` (diagonal
+    unitaria implícita) ocupa el triángulo estrictamente inferior de ``datos``
+    y ``D`` su diagonal; el triángulo superior no se usa.
+    """
+    def __init__(self, datos: np.ndarray):
+        self.datos = datos
+
+    @property
+    def n(self) -> int:
+        return self.datos.shape[0]
+
+    @property
+    def L(self) -> np.ndarray:
+        """Matriz triangular inferior con diagonal unitaria (copia densa)."""
+        return np.tril(self.datos, -1) + np.eye(self.n)
+
+    @property
+    def D(self) -> np.ndarray:
+        """Vector con la diagonal de D."""
+        return np.diagonal(self.datos).copy()
+
+    def resolver(self, b: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Resuelve Ax = b con L y = b, D z = y, Lᵀ x = z. ``b`` de tamaño (n,) o (n, k)."""
+        b = np.asarray(b, dtype=self.datos.dtype)
+        x = np.array(b) if out is None else out
+        if out is not None:
+            np.copyto(x, b)
+        _sustitucion_adelante(self.datos, x, diagonal_unitaria=True)
+        x /= np.diagonal(self.datos).reshape((-1,) + (1,) * (x.ndim - 1))
+        _sustitucion_atras(self.datos.T, x, diagonal_unitaria=True)
+        return x
+
+    def __repr__(self):
+        return f"FactorLDLt(n={self.n})"
+
+
+def _factorizar_simetrica(
+    A, tam_bloque, sobrescribir, contar_ops, instrumentacion, ldlt: bool
+):
+    """Factorización por bloques (right-looking) sobre el triángulo inferior.
+    Dentro de cada panel se procesa columna a columna (left-looking); el resto
+    del triángulo inferior se actualiza por bloques de columnas, de modo que
+    solo se calcula la mitad del complemento de Schur."""
+    contador = ContadorOperaciones()
+    inst = instrumentacion if instrumentacion is not None else SIN_INSTRUMENTACION
+
+    if sobrescribir and isinstance(A, np.ndarray) and A.dtype == np.float64:
+        M = A
+    else:
+        M = np.array(A, dtype=float)
+    assert M.ndim == 2 and M.shape[0] == M.shape[1], "La matriz A debe ser cuadrada."
+    n = M.shape[0]
+    nb = tam_bloque if tam_bloque is not None else _tam_bloque(n)
+    assert nb >= 1, "El tamaño de bloque debe ser positivo."
+
+    for k0 in range(0, n, nb):
+        k1 = min(k0 + nb, n)
+
+        # --- factorización del panel M[k0:, k0:k1]
+        with inst.fase("eliminacion"):
+            for j in range(k0, k1):
+                if j > k0:
+                    fila = M[j, k0:j] * np.diagonal(M)[k0:j] if ldlt else M[j, k0:j]
+                    M[j:, j] -= M[j:, k0:j] @ fila
+                if ldlt:
+                    if M[j, j] == 0:
+                        raise ValueError("No existe solución única.")
+                else:
+                    if not M[j, j] > 0:
+                        raise ValueError("La matriz no es definida positiva.")
+                    M[j, j] = np.sqrt(M[j, j])
+                M[j + 1:, j] /= M[j, j]
+
+        # --- actualización del triángulo inferior restante: A22 -= L21 W21ᵀ
+        if k1 < n:
+            with inst.fase("actualizacion_bloque"):
+                L21 = M[k1:, k0:k1]
+                W21 = L21 * np.diagonal(M)[k0:k1] if ldlt else L21
+                for j0 in range(k1, n, nb):
+                    j1 = min(j0 + nb, n)
+                    W = W21[j0 - k1:j1 - k1].T
+                    M[j0:j1, j0:j1] -= np.tril(L21[j0 - k1:j1 - k1] @ W)
+                    M[j1:, j0:j1] -= L21[j1 - k1:] @ W
+
+        inst.instantanea(f"panel {k0}:{k1}", M)
+
+    if contar_ops or inst.activo:
+        # por columna j: (n-j)·j productos y restas, (n-j-1) divisiones;
+        # LDLᵀ además escala la fila j por D (j productos)
+        contador.mult_div += (n**3 - n) // 6 + n * (n - 1) // 2
+        contador.sumas_restas += (n**3 - n) // 6
+        if ldlt:
+            contador.mult_div += n * (n - 1) // 2
+        inst.agregar_contador(contador)
+
+    factor = FactorLDLt(M) if ldlt else FactorCholesky(M)
+    if contar_ops:
+        return factor, contador
+    return factor
+
+
+def factorizar_cholesky(
+    A: np.ndarray | list[list[float | int]],
+    tam_bloque: int | None = None,
+    sobrescribir: bool = False,
+    contar_ops: bool = False,
+    instrumentacion: Instrumentacion | None = None,
+) -> tuple[FactorCholesky, ContadorOperaciones] | FactorCholesky:
+    """Factorización de Cholesky por bloques, A = G Gᵀ.
+    Solo se lee y escribe el triángulo inferior de ``A``; cuesta la mitad de
+    operaciones que LU y no requiere pivoteo.
+
+    ## Parameters
+    ``A``: matriz simétrica definida positiva de tamaño n-by-n.
+    ``tam_bloque``: ancho del panel. Si es None se elige según ``TAM_CACHE_BYTES``.
+    ``sobrescribir``: si True y ``A`` ya es un arreglo float64, G se escribe en
+                      el triángulo inferior de ``A`` sin copiar.
+    ``contar_ops``: si True, retorna también un contador de operaciones
+                    (las n raíces cuadradas no se cuentan).
+    ``instrumentacion``: (opcional) objeto Instrumentacion.
+
+    ## Return
+    ``factor``: objeto FactorCholesky.
+    ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
+    """
+    return _factorizar_simetrica(A, tam_bloque, sobrescribir, contar_ops, instrumentacion, ldlt=False)
+
+
+def factorizar_LDLt(
+    A: np.ndarray | list[list[float | int]],
+    tam_bloque: int | None = None,
+    sobrescribir: bool = False,
+    contar_ops: bool = False,
+    instrumentacion: Instrumentacion | None = None,
+) -> tuple[FactorLDLt, ContadorOperaciones] | FactorLDLt:
+    """Factorización LDLᵀ por bloques de una matriz simétrica, sin raíces
+    cuadradas. Solo se usa el triángulo inferior de ``A``.
+    [IMPORTANTE] No se realiza pivoteo; se asume definida positiva (o con
+    todos los menores principales no nulos).
+
+    ## Parameters
+    ``A``: matriz simétrica de tamaño n-by-n.
+    ``tam_bloque``: ancho del panel. Si es None se elige según ``TAM_CACHE_BYTES``.
+    ``sobrescribir``: si True y ``A`` ya es un arreglo float64, L y D se
+                      escriben en el triángulo inferior de ``A`` sin copiar.
+    ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``instrumentacion``: (opcional) objeto Instrumentacion.
+
+    ## Return
+    ``factor``: objeto FactorLDLt.
+    ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
+    """
+    return _factorizar_simetrica(A, tam_bloque, sobrescribir, contar_ops, instrumentacion, ldlt=True)
+
+
+def resolver_cholesky(
+    factor: FactorCholesky | FactorLDLt,
+    b: np.ndarray,
+    contar_ops: bool = False,
+    out: np.ndarray | None = None,
+) -> tuple[np.ndarray, ContadorOperaciones] | np.ndarray:
+    """Resuelve Ax = b con un FactorCholesky o FactorLDLt.
+
+    ## Parameters
+    ``factor``: resultado de ``factorizar_cholesky`` o ``factorizar_LDLt``.
+    ``b``: términos independientes de tamaño (n,) o (n, k).
+    ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``out``: (opcional) arreglo float64 con la forma de ``b`` para la solución.
+
+    ## Return
+    ``solucion``: arreglo con la forma de ``b``.
+    ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
+    """
+    x = factor.resolver(b, out=out)
+    if not contar_ops:
+        return x
+    n = factor.n
+    k = 1 if x.ndim == 1 else x.shape[1]
+    contador = ContadorOperaciones()
+    # dos sustituciones de n(n-1)/2 productos y restas, más n divisiones cada
+    # una (Cholesky) o n divisiones por D (LDLᵀ)
+    divisiones = 2 * n if isinstance(factor, FactorCholesky) else n
+    contador.mult_div += k * (n * (n - 1) + divisiones)
+    contador.sumas_restas += k * n * (n - 1)
+    return x, contador
+
+
 # ####################################################################
 def gauss_jordan(
     A: np.ndarray | list[list[float | int]], 
-    contar_ops: bool = False
+    contar_ops: bool = False,
+    instrumentacion: Instrumentacion | None = None,
 ) -> tuple[np.ndarray, ContadorOperaciones] | np.ndarray:
     """Resuelve un sistema de ecuaciones lineales mediante Gauss-Jordan.
 
@@ -261,12 +803,15 @@ def gauss_jordan(
     ``A``: matriz aumentada del sistema de ecuaciones lineales. 
            Debe ser de tamaño n-by-(n+1).
     ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``instrumentacion``: (opcional) objeto Instrumentacion.
 
     ## Return
     ``solucion``: vector con la solución del sistema de ecuaciones lineales.
     ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
     """
     contador = ContadorOperaciones()
+    inst = instrumentacion if instrumentacion is not None else SIN_INSTRUMENTACION
+    contar = contar_ops or inst.activo
     
     if not isinstance(A, np.ndarray):
         A = np.array(A, dtype=float)
@@ -278,42 +823,37 @@ def gauss_jordan(
 
     # Fase de eliminación (hacia adelante y hacia atrás)
     for i in range(n):
-        # Buscar pivote
-        p = None
-        for pi in range(i, n):
-            if A[pi, i] == 0:
-                continue
-            if p is None:
-                p = pi
-                continue
-            if abs(A[pi, i]) > abs(A[p, i]):
-                p = pi
-
-        if p is None:
-            raise ValueError("No existe solución única.")
-
-        if p != i:
-            _aux = A[i, :].copy()
-            A[i, :] = A[p, :].copy()
-            A[p, :] = _aux
-            contador.intercambios += 1
-
-        # Normalizar fila pivote
-        pivot = A[i, i]
-        for k in range(i, n + 1):
-            A[i, k] = A[i, k] / pivot
-            contador.mult_div += 1
-        
-        # Eliminar en todas las demás filas (no solo hacia abajo)
-        for j in range(n):
-            if j == i:
-                continue
-            
-            m = A[j, i]
-            for k in range(i, n + 1):
-                contador.mult_div += 1      # 1 multiplicación
-                contador.sumas_restas += 1  # 1 resta
-                A[j, k] = A[j, k] - m * A[i, k]
+        # Buscar pivote (el mayor en valor absoluto)
+        with inst.fase("busqueda_pivote"):
+            p = i + int(np.argmax(np.abs(A[i:, i])))
+            if A[p, i] == 0:
+                raise ValueError("No existe solución única.")
+
+            if p != i:
+                A[[i, p], :] = A[[p, i], :]
+                contador.intercambios += 1
+
+        with inst.fase("eliminacion"):
+            # Normalizar fila pivote (la columna i queda en 1 sin calcularla)
+            A[i, i + 1:] /= A[i, i]
+            A[i, i] = 1
+
+            # Eliminar en todas las demás filas (no solo hacia abajo)
+            otras = np.r_[0:i, i + 1:n]
+            A[otras, i + 1:] -= np.multiply.outer(A[otras, i], A[i, i + 1:])
+            A[otras, i] = 0
+
+        if contar:
+            # normalización: (n - i) divisiones
+            # por cada una de las (n - 1) filas restantes: (n - i) mult. y restas
+            columnas = n - i
+            contador.mult_div += columnas * n
+            contador.sumas_restas += columnas * (n - 1)
+
+        inst.instantanea(f"columna {i}", A)
+
+    if contar:
+        inst.agregar_contador(contador)
 
     solucion = A[:, n]
     
@@ -323,23 +863,115 @@ def gauss_jordan(
 
 
 # ####################################################################
-def matriz_aumentada(A: np.ndarray, b: np.ndarray) -> np.ndarray:
-    """Construye la matriz aumentada de un sistema de ecuaciones lineales."""
+def eliminacion_gaussiana_lote(
+    Ab: np.ndarray,
+    tol: float | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Resuelve un lote de sistemas independientes mediante eliminación gaussiana
+    con pivoteo parcial. La búsqueda de pivote, el intercambio de filas y la
+    eliminación se aplican a todo el lote a la vez.
+
+    Por defecto un sistema se considera singular si algún pivote es menor o
+    igual a ``n * eps * max|A|`` (umbral relativo a cada sistema) o si su
+    número de condición es al menos ``1 / (n * eps)``. La condición se acota por
+    debajo con ||A||∞ ||x||∞ / ||b||∞, resolviendo además del lado derecho dado
+    uno de ±1, de modo que no depende de que ``b`` esté en la imagen de A.
+
+    ## Parameters
+    ``Ab``: arreglo de matrices aumentadas de tamaño (lote, n, n+1).
+    ``tol``: (opcional) umbral absoluto: un pivote con valor absoluto menor o
+             igual a ``tol`` se considera nulo, sin la prueba de condición.
+
+    ## Return
+    ``soluciones``: arreglo de tamaño (lote, n). Las filas de los sistemas
+                    singulares se llenan con NaN.
+    ``singulares``: arreglo booleano de tamaño (lote,), True si el sistema no
+                    tiene solución única (numéricamente).
+    """
+    Ab = np.asarray(Ab, dtype=float)
+    assert Ab.ndim == 3 and Ab.shape[1] == Ab.shape[2] - 1, \
+        "Ab debe ser de tamaño (lote, n, n+1)."
+    lote, n, _ = Ab.shape
+    relativo = tol is None
+    eps = np.finfo(float).eps
+
+    # columna extra de ±1 para estimar la condición
+    extra = 1 if relativo else 0
+    M = np.empty((lote, n, n + 1 + extra))
+    M[:, :, :n + 1] = Ab
+    if relativo:
+        M[:, :, n + 1] = np.where(np.arange(n) % 2 == 0, 1.0, -1.0)
+        norma_A = np.max(np.sum(np.abs(Ab[:, :, :n]), axis=2), axis=1, initial=0.0)
+        umbral = n * eps * np.max(np.abs(Ab[:, :, :n]), axis=(1, 2), initial=0.0)
+    else:
+        umbral = tol
+
+    idx = np.arange(lote)
+    singulares = np.zeros(lote, dtype=bool)
+
+    for i in range(n):
+        # --- pivote: el mayor en valor absoluto de la columna i de cada sistema
+        p = i + np.argmax(np.abs(M[:, i:, i]), axis=1)
+        fila_p = M[idx, p].copy()
+        M[idx, p] = M[:, i]
+        M[:, i] = fila_p
+
+        nulo = np.abs(M[:, i, i]) <= umbral
+        singulares |= nulo
+        # los sistemas singulares se siguen procesando con pivote 1 para no
+        # romper el lote; su resultado se descarta al final
+        M[nulo, i, i] = 1.0
+
+        # --- eliminación debajo del pivote
+        m = M[:, i + 1:, i] / M[:, i, i, None]
+        M[:, i + 1:, i + 1:] -= m[:, :, None] * M[:, i, None, i + 1:]
+        M[:, i + 1:, i] = 0
+
+    # --- sustitución hacia atrás (todas las columnas de lado derecho a la vez)
+    X = np.zeros((lote, n, 1 + extra))
+    for i in range(n - 1, -1, -1):
+        suma = np.einsum("bj,bjk->bk", M[:, i, i + 1:n], X[:, i + 1:])
+        X[:, i] = (M[:, i, n:] - suma) / M[:, i, i, None]
+
+    if relativo:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            norma_b = np.max(np.abs(Ab[:, :, n]), axis=1, initial=0.0)
+            cota_b = np.where(norma_b > 0, np.max(np.abs(X[:, :, 0]), axis=1, initial=0.0) / norma_b, 0.0)
+            cota_e = np.max(np.abs(X[:, :, 1]), axis=1, initial=0.0)
+            condicion = norma_A * np.maximum(cota_b, cota_e)
+        singulares |= ~(condicion * n * eps < 1)
+
+    soluciones = X[:, :, 0]
+    soluciones[singulares] = np.nan
+    return soluciones, singulares
+
+
+# ####################################################################
+def matriz_aumentada(
+    A: np.ndarray, b: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Construye la matriz aumentada de un sistema de ecuaciones lineales.
+    También acepta lotes: ``A`` de tamaño (lote, n, n) y ``b`` de tamaño
+    (lote, n). Si se da ``out`` se escribe ahí sin crear arreglos nuevos."""
     if not isinstance(A, np.ndarray):
         A = np.array(A, dtype=float)
     if not isinstance(b, np.ndarray):
         b = np.array(b, dtype=float)
-    assert A.shape[0] == b.shape[0], "Las dimensiones de A y b no coinciden."
-    return np.hstack((A, b.reshape(-1, 1)))
+    b = b.reshape(A.shape[:-1])
+    assert A.shape[-2] == b.shape[-1], "Las dimensiones de A y b no coinciden."
+    if out is None:
+        out = np.empty(A.shape[:-1] + (A.shape[-1] + 1,), dtype=np.result_type(A, b))
+    out[..., :-1] = A
+    out[..., -1] = b
+    return out
 
 
 def separar_m_aumentada(Ab: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-    """Separa la matriz aumentada en A y b."""
+    """Separa la matriz aumentada en A y b (vistas, sin copiar).
+    También acepta lotes de tamaño (lote, n, n+1)."""
     if not isinstance(Ab, np.ndarray):
         Ab = np.array(Ab, dtype=float)
-    return Ab[:, :-1], Ab[:, -1].reshape(-1, 1)
-
-
+    return Ab[..., :-1], Ab[..., -1:]
 
 
 def complejidad_teorica_gauss(n: int) -> dict:
@@ -353,16 +985,19 @@ def complejidad_teorica_gauss(n: int) -> dict:
     sumas_restas = (n**3)/3 - n/3 + (n**2)/2 - n/2
     
     return {
-        'mult_div': int(mult_div),
-        'sumas_restas': int(sumas_restas)
+        'mult_div': round(mult_div),
+        'sumas_restas': round(sumas_restas)
     }
 
 
 def complejidad_teorica_gauss_jordan(n: int) -> dict:
-    """Retorna la complejidad teórica del método de Gauss-Jordan."""
+    """Retorna la complejidad teórica del método de Gauss-Jordan (con
+    normalización de la fila pivote, como en ``gauss_jordan``)."""
     # Gauss-Jordan tiene mayor complejidad: aproximadamente n³/2 para mult/div
-    mult_div = (n**3)/2 + (n**2)/2 - n/2
-    sumas_restas = (n**3)/2 - (n**2)/2
+    # Normalización: n(n+1)/2 divisiones
+    # Eliminación: (n-1) n(n+1)/2 multiplicaciones y restas
+    mult_div = n * n * (n + 1) // 2
+    sumas_restas = (n - 1) * n * (n + 1) // 2
     
     return {
         'mult_div': int(mult_div),
@@ -372,11 +1007,12 @@ def complejidad_teorica_gauss_jordan(n: int) -> dict:
 
 def complejidad_teorica_LU(n: int) -> dict:
     """Retorna la complejidad teórica de la descomposición LU."""
-    # Descomposición: n³/3 - n/3 operaciones
-    # Resolución (2 sustituciones): n²
+    # Descomposición: n³/3 - n/3 mult/div, n³/3 - n²/2 + n/6 sumas/restas
+    # Resolución (2 sustituciones, L con diagonal unitaria): n² mult/div,
+    #                                                        n² - n sumas/restas
     
-    descomp_mult_div = (n**3)/3 - n/3
-    descomp_sumas_restas = (n**3)/3 - n/3
+    descomp_mult_div = (n**3 - n) // 3
+    descomp_sumas_restas = (n - 1) * n * (2 * n - 1) // 6
     
     resolucion_mult_div = n**2
     resolucion_sumas_restas = n**2 - n
@@ -394,4 +1030,58 @@ def complejidad_teorica_LU(n: int) -> dict:
             'mult_div': int(descomp_mult_div + resolucion_mult_div),
             'sumas_restas': int(descomp_sumas_restas + resolucion_sumas_restas)
         }
-    }
\ No newline at end of file
+    }
+
+
+def complejidad_teorica_cholesky(n: int) -> dict:
+    """Retorna la complejidad teórica de la factorización de Cholesky
+    (sin contar las n raíces cuadradas). Es aproximadamente la mitad de
+    ``complejidad_teorica_LU``."""
+    # Factorización: n³/6 + n²/2 - 2n/3 mult/div, n³/6 - n/6 sumas/restas
+    # Resolución (2 sustituciones): n² + n mult/div, n² - n sumas/restas
+    descomp_mult_div = (n**3 - n) // 6 + n * (n - 1) // 2
+    descomp_sumas_restas = (n**3 - n) // 6
+
+    resolucion_mult_div = n**2 + n
+    resolucion_sumas_restas = n**2 - n
+
+    return {
+        'descomposicion': {
+            'mult_div': descomp_mult_div,
+            'sumas_restas': descomp_sumas_restas
+        },
+        'resolucion': {
+            'mult_div': resolucion_mult_div,
+            'sumas_restas': resolucion_sumas_restas
+        },
+        'total': {
+            'mult_div': descomp_mult_div + resolucion_mult_div,
+            'sumas_restas': descomp_sumas_restas + resolucion_sumas_restas
+        }
+    }
+
+
+def complejidad_teorica_LDLt(n: int) -> dict:
+    """Retorna la complejidad teórica de la factorización LDLᵀ."""
+    # Factorización: n³/6 + n² - 7n/6 mult/div, n³/6 - n/6 sumas/restas
+    # Resolución: n² mult/div (incluye D), n² - n sumas/restas
+    descomp_mult_div = (n**3 - n) // 6 + n * (n - 1)
+    descomp_sumas_restas = (n**3 - n) // 6
+
+    resolucion_mult_div = n**2
+    resolucion_sumas_restas = n**2 - n
+
+    return {
+        'descomposicion': {
+            'mult_div': descomp_mult_div,
+            'sumas_restas': descomp_sumas_restas
+        },
+        'resolucion': {
+            'mult_div': resolucion_mult_div,
+            'sumas_restas': resolucion_sumas_restas
+        },
+        'total': {
+            'mult_div': descomp_mult_div + resolucion_mult_div,
+            'sumas_restas': descomp_sumas_restas + resolucion_sumas_restas
+        }
+    }
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Descomposición LU fuera de memoria (out-of-core) para matrices guardadas en
+disco como ``np.memmap``. La matriz se procesa por paneles de columnas
+(left-looking): en memoria hay dos paneles a la vez, más los temporales de
+los productos matriciales (a lo sumo otro panel), y los factores se escriben
+en un arreglo respaldado por archivo.
+"""
+
+import logging
+
+import numpy as np
+
+from instrumentacion import Instrumentacion, SIN_INSTRUMENTACION
+from linear_sist_methods import ContadorOperaciones, FactorLU, _sustitucion_adelante
+
+
+MEMORIA_TRABAJO_BYTES = 1024**3  # memoria para los paneles en RAM
+PANELES_EN_MEMORIA = 3  # panel actual, panel de lectura y temporales de los productos
+
+
+# ####################################################################
+def _lu_panel(P: np.ndarray, r0: int, c0: int, c1: int, piv: np.ndarray, minimo: int = 32) -> int:
+    """Factoriza en sitio P[r0:, c0:c1] con pivoteo parcial, de forma recursiva
+    (la mitad derecha se actualiza con un producto matricial). Los intercambios
+    se aplican a las filas completas de ``P`` y a ``piv``.
+    Retorna el número de intercambios."""
+    intercambios = 0
+    if c1 - c0 <= minimo:
+        for j in range(c0, c1):
+            r = r0 + j - c0
+            p = r + int(np.argmax(np.abs(P[r:, j])))
+            if P[p, j] == 0:
+                raise ValueError("No existe solución única.")
+            if p != r:
+                P[[r, p], :] = P[[p, r], :]
+                piv[[r, p]] = piv[[p, r]]
+                intercambios += 1
+            P[r + 1:, j] /= P[r, j]
+            P[r + 1:, j + 1:c1] -= np.multiply.outer(P[r + 1:, j], P[r, j + 1:c1])
+        return intercambios
+
+    h = (c1 - c0) // 2
+    m = c0 + h
+    intercambios += _lu_panel(P, r0, c0, m, piv, minimo)
+    # U12 = L11^{-1} A12 y A22 -= L21 U12
+    _sustitucion_adelante(P[r0:r0 + h, c0:m], P[r0:r0 + h, m:c1], diagonal_unitaria=True)
+    P[r0 + h:, m:c1] -= P[r0 + h:, c0:m] @ P[r0:r0 + h, m:c1]
+    intercambios += _lu_panel(P, r0 + h, m, c1, piv, minimo)
+    return intercambios
+
+
+def _abrir_salida(A: np.ndarray, salida) -> np.ndarray:
+    if salida is None:
+        assert A.dtype == np.float64 and A.flags.writeable, \
+            "Para factorizar en sitio A debe ser float64 y escribible."
+        return A
+    if isinstance(salida, str):
+        return np.lib.format.open_memmap(salida, mode="w+", dtype=np.float64, shape=A.shape)
+    assert salida.shape == A.shape and salida.dtype == np.float64, \
+        "salida debe ser un arreglo float64 del mismo tamaño que A."
+    return salida
+
+
+# ####################################################################
+def factorizar_LU_fuera_de_memoria(
+    A: np.ndarray | str,
+    salida: np.ndarray | str | None = None,
+    memoria_trabajo: int = MEMORIA_TRABAJO_BYTES,
+    tam_bloque: int | None = None,
+    contar_ops: bool = False,
+    instrumentacion: Instrumentacion | None = None,
+) -> tuple[FactorLU, ContadorOperaciones] | FactorLU:
+    """Descomposición PA = LU con pivoteo parcial de una matriz en disco.
+
+    Para cada panel de columnas J: se lee de ``A`` con los intercambios de filas
+    acumulados, se le aplican las actualizaciones de los paneles ya
+    factorizados (leídos uno a uno desde ``salida``), se factoriza en memoria y
+    se escribe en ``salida``. Los intercambios de los paneles posteriores se
+    aplican a las filas de L de los anteriores en una pasada final.
+
+    ## Parameters
+    ``A``: matriz cuadrada n-by-n, normalmente un ``np.memmap``, o la ruta a un
+           archivo ``.npy`` (se abre en modo de solo lectura).
+    ``salida``: dónde se escriben los factores compactos: None para
+                sobrescribir ``A`` (debe ser float64 y escribible), la ruta de
+                un ``.npy`` nuevo o un arreglo float64 n-by-n (p. ej. un memmap).
+    ``memoria_trabajo``: bytes disponibles para los paneles en memoria
+                         (``PANELES_EN_MEMORIA`` paneles n-by-nb en el pico);
+                         determina el ancho del panel.
+    ``tam_bloque``: (opcional) ancho del panel; tiene prioridad sobre
+                    ``memoria_trabajo``.
+    ``contar_ops``: si True, retorna también un contador de operaciones.
+    ``instrumentacion``: (opcional) objeto Instrumentacion.
+
+    ## Return
+    ``factor``: FactorLU cuyo arreglo ``LU`` es ``salida``; se puede resolver con
+                ``factor.resolver(b)`` o ``resolver_LU(factor, None, b)``.
+    ``contador``: (opcional) objeto ContadorOperaciones con el conteo de operaciones.
+    """
+    contador = ContadorOperaciones()
+    inst = instrumentacion if instrumentacion is not None else SIN_INSTRUMENTACION
+
+    if isinstance(A, str):
+        A = np.load(A, mmap_mode="r")
+    assert A.ndim == 2 and A.shape[0] == A.shape[1], "La matriz A debe ser cuadrada."
+    n = A.shape[0]
+    LU = _abrir_salida(A, salida)
+
+    nb = tam_bloque if tam_bloque is not None else memoria_trabajo // (PANELES_EN_MEMORIA * 8 * max(n, 1))
+    nb = int(min(max(nb, 1), n))
+    logging.info(f"LU fuera de memoria: n = {n}, paneles de {nb} columnas.")
+
+    # dos paneles n-by-nb reutilizados: el panel actual y uno de lectura
+    panel = np.empty((n, nb), dtype=float)
+    lectura = np.empty((n, nb), dtype=float)
+
+    piv = np.arange(n)
+    inversas = []  # inversa de la permutación con la que se guardó cada panel
+    for c0 in range(0, n, nb):
+        c1 = min(c0 + nb, n)
+        w = c1 - c0
+        P = panel[:, :w]
+
+        # --- lectura del panel con el orden de filas actual
+        with inst.fase("lectura"):
+            lectura[:, :w] = A[:, c0:c1]
+            np.take(lectura[:, :w], piv, axis=0, out=P, mode="clip")
+
+        # --- actualización con los paneles anteriores
+        for k, k0 in enumerate(range(0, c0, nb)):
+            k1 = min(k0 + nb, n)
+            with inst.fase("lectura"):
+                LK = lectura[k0:, :k1 - k0]
+                # filas guardadas con la permutación de su panel -> orden actual;
+                # se leen ya permutadas, sin un tercer arreglo n-by-nb
+                # (con out y mode="raise" np.take usa un búfer temporal)
+                orden = inversas[k][piv[k0:]] - k0
+                if np.any(orden != np.arange(n - k0)):
+                    np.take(LU[k0:, k0:k1], orden, axis=0, out=LK, mode="clip")
+                else:
+                    LK[...] = LU[k0:, k0:k1]
+            with inst.fase("actualizacion_panel"):
+                _sustitucion_adelante(LK[:k1 - k0], P[k0:k1], diagonal_unitaria=True)
+                if k1 < n:
+                    P[k1:] -= LK[k1 - k0:] @ P[k0:k1]
+
+        # --- factorización del panel en memoria
+        with inst.fase("factorizacion_panel"):
+            contador.intercambios += _lu_panel(P, c0, 0, w, piv)
+
+        with inst.fase("escritura"):
+            LU[:, c0:c1] = P
+        inversas.append(np.argsort(piv))
+
+    # --- los intercambios posteriores a cada panel se aplican a sus filas de L
+    with inst.fase("escritura"):
+        for k, k0 in enumerate(range(0, n, nb)):
+            k1 = min(k0 + nb, n)
+            orden = inversas[k][piv[k1:]] - k1
+            if np.any(orden != np.arange(n - k1)):
+                LK = lectura[:n - k1, :k1 - k0]
+                np.take(LU[k1:, k0:k1], orden, axis=0, out=LK, mode="clip")
+                LU[k1:, k0:k1] = LK
+    if isinstance(LU, np.memmap):
+        LU.flush()
+
+    if contar_ops or inst.activo:
+        contador.mult_div += (n**3 - n) // 3
+        contador.sumas_restas += (n - 1) * n * (2 * n - 1) // 6
+        inst.agregar_contador(contador)
+
+    factor = FactorLU(LU, piv, contador.intercambios)
+    if contar_ops:
+        return factor, contador
+    return factor
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Almacenamiento por bandas y disperso (CSR/COO) para los métodos directos.
+El costo de factorizar y resolver escala con el ancho de banda y no con n³.
+"""
+
+import numpy as np
+
+
+# ####################################################################
+class MatrizBanda:
+    """Matriz n-by-n con ``kl`` diagonales inferiores y ``ku`` superiores.
+
+    Se usa el formato por diagonales de LAPACK: ``ab[ku + i - j, j] = A[i, j]``,
+    con ``ab`` de tamaño (kl + ku + 1, n).
+    """
+    def __init__(self, ab: np.ndarray, kl: int, ku: int):
+        ab = np.asarray(ab, dtype=float)
+        assert ab.ndim == 2 and ab.shape[0] == kl + ku + 1, \
+            "ab debe ser de tamaño (kl + ku + 1, n)."
+        self.ab = ab
+        self.kl = kl
+        self.ku = ku
+
+    @property
+    def n(self) -> int:
+        return self.ab.shape[1]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.n, self.n
+
+    @property
+    def es_tridiagonal(self) -> bool:
+        return self.kl <= 1 and self.ku <= 1
+
+    @classmethod
+    def tridiagonal(
+        cls, inferior: np.ndarray, diagonal: np.ndarray, superior: np.ndarray
+    ) -> "MatrizBanda":
+        """Construye una matriz tridiagonal a partir de sus tres diagonales."""
+        n = len(diagonal)
+        assert len(inferior) == len(superior) == n - 1, \
+            "Las diagonales inferior y superior deben tener n - 1 elementos."
+        ab = np.zeros((3, n))
+        ab[0, 1:] = superior
+        ab[1] = diagonal
+        ab[2, :-1] = inferior
+        return cls(ab, 1, 1)
+
+    @classmethod
+    def desde_densa(
+        cls, A: np.ndarray, kl: int | None = None, ku: int | None = None
+    ) -> "MatrizBanda":
+        """Extrae la banda de una matriz densa. Si no se dan ``kl``/``ku`` se
+        calculan a partir de las entradas no nulas."""
+        A = np.asarray(A, dtype=float)
+        assert A.ndim == 2 and A.shape[0] == A.shape[1], "La matriz A debe ser cuadrada."
+        filas, columnas = np.nonzero(A)
+        return cls._desde_entradas(filas, columnas, A[filas, columnas], A.shape[0], kl, ku)
+
+    @classmethod
+    def _desde_entradas(cls, filas, columnas, valores, n, kl=None, ku=None):
+        desplazamiento = filas - columnas
+        if kl is None:
+            kl = int(max(desplazamiento.max(initial=0), 0))
+        if ku is None:
+            ku = int(max(-desplazamiento.min(initial=0), 0))
+        assert np.all((desplazamiento <= kl) & (-desplazamiento <= ku)), \
+            "Hay entradas no nulas fuera de la banda."
+        ab = np.zeros((kl + ku + 1, n))
+        np.add.at(ab, (ku + desplazamiento, columnas), valores)
+        return cls(ab, kl, ku)
+
+    def a_coo(self) -> "MatrizCOO":
+        n, ku = self.n, self.ku
+        filas, columnas, valores = [], [], []
+        for r in range(self.ab.shape[0]):
+            d = r - ku
+            j = np.arange(max(0, -d), min(n, n - d))
+            filas.append(j + d)
+            columnas.append(j)
+            valores.append(self.ab[r, j])
+        return MatrizCOO(
+            np.concatenate(filas), np.concatenate(columnas), np.concatenate(valores),
+            self.shape,
+        )
+
+    def a_densa(self) -> np.ndarray:
+        n, ku = self.n, self.ku
+        A = np.zeros((n, n))
+        for r in range(self.ab.shape[0]):
+            d = r - ku  # diagonal i - j = d
+            j = np.arange(max(0, -d), min(n, n - d))
+            A[j + d, j] = self.ab[r, j]
+        return A
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        n, ku = self.n, self.ku
+        y = np.zeros((n,) + x.shape[1:])
+        for r in range(self.ab.shape[0]):
+            d = r - ku
+            j = np.arange(max(0, -d), min(n, n - d))
+            y[j + d] += (self.ab[r, j] * x[j].T).T
+        return y
+
+    def __repr__(self):
+        return f"MatrizBanda(n={self.n}, kl={self.kl}, ku={self.ku})"
+
+
+# ####################################################################
+class MatrizCSR:
+    """Matriz dispersa en formato CSR (filas comprimidas)."""
+    def __init__(
+        self, datos: np.ndarray, indices: np.ndarray, indptr: np.ndarray,
+        forma: tuple[int, int],
+    ):
+        self.datos = np.asarray(datos, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = tuple(forma)
+        assert len(self.indptr) == self.shape[0] + 1, "indptr debe tener n + 1 elementos."
+
+    @property
+    def nnz(self) -> int:
+        return len(self.datos)
+
+    @classmethod
+    def desde_densa(cls, A: np.ndarray) -> "MatrizCSR":
+        return MatrizCOO.desde_densa(A).a_csr()
+
+    def a_coo(self) -> "MatrizCOO":
+        filas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return MatrizCOO(filas, self.indices, self.datos, self.shape)
+
+    def a_banda(self) -> MatrizBanda:
+        return self.a_coo().a_banda()
+
+    def a_densa(self) -> np.ndarray:
+        return self.a_coo().a_densa()
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        return self.a_coo() @ x
+
+    def __repr__(self):
+        return f"MatrizCSR(shape={self.shape}, nnz={self.nnz})"
+
+
+class MatrizCOO:
+    """Matriz dispersa en formato de coordenadas (fila, columna, valor).
+    Las entradas repetidas se suman."""
+    def __init__(
+        self, filas: np.ndarray, columnas: np.ndarray, valores: np.ndarray,
+        forma: tuple[int, int],
+    ):
+        self.filas = np.asarray(filas, dtype=np.intp)
+        self.columnas = np.asarray(columnas, dtype=np.intp)
+        self.valores = np.asarray(valores, dtype=float)
+        self.shape = tuple(forma)
+        assert len(self.filas) == len(self.columnas) == len(self.valores), \
+            "filas, columnas y valores deben tener la misma longitud."
+
+    @property
+    def nnz(self) -> int:
+        return len(self.valores)
+
+    @classmethod
+    def desde_densa(cls, A: np.ndarray) -> "MatrizCOO":
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        return cls(filas, columnas, A[filas, columnas], A.shape)
+
+    def a_csr(self) -> MatrizCSR:
+        orden = np.lexsort((self.columnas, self.filas))
+        filas, columnas = self.filas[orden], self.columnas[orden]
+        valores = self.valores[orden]
+
+        # sumar entradas repetidas
+        nuevo = np.ones(len(filas), dtype=bool)
+        nuevo[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1])
+        grupos = np.cumsum(nuevo) - 1
+        valores = np.bincount(grupos, weights=valores) if len(valores) else valores
+        filas, columnas = filas[nuevo], columnas[nuevo]
+
+        indptr = np.zeros(self.shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(filas, minlength=self.shape[0]), out=indptr[1:])
+        return MatrizCSR(valores, columnas, indptr, self.shape)
+
+    def a_banda(self) -> MatrizBanda:
+        assert self.shape[0] == self.shape[1], "La matriz debe ser cuadrada."
+        return MatrizBanda._desde_entradas(
+            self.filas, self.columnas, self.valores, self.shape[0]
+        )
+
+    def a_densa(self) -> np.ndarray:
+        A = np.zeros(self.shape)
+        np.add.at(A, (self.filas, self.columnas), self.valores)
+        return A
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        y = np.zeros((self.shape[0],) + x.shape[1:])
+        np.add.at(y, self.filas, (self.valores * x[self.columnas].T).T)
+        return y
+
+    def __repr__(self):
+        return f"MatrizCOO(shape={self.shape}, nnz={self.nnz})"
+
+
+# ####################################################################
+def es_dispersa(A) -> bool:
+    """True si ``A`` está en almacenamiento por bandas o disperso (incluye
+    cualquier objeto con ``tocoo()``, como las matrices de scipy.sparse)."""
+    return isinstance(A, (MatrizBanda, MatrizCSR, MatrizCOO)) or hasattr(A, "tocoo")
+
+
+def como_banda(A) -> MatrizBanda:
+    """Convierte una matriz por bandas, CSR o COO a ``MatrizBanda`` en O(nnz)."""
+    if isinstance(A, MatrizBanda):
+        return A
+    if isinstance(A, (MatrizCSR, MatrizCOO)):
+        return A.a_banda()
+    if hasattr(A, "tocoo"):
+        coo = A.tocoo()
+        return MatrizCOO(coo.row, coo.col, coo.data, coo.shape).a_banda()
+    raise TypeError(f"Tipo de matriz no soportado: {type(A).__name__}")
+
+
+# Hasta este número de columnas de d las sustituciones de ``thomas`` se hacen
+# columna por columna con floats de Python.
+COLUMNAS_ESCALARES = 8
+
+
+# ####################################################################
+def thomas(
+    inferior: np.ndarray,
+    diagonal: np.ndarray,
+    superior: np.ndarray,
+    d: np.ndarray,
+) -> np.ndarray:
+    """Resuelve un sistema tridiagonal con el algoritmo de Thomas en O(n).
+    [IMPORTANTE] No se realiza pivoteo; se asume diagonal dominante o
+    matriz simétrica definida positiva.
+
+    ## Parameters
+    ``inferior``: diagonal inferior, n - 1 elementos.
+    ``diagonal``: diagonal principal, n elementos.
+    ``superior``: diagonal superior, n - 1 elementos.
+    ``d``: términos independientes de tamaño (n,) o (n, k).
+
+    ## Return
+    ``x``: solución con la misma forma que ``d``.
+    """
+    a = np.asarray(inferior, dtype=float).tolist()
+    b = np.asarray(diagonal, dtype=float).tolist()
+    c = np.asarray(superior, dtype=float).tolist()
+    x = np.array(d, dtype=float)
+    n = len(b)
+    assert x.shape[0] == n, "Las dimensiones de la matriz y d no coinciden."
+
+    # --- eliminación hacia adelante (solo depende de la matriz)
+    c_prima = [0.0] * max(n - 1, 0)
+    beta = [0.0] * n
+    beta[0] = b[0]
+    if beta[0] == 0:
+        raise ValueError("No existe solución única (pivote cero, se requiere pivoteo).")
+    for i in range(1, n):
+        c_prima[i - 1] = c[i - 1] / beta[i - 1]
+        beta[i] = b[i] - a[i - 1] * c_prima[i - 1]
+        if beta[i] == 0:
+            raise ValueError("No existe solución única (pivote cero, se requiere pivoteo).")
+
+    # --- sustituciones; con pocas columnas se hacen con floats de Python, que
+    # en un bucle de n pasos es más rápido que operar filas de numpy
+    if x.ndim == 1:
+        return np.array(_sustituir_thomas(x.tolist(), a, c_prima, beta))
+    if x.shape[1] <= COLUMNAS_ESCALARES:
+        for k in range(x.shape[1]):
+            x[:, k] = _sustituir_thomas(x[:, k].tolist(), a, c_prima, beta)
+        return x
+    return _sustituir_thomas(x, a, c_prima, beta)
+
+
+def _sustituir_thomas(y, a: list[float], c_prima: list[float], beta: list[float]):
+    """Ly = d y Ux = y del algoritmo de Thomas, en sitio sobre ``y`` (lista de
+    floats o arreglo (n, k))."""
+    n = len(beta)
+    y[0] /= beta[0]
+    for i in range(1, n):
+        y[i] = (y[i] - a[i - 1] * y[i - 1]) / beta[i]
+    for i in range(n - 2, -1, -1):
+        y[i] -= c_prima[i] * y[i + 1]
+    return y
+
+
+def factorizar_banda(M: MatrizBanda) -> tuple[MatrizBanda, MatrizBanda]:
+    """Descomposición LU de una matriz por bandas sin pivoteo.
+    Sin pivoteo no hay relleno fuera de la banda: L tiene ``kl`` diagonales
+    inferiores y U ``ku`` superiores. El costo es O(n kl ku).
+
+    ## Return
+    ``L``: MatrizBanda triangular inferior con diagonal unitaria.
+    ``U``: MatrizBanda triangular superior.
+    """
+    kl, ku, n = M.kl, M.ku, M.n
+    ab = M.ab.copy()
+    d = np.arange(1, kl + 1)[:, None]
+    e = np.arange(1, ku + 1)[None, :]
+
+    for k in range(n):
+        if ab[ku, k] == 0:
+            raise ValueError("No existe solución única (pivote cero, se requiere pivoteo).")
+        dl = min(kl, n - 1 - k)
+        du = min(ku, n - 1 - k)
+        if dl == 0:
+            continue
+        m = ab[ku + 1:ku + 1 + dl, k]
+        m /= ab[ku, k]
+        if du == 0:
+            continue
+        # A[k+d, k+e] -= m_d * A[k, k+e]
+        ee = e[:, :du]
+        ab[ku + d[:dl] - ee, k + ee] -= np.multiply.outer(m, ab[ku - ee[0], k + ee[0]])
+
+    abL = ab[ku:].copy()
+    abL[0] = 1
+    return MatrizBanda(abL, kl, 0), MatrizBanda(ab[:ku + 1].copy(), 0, ku)
+
+
+def resolver_banda(L: MatrizBanda, U: MatrizBanda, b: np.ndarray) -> np.ndarray:
+    """Resuelve LUx = b con factores por bandas. ``b`` de tamaño (n,) o (n, k)."""
+    x = np.array(b, dtype=float)
+    n, kl, ku = L.n, L.kl, U.ku
+    assert x.shape[0] == n, "Las dimensiones de L y b no coinciden."
+
+    # --- Ly = b (por columnas)
+    for k in range(n):
+        if L.ab[0, k] != 1:
+            x[k] /= L.ab[0, k]
+        dl = min(kl, n - 1 - k)
+        if dl:
+            x[k + 1:k + 1 + dl] -= np.multiply.outer(L.ab[1:1 + dl, k], x[k])
+
+    # --- Ux = y (por columnas)
+    for k in range(n - 1, -1, -1):
+        x[k] /= U.ab[ku, k]
+        du = min(ku, k)
+        if du:
+            x[k - du:k] -= np.multiply.outer(U.ab[ku - du:ku, k], x[k])
+    return x
+
+
+def resolver_banda_t(L: MatrizBanda, U: MatrizBanda, b: np.ndarray) -> np.ndarray:
+    """Resuelve Aᵀx = b (Aᵀ = UᵀLᵀ) con los mismos factores por bandas de A,
+    sin factorizar Aᵀ. ``b`` de tamaño (n,) o (n, k)."""
+    x = np.array(b, dtype=float)
+    n, kl, ku = L.n, L.kl, U.ku
+    assert x.shape[0] == n, "Las dimensiones de L y b no coinciden."
+
+    # --- Uᵀy = b (por filas: la columna k de U es la fila k de Uᵀ)
+    for k in range(n):
+        du = min(ku, k)
+        if du:
+            x[k] -= U.ab[ku - du:ku, k] @ x[k - du:k]
+        x[k] /= U.ab[ku, k]
+
+    # --- Lᵀx = y (por filas: la columna k de L es la fila k de Lᵀ)
+    for k in range(n - 1, -1, -1):
+        dl = min(kl, n - 1 - k)
+        if dl:
+            x[k] -= L.ab[1:1 + dl, k] @ x[k + 1:k + 1 + dl]
+        if L.ab[0, k] != 1:
+            x[k] /= L.ab[0, k]
+    return x
+
+
+def resolver_disperso(A, b: np.ndarray) -> np.ndarray:
+    """Resuelve Ax = b para ``A`` por bandas, CSR o COO. Usa el algoritmo de
+    Thomas si la matriz es tridiagonal y LU por bandas en otro caso."""
+    M = como_banda(A)
+    if M.es_tridiagonal:
+        ab = np.zeros((3, M.n))
+        ab[1 - M.ku:2 + M.kl] = M.ab
+        return thomas(ab[2, :-1], ab[1], ab[0, 1:], b)
+    L, U = factorizar_banda(M)
+    return resolver_banda(L, U, b)
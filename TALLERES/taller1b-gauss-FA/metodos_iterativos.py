@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Métodos iterativos para sistemas de ecuaciones lineales: Jacobi, Gauss-Seidel
+y SOR. Las divisiones de la matriz se calculan una sola vez; se admiten
+matrices densas, por bandas o dispersas (CSR/COO), arranque en caliente y
+varios lados derechos a la vez.
+"""
+
+import logging
+
+import numpy as np
+
+from linear_sist_methods import _sustitucion_adelante
+from matrices_dispersas import MatrizBanda, MatrizCOO, MatrizCSR, es_dispersa
+
+
+METODOS = ("jacobi", "gauss_seidel", "sor")
+
+
+# ####################################################################
+def _como_coo(A) -> MatrizCOO:
+    if isinstance(A, MatrizCOO):
+        return A
+    if isinstance(A, (MatrizCSR, MatrizBanda)):
+        return A.a_coo()
+    coo = A.tocoo()
+    return MatrizCOO(coo.row, coo.col, coo.data, coo.shape)
+
+
+class _Dispersa:
+    """Producto matriz-vector sobre entradas (fila, columna, valor)."""
+    def __init__(self, filas, columnas, valores, n):
+        self.filas = filas
+        self.columnas = columnas
+        self.valores = valores
+        self.n = n
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        if x.ndim == 1:
+            return np.bincount(
+                self.filas, weights=self.valores * x[self.columnas], minlength=self.n
+            )
+        y = np.zeros((self.n,) + x.shape[1:])
+        np.add.at(y, self.filas, self.valores[:, None] * x[self.columnas])
+        return y
+
+
+# ####################################################################
+class SolucionadorIterativo:
+    """Solucionador iterativo con las divisiones de ``A`` precalculadas.
+
+    - Jacobi: x = D⁻¹ (b - R x), con R = A - D.
+    - Gauss-Seidel: (D + L) x = b - U x, un barrido hacia adelante en sitio.
+    - SOR: (D + ωL) x = ωb - (ωU + (ω - 1) D) x.
+
+    ## Parameters
+    ``A``: matriz cuadrada n-by-n (densa, MatrizBanda, CSR o COO).
+    ``metodo``: "jacobi", "gauss_seidel" o "sor".
+    ``omega``: factor de relajación para SOR (0 < ω < 2).
+    """
+    def __init__(self, A, metodo: str = "jacobi", omega: float = 1.0):
+        assert metodo in METODOS, f"metodo debe ser uno de {METODOS}."
+        assert 0 < omega < 2, "omega debe estar en (0, 2)."
+        if metodo == "gauss_seidel":
+            omega = 1.0
+        self.metodo = metodo
+        self.omega = omega
+        self.disperso = es_dispersa(A)
+
+        if self.disperso:
+            coo = _como_coo(A)
+            assert coo.shape[0] == coo.shape[1], "La matriz A debe ser cuadrada."
+            n = coo.shape[0]
+            f, c, v = coo.filas, coo.columnas, coo.valores
+            diagonal = np.bincount(f[f == c], weights=v[f == c], minlength=n)
+            self.A = _Dispersa(f, c, v, n)
+        else:
+            A = np.array(A, dtype=float)
+            assert A.ndim == 2 and A.shape[0] == A.shape[1], "La matriz A debe ser cuadrada."
+            n = A.shape[0]
+            diagonal = np.diagonal(A).copy()
+            self.A = A
+
+        if np.any(diagonal == 0):
+            raise ValueError("La diagonal de A tiene ceros; el método no está definido.")
+        self.n = n
+        self.diagonal = diagonal
+        self.d_inv = 1.0 / diagonal
+
+        if metodo == "jacobi":
+            # R = A - D
+            if self.disperso:
+                fuera = f != c
+                self.R = _Dispersa(f[fuera], c[fuera], v[fuera], n)
+            else:
+                self.R = A.copy()
+                np.fill_diagonal(self.R, 0)
+            return
+
+        # M = D + ωL (triangular inferior) y N = ωU + (ω - 1) D
+        if self.disperso:
+            inferior = f > c
+            superior = f < c
+            orden = np.lexsort((c[inferior], f[inferior]))
+            self.L_filas = f[inferior][orden]
+            self.L_columnas = c[inferior][orden]
+            self.L_valores = omega * v[inferior][orden]
+            self.L_indptr = np.searchsorted(self.L_filas, np.arange(n + 1))
+            self._L_listas = (
+                self.L_indptr.tolist(), self.L_columnas.tolist(),
+                self.L_valores.tolist(), self.d_inv.tolist(),
+            )
+            self.N = _Dispersa(
+                np.concatenate([f[superior], np.arange(n)]),
+                np.concatenate([c[superior], np.arange(n)]),
+                np.concatenate([omega * v[superior], (omega - 1) * diagonal]),
+                n,
+            )
+        else:
+            self.M = np.tril(A, -1) * omega
+            self.M[np.diag_indices(n)] = diagonal
+            self.N = np.triu(A, 1) * omega
+            self.N[np.diag_indices(n)] = (omega - 1) * diagonal
+
+    # ----------------------------------------------------------------
+    def _barrido(self, x: np.ndarray, b: np.ndarray, trabajo: np.ndarray) -> None:
+        """Una iteración; deja el nuevo iterado en ``x``."""
+        if self.metodo == "jacobi":
+            if self.disperso:
+                trabajo[...] = self.R @ x
+            else:
+                np.matmul(self.R, x, out=trabajo)
+            np.subtract(b, trabajo, out=trabajo)
+            np.multiply(self.d_inv.reshape((-1,) + (1,) * (x.ndim - 1)), trabajo, out=x)
+            return
+
+        # lado derecho: ωb - N x, y luego barrido hacia adelante (en sitio)
+        if self.disperso:
+            trabajo[...] = self.N @ x
+        else:
+            np.matmul(self.N, x, out=trabajo)
+        np.subtract(self.omega * b, trabajo, out=x)
+        if self.disperso and x.ndim == 1:
+            # con un solo lado derecho el barrido escalar es más rápido con listas
+            indptr, columnas, valores, d_inv = self._L_listas
+            xs = x.tolist()
+            for i in range(self.n):
+                suma = xs[i]
+                for p in range(indptr[i], indptr[i + 1]):
+                    suma -= valores[p] * xs[columnas[p]]
+                xs[i] = suma * d_inv[i]
+            x[:] = xs
+        elif self.disperso:
+            indptr, columnas, valores = self.L_indptr, self.L_columnas, self.L_valores
+            for i in range(self.n):
+                ini, fin = indptr[i], indptr[i + 1]
+                if fin > ini:
+                    x[i] -= valores[ini:fin] @ x[columnas[ini:fin]]
+                x[i] *= self.d_inv[i]
+        else:
+            _sustitucion_adelante(self.M, x)
+
+    def residuo(self, x: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Residuo relativo ||b - Ax||∞ / ||b||∞ por cada columna de ``b``."""
+        r = np.max(np.abs(b - self.A @ x), axis=0)
+        escala = np.max(np.abs(b), axis=0)
+        return r / np.where(escala > 0, escala, 1.0)
+
+    def resolver(
+        self,
+        b: np.ndarray,
+        x0: np.ndarray | None = None,
+        tol: float = 1e-8,
+        max_iter: int = 1000,
+        cada: int = 1,
+    ) -> tuple[np.ndarray, int, float]:
+        """Itera hasta que el residuo relativo de todas las columnas sea menor a
+        ``tol`` o se alcance ``max_iter``.
+
+        ## Parameters
+        ``b``: términos independientes de tamaño (n,) o (n, k).
+        ``x0``: (opcional) aproximación inicial, p. ej. la solución de un
+                sistema anterior (arranque en caliente). Por defecto ceros.
+        ``tol``: tolerancia sobre el residuo relativo.
+        ``max_iter``: número máximo de iteraciones.
+        ``cada``: el residuo (un producto con A) se revisa cada ``cada`` iteraciones.
+
+        ## Return
+        ``x``: solución aproximada con la forma de ``b``.
+        ``iteraciones``: número de iteraciones realizadas.
+        ``residuo``: mayor residuo relativo final entre las columnas.
+        """
+        b = np.asarray(b, dtype=float)
+        assert b.shape[0] == self.n, "Las dimensiones de A y b no coinciden."
+        assert cada >= 1, "cada debe ser al menos 1."
+        x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+        assert x.shape == b.shape, "x0 debe tener la misma forma que b."
+        trabajo = np.empty_like(b)
+
+        residuo = float(np.max(self.residuo(x, b), initial=0.0))
+        i = 0
+        while residuo >= tol and i < max_iter:
+            self._barrido(x, b, trabajo)
+            i += 1
+            if i % cada == 0 or i == max_iter:
+                residuo = float(np.max(self.residuo(x, b), initial=0.0))
+                if not np.isfinite(residuo):
+                    logging.warning("%s diverge en la iteración %d.", self.metodo, i)
+                    break
+
+        if residuo >= tol:
+            logging.warning(
+                "%s no converge en %d iteraciones (residuo %.3e).", self.metodo, i, residuo
+            )
+        return x, i, residuo
+
+
+# ####################################################################
+def resolver_iterativo(
+    A,
+    b: np.ndarray,
+    metodo: str = "jacobi",
+    tol: float = 1e-8,
+    max_iter: int = 1000,
+    x0: np.ndarray | None = None,
+    omega: float = 1.0,
+    cada: int = 1,
+) -> tuple[np.ndarray, int, float]:
+    """Resuelve Ax = b con Jacobi, Gauss-Seidel o SOR.
+    Ver ``SolucionadorIterativo.resolver`` para los parámetros y el retorno.
+    Para resolver varias veces con la misma ``A`` conviene crear un
+    ``SolucionadorIterativo`` y reutilizarlo.
+    """
+    solucionador = SolucionadorIterativo(A, metodo, omega)
+    return solucionador.resolver(b, x0, tol, max_iter, cada)
+
+
+def jacobi(A, b, tol=1e-8, max_iter=1000, x0=None, cada=1):
+    """Método de Jacobi. Ver ``resolver_iterativo``."""
+    return resolver_iterativo(A, b, "jacobi", tol, max_iter, x0, cada=cada)
+
+
+def gauss_seidel(A, b, tol=1e-8, max_iter=1000, x0=None, cada=1):
+    """Método de Gauss-Seidel. Ver ``resolver_iterativo``."""
+    return resolver_iterativo(A, b, "gauss_seidel", tol, max_iter, x0, cada=cada)
+
+
+def sor(A, b, omega, tol=1e-8, max_iter=1000, x0=None, cada=1):
+    """Método de sobrerrelajación sucesiva (SOR). Ver ``resolver_iterativo``."""
+    return resolver_iterativo(A, b, "sor", tol, max_iter, x0, omega, cada)
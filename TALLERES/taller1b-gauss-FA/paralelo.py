@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Ejecución en paralelo (pool de procesos) de lotes grandes de sistemas
+independientes. Las matrices se pasan a los procesos por memoria compartida
+en lugar de serializarlas.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from linear_sist_methods import (
+    descomposicion_LU,
+    eliminacion_gaussiana,
+    factorizar_LU,
+    gauss_jordan,
+    resolver_LU,
+)
+
+
+# ####################################################################
+def _resolver_LU_aumentada(Ab: np.ndarray) -> np.ndarray:
+    L, U = descomposicion_LU(Ab[:, :-1])
+    return resolver_LU(L, U, Ab[:, -1]).ravel()
+
+
+def _factorizar_LU_aumentada(Ab: np.ndarray) -> np.ndarray:
+    return factorizar_LU(Ab[:, :-1]).resolver(Ab[:, -1])
+
+
+METODOS = {
+    "eliminacion_gaussiana": eliminacion_gaussiana,
+    "gauss_jordan": gauss_jordan,
+    "descomposicion_LU": _resolver_LU_aumentada,
+    "factorizar_LU": _factorizar_LU_aumentada,
+}
+
+
+# ####################################################################
+def _trabajador(
+    metodo: str,
+    nombre_entrada: str,
+    nombre_salida: str,
+    nombre_desplazamientos: str | None,
+    lote: int,
+    n_uniforme: int,
+    inicio: int,
+    fin: int,
+) -> list[tuple[int, str]]:
+    """Resuelve los sistemas ``inicio..fin-1`` y escribe sus soluciones en la
+    memoria compartida de salida. Retorna los errores como ``(indice, mensaje)``.
+
+    Si todos los sistemas tienen el mismo tamaño (``n_uniforme`` > 0) los
+    desplazamientos se calculan; si no, se leen del segmento
+    ``nombre_desplazamientos`` (filas n, inicio de entrada, inicio de salida).
+    """
+    resolver = METODOS[metodo]
+    segmentos = [shared_memory.SharedMemory(name=nombre_entrada),
+                 shared_memory.SharedMemory(name=nombre_salida)]
+    if nombre_desplazamientos is not None:
+        segmentos.append(shared_memory.SharedMemory(name=nombre_desplazamientos))
+    errores = []
+    Ab = None
+    try:
+        entrada = np.ndarray((segmentos[0].size // 8,), dtype=float, buffer=segmentos[0].buf)
+        salida = np.ndarray((segmentos[1].size // 8,), dtype=float, buffer=segmentos[1].buf)
+        if n_uniforme:
+            n = n_uniforme
+            indices = np.arange(inicio, fin)
+            ns = np.full(fin - inicio, n)
+            inicio_entrada = indices * (n * (n + 1))
+            inicio_salida = indices * n
+        else:
+            tabla = np.ndarray((3, lote), dtype=np.intp, buffer=segmentos[2].buf)
+            ns, inicio_entrada, inicio_salida = tabla[:, inicio:fin].copy()
+            del tabla
+        for k, i in enumerate(range(inicio, fin)):
+            n = int(ns[k])
+            e, o = int(inicio_entrada[k]), int(inicio_salida[k])
+            Ab = entrada[e:e + n * (n + 1)].reshape(n, n + 1)
+            try:
+                salida[o:o + n] = resolver(Ab)
+            except (ValueError, ArithmeticError, AssertionError) as ex:
+                errores.append((i, f"{type(ex).__name__}: {ex}"))
+        del entrada, salida, Ab
+    finally:
+        for shm in segmentos:
+            shm.close()
+    return errores
+
+
+# ####################################################################
+class ResolutorParalelo:
+    """Pool de procesos y memoria compartida reutilizables para resolver
+    varios lotes seguidos (p. ej. los bloques de ``resolver_flujo``) sin
+    volver a crear procesos ni segmentos en cada lote. Los segmentos solo se
+    recrean cuando un lote no cabe en los actuales.
+
+    ## Parameters
+    ``procesos``: número de procesos; por defecto ``os.cpu_count()``.
+    ``metodo``: uno de ``METODOS``: "eliminacion_gaussiana", "gauss_jordan",
+                "descomposicion_LU" o "factorizar_LU".
+
+    Se usa como administrador de contexto o cerrando con ``cerrar()``.
+    """
+    def __init__(self, procesos: int | None = None, metodo: str = "eliminacion_gaussiana"):
+        assert metodo in METODOS, f"metodo debe ser uno de {list(METODOS)}."
+        self.procesos = procesos or os.cpu_count() or 1
+        self.metodo = metodo
+        self.pool = ProcessPoolExecutor(max_workers=self.procesos)
+        self._segmentos: dict[str, shared_memory.SharedMemory] = {}
+
+    def _segmento(self, clave: str, nbytes: int) -> shared_memory.SharedMemory:
+        shm = self._segmentos.get(clave)
+        if shm is None or shm.size < nbytes:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 8))
+            self._segmentos[clave] = shm
+        return shm
+
+    def resolver(
+        self,
+        sistemas: np.ndarray | list[np.ndarray],
+        tam_tarea: int | None = None,
+    ) -> tuple[np.ndarray | list[np.ndarray], list[str | None]]:
+        """Resuelve un lote; ver ``resolver_en_paralelo``."""
+        apilado = isinstance(sistemas, np.ndarray) and sistemas.ndim == 3
+        if apilado:
+            assert sistemas.shape[1] == sistemas.shape[2] - 1, \
+                "Cada sistema debe ser una matriz aumentada n-by-(n+1)."
+            lote, n_uniforme = sistemas.shape[0], sistemas.shape[1]
+            tam_entrada = sistemas.size
+            tam_salida = lote * n_uniforme
+        else:
+            matrices = [np.asarray(Ab, dtype=float) for Ab in sistemas]
+            for Ab in matrices:
+                assert Ab.ndim == 2 and Ab.shape[0] == Ab.shape[1] - 1, \
+                    "Cada sistema debe ser una matriz aumentada n-by-(n+1)."
+            lote, n_uniforme = len(matrices), 0
+            filas = np.array([Ab.shape[0] for Ab in matrices], dtype=np.intp)
+            tam_entrada = int(np.sum(filas * (filas + 1)))
+            tam_salida = int(np.sum(filas))
+        if lote == 0:
+            return (np.empty((0, n_uniforme)) if apilado else []), []
+        tam_tarea = tam_tarea or max(1, -(-lote // (4 * self.procesos)))
+
+        shm_entrada = self._segmento("entrada", tam_entrada * 8)
+        shm_salida = self._segmento("salida", tam_salida * 8)
+        entrada = np.ndarray((tam_entrada,), dtype=float, buffer=shm_entrada.buf)
+        salida = np.ndarray((tam_salida,), dtype=float, buffer=shm_salida.buf)
+        nombre_desplazamientos = None
+        try:
+            if apilado:
+                entrada.reshape(sistemas.shape)[...] = sistemas
+            else:
+                shm_tabla = self._segmento("desplazamientos", 3 * lote * np.dtype(np.intp).itemsize)
+                nombre_desplazamientos = shm_tabla.name
+                tabla = np.ndarray((3, lote), dtype=np.intp, buffer=shm_tabla.buf)
+                ns, inicio_entrada, inicio_salida = tabla
+                ns[:] = filas
+                inicio_entrada[0] = inicio_salida[0] = 0
+                np.cumsum((ns * (ns + 1))[:-1], out=inicio_entrada[1:])
+                np.cumsum(ns[:-1], out=inicio_salida[1:])
+                for i, Ab in enumerate(matrices):
+                    entrada[inicio_entrada[i]:inicio_entrada[i] + Ab.size] = Ab.reshape(-1)
+                desplazamientos = inicio_salida.copy()
+                del ns, inicio_entrada, inicio_salida, tabla
+            salida[:] = np.nan
+
+            errores: list[str | None] = [None] * lote
+            tareas = [
+                self.pool.submit(
+                    _trabajador, self.metodo, shm_entrada.name, shm_salida.name,
+                    nombre_desplazamientos, lote, n_uniforme, ini, min(ini + tam_tarea, lote),
+                )
+                for ini in range(0, lote, tam_tarea)
+            ]
+            for tarea in tareas:
+                for i, mensaje in tarea.result():
+                    errores[i] = mensaje
+            resultado = salida.copy()
+        finally:
+            del entrada, salida
+
+        fallidos = sum(e is not None for e in errores)
+        if fallidos:
+            logging.warning("%d de %d sistemas no se pudieron resolver.", fallidos, lote)
+
+        if apilado:
+            return resultado.reshape(lote, n_uniforme), errores
+        fines = np.append(desplazamientos[1:], tam_salida)
+        return [resultado[i:j] for i, j in zip(desplazamientos, fines)], errores
+
+    def cerrar(self) -> None:
+        self.pool.shutdown()
+        for shm in self._segmentos.values():
+            shm.close()
+            shm.unlink()
+        self._segmentos.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def resolver_en_paralelo(
+    sistemas: np.ndarray | list[np.ndarray],
+    metodo: str = "eliminacion_gaussiana",
+    procesos: int | None = None,
+    tam_tarea: int | None = None,
+    resolutor: ResolutorParalelo | None = None,
+) -> tuple[np.ndarray | list[np.ndarray], list[str | None]]:
+    """Resuelve un lote de sistemas independientes en un pool de procesos.
+
+    ## Parameters
+    ``sistemas``: arreglo de tamaño (lote, n, n+1) o lista de matrices aumentadas
+                  (pueden tener distinto n).
+    ``metodo``: uno de ``METODOS``: "eliminacion_gaussiana", "gauss_jordan",
+                "descomposicion_LU" o "factorizar_LU".
+    ``procesos``: número de procesos; por defecto ``os.cpu_count()``.
+    ``tam_tarea``: sistemas por tarea; por defecto se reparten unas 4 tareas
+                   por proceso para balancear la carga.
+    ``resolutor``: (opcional) ResolutorParalelo ya creado, para reutilizar su
+                   pool y su memoria compartida entre llamadas; en ese caso
+                   ``metodo`` y ``procesos`` se toman del resolutor.
+
+    ## Return
+    ``soluciones``: en el orden de entrada; arreglo (lote, n) si la entrada era
+                    un arreglo, o lista de vectores. Las soluciones de los
+                    sistemas que fallaron se llenan con NaN.
+    ``errores``: lista con None o el mensaje de error de cada sistema.
+    """
+    if resolutor is not None:
+        return resolutor.resolver(sistemas, tam_tarea)
+    with ResolutorParalelo(procesos, metodo) as nuevo:
+        return nuevo.resolver(sistemas, tam_tarea)
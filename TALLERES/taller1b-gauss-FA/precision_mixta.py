@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Python 3
+Solución de sistemas en precisión mixta: la factorización LU se hace en
+float32 y la solución se refina con residuos calculados en float64.
+"""
+
+import logging
+
+import numpy as np
+
+from linear_sist_methods import factorizar_LU
+
+
+EPS64 = np.finfo(np.float64).eps
+MAX_FLOAT32 = float(np.finfo(np.float32).max)
+
+
+# ####################################################################
+def _error_regresivo(A, x, b, r, norma_A) -> float:
+    """Error regresivo normado ||r||∞ / (||A||∞ ||x||∞ + ||b||∞), el mayor entre
+    las columnas."""
+    num = np.max(np.abs(r), axis=0)
+    den = norma_A * np.max(np.abs(x), axis=0) + np.max(np.abs(b), axis=0)
+    return float(np.max(num / np.where(den > 0, den, 1.0), initial=0.0))
+
+
+def resolver_precision_mixta(
+    A: np.ndarray | list[list[float | int]],
+    b: np.ndarray,
+    tol: float | None = None,
+    max_iter: int = 30,
+    tam_bloque: int | None = None,
+) -> tuple[np.ndarray, int, float, bool]:
+    """Resuelve Ax = b factorizando en float32 y refinando en float64.
+
+    Cada iteración calcula r = b - Ax en float64, resuelve A d = r con los
+    factores en float32 y actualiza x += d. Si el error regresivo no baja al
+    menos a la mitad en una iteración (matriz demasiado mal condicionada para
+    float32), o si la factorización en float32 falla, se factoriza en float64.
+
+    ## Parameters
+    ``A``: matriz cuadrada de tamaño n-by-n.
+    ``b``: términos independientes de tamaño (n,) o (n, k).
+    ``tol``: tolerancia sobre el error regresivo ||r|| / (||A|| ||x|| + ||b||).
+             Por defecto ``sqrt(n) * eps(float64)``.
+    ``max_iter``: número máximo de iteraciones de refinamiento.
+    ``tam_bloque``: (opcional) ancho de panel para ``factorizar_LU``.
+
+    ## Return
+    ``solucion``: arreglo float64 con la forma de ``b``.
+    ``iteraciones``: número de iteraciones de refinamiento realizadas.
+    ``residuo``: error regresivo final.
+    ``respaldo``: True si se tuvo que usar la factorización en float64.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    assert A.ndim == 2 and A.shape[0] == A.shape[1], "La matriz A debe ser cuadrada."
+    assert b.shape[0] == A.shape[0], "Las dimensiones de A y b no coinciden."
+    n = A.shape[0]
+    if tol is None:
+        tol = np.sqrt(n) * EPS64
+    norma_A = float(np.max(np.sum(np.abs(A), axis=1), initial=0.0))
+
+    iteraciones = 0
+    if norma_A < MAX_FLOAT32 and np.max(np.abs(b), initial=0.0) < MAX_FLOAT32:
+        try:
+            factor = factorizar_LU(A, tam_bloque=tam_bloque, dtype=np.float32)
+        except ValueError:
+            logging.info("La factorización en float32 falló; se usa float64.")
+        else:
+            x = factor.resolver(b.astype(np.float32)).astype(np.float64)
+            r = b - A @ x
+            residuo = _error_regresivo(A, x, b, r, norma_A)
+            while residuo > tol and iteraciones < max_iter:
+                x += factor.resolver(r.astype(np.float32))
+                iteraciones += 1
+                r = b - A @ x
+                anterior, residuo = residuo, _error_regresivo(A, x, b, r, norma_A)
+                if not residuo <= 0.5 * anterior:
+                    break
+
+            if residuo <= tol:
+                logging.debug(f"Refinamiento: {iteraciones} iteraciones, residuo {residuo:.3e}.")
+                return x, iteraciones, residuo, False
+            logging.warning(
+                f"El refinamiento en float32 no converge ({iteraciones} iteraciones, "
+                f"residuo {residuo:.3e}); se usa float64."
+            )
+
+    factor = factorizar_LU(A, tam_bloque=tam_bloque)
+    x = factor.resolver(b)
+    residuo = _error_regresivo(A, x, b, b - A @ x, norma_A)
+    return x, iteraciones, residuo, True
@@ -0,0 +1,37 @@
+import numpy as np
+
+from linear_sist_methods import eliminacion_gaussiana_lote
+
+
+def test_lote_bien_condicionado():
+    rng = np.random.default_rng(0)
+    A = rng.random((50, 6, 6)) + 6 * np.eye(6)
+    b = rng.random((50, 6))
+    soluciones, singulares = eliminacion_gaussiana_lote(np.concatenate([A, b[..., None]], axis=2))
+    assert not singulares.any()
+    assert np.allclose(soluciones, np.linalg.solve(A, b[..., None])[..., 0])
+
+
+def test_lote_con_rango_deficiente():
+    rng = np.random.default_rng(1)
+    A = rng.random((5, 3, 3))
+    A[:, 2] = 0.3 * A[:, 0] + 0.7 * A[:, 1]
+    Ab = np.concatenate([A, rng.random((5, 3, 1))], axis=2)
+    soluciones, singulares = eliminacion_gaussiana_lote(Ab)
+    assert singulares.all()
+    assert np.isnan(soluciones).all()
+
+
+def test_lote_mixto():
+    rng = np.random.default_rng(2)
+    A = rng.random((10, 4, 4)) + 4 * np.eye(4)
+    A[::2, 3] = 2 * A[::2, 0] - A[::2, 1]
+    Ab = np.concatenate([A, rng.random((10, 4, 1))], axis=2)
+    _, singulares = eliminacion_gaussiana_lote(Ab)
+    assert np.array_equal(singulares, np.arange(10) % 2 == 0)
+
+
+def test_tol_absoluta():
+    Ab = np.array([[[1.0, 2.0, 3.0], [2.0, 4.0, 6.0]]])
+    _, singulares = eliminacion_gaussiana_lote(Ab, tol=0.0)
+    assert singulares.all()
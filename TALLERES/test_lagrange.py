@@ -0,0 +1,40 @@
+import numpy as np
+
+from lagrange import InterpoladorLagrange, P
+
+
+def chebyshev(n):
+    return np.cos(np.pi * (2 * np.arange(n) + 1) / (2 * n))
+
+
+def test_coincide_con_forma_clasica():
+    x_data = np.array([-2, 1, 3, 7.0])
+    y_data = np.array([5, 7, 11, 34.0])
+    x = np.linspace(-3, 8, 50)
+    esperado = sum(
+        y_data[k] * np.prod([(x - x_data[i]) / (x_data[k] - x_data[i]) for i in range(4) if i != k], axis=0)
+        for k in range(4)
+    )
+    assert np.allclose(P(x, x_data, y_data), esperado)
+
+
+def test_muchos_nodos_sin_desbordamiento():
+    nodos = chebyshev(1200)
+    interpolador = InterpoladorLagrange(nodos, np.exp(nodos))
+    assert np.all(np.isfinite(interpolador.w))
+    x = np.linspace(-1, 1, 1001)
+    assert np.max(np.abs(interpolador(x) - np.exp(x))) < 1e-12
+
+
+def test_agregar_nodos_muchos():
+    nodos = chebyshev(1200)
+    iniciales, nuevos = nodos[::2], nodos[1::2]
+    interpolador = InterpoladorLagrange(iniciales, np.sin(iniciales))
+    for v in nuevos:
+        interpolador.agregar_nodo(v, np.sin(v))
+    completo = InterpoladorLagrange(np.concatenate([iniciales, nuevos]))
+    # los pesos coinciden salvo un factor constante
+    razon = interpolador.w / completo.w
+    assert np.allclose(razon, razon[0])
+    x = np.linspace(-1, 1, 501)
+    assert np.max(np.abs(interpolador(x) - np.sin(x))) < 1e-12
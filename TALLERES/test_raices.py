@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from raices import biseccion, brent, find_roots_bruteforce, localizar_raices, newton, secante
+
+
+C = np.array([4.0, 2.0, -1.0, 9.0])  # el carril 2 (x² + 1) no tiene raíz real
+
+
+def cuadratica(x, c):
+    return x**2 - c
+
+
+def test_mascaras_por_carril():
+    esperado = np.sqrt(np.abs(C))
+    resultados = [
+        newton(cuadratica, lambda x, c: 2 * x, 1.0, tol=1e-12, args=(C,)),
+        secante(cuadratica, 1.0, 2.0, tol=1e-12, args=(C,)),
+        biseccion(cuadratica, 0.0, 5.0, tol=1e-12, args=(C,)),
+        brent(cuadratica, 0.0, 5.0, tol=1e-12, args=(C,)),
+    ]
+    for r in resultados:
+        assert r.convergio.tolist() == [True, True, False, True], r.metodo
+        assert r.no_convergidos.tolist() == [2]
+        assert np.allclose(r.raiz[r.convergio], esperado[r.convergio], atol=1e-9)
+    # cada carril se detiene por su cuenta
+    assert len(set(resultados[0].iteraciones[resultados[0].convergio].tolist())) > 1
+
+
+def test_intervalos_sin_cambio_de_signo_son_nan():
+    a = np.array([0.0, 3.0, -5.0])
+    b = np.array([2.0, 4.0, 0.0])
+    for metodo in (biseccion, brent):
+        r = metodo(lambda x: x - 1.0, a, b, tol=1e-10)
+        assert r.convergio.tolist() == [True, False, False]
+        assert np.isnan(r.raiz[1:]).all() and np.isnan(r.fx[1:]).all()
+        assert r.iteraciones[1:].tolist() == [0, 0]
+        assert r.raiz[0] == pytest.approx(1.0, abs=1e-9)
+
+
+def test_forma_de_salida():
+    r = brent(cuadratica, 0.0, 5.0, args=(C.reshape(2, 2),))
+    assert r.raiz.shape == r.convergio.shape == r.iteraciones.shape == (2, 2)
+
+
+def test_newton_arranca_en_raiz_con_derivada_nula():
+    r = newton(lambda x: x**2, lambda x: 2 * x, 0.0)
+    assert r.convergio and r.raiz == 0.0 and r.iteraciones == 1
+
+
+def test_brent_intervalos_patologicos():
+    casos = [
+        (lambda x: x**3, -1e6, 1.0, 0.0),  # raíz triple, intervalo muy asimétrico
+        (lambda x: (x - 0.5) ** 21, 0.0, 0.8, 0.5),  # f casi plana cerca de la raíz
+        (lambda x: np.where(x < 1 / 3, -1.0, 1.0), 0.0, 1.0, 1 / 3),  # discontinua
+    ]
+    for f, a, b, raiz in casos:
+        r = brent(f, a, b, tol=1e-10, max_iter=300)
+        assert r.convergio
+        assert abs(r.raiz - raiz) < 1e-9
+        assert r.iteraciones < 300
+
+
+def test_raiz_tangente_en_punto_de_rejilla_gruesa():
+    f = lambda x: (x - 3.0001) ** 2
+    fija = localizar_raices(f, 0, 10, paso=0.01)
+    adaptativa = localizar_raices(f, 0, 10, paso=0.01, adaptativo=True)
+    assert np.allclose(fija.raiz, [3.0001], atol=1e-6)
+    assert np.allclose(adaptativa.raiz, [3.0001], atol=1e-6)
+    assert np.all(adaptativa.convergio)
+
+
+def test_adaptativa_coincide_con_rejilla_fija():
+    f = lambda x: np.sin(x) * (x - 2.5) ** 2
+    esperado = [0.0, 2.5, np.pi, 2 * np.pi, 3 * np.pi]
+    for adaptativo in (False, True):
+        resultado = localizar_raices(f, 0, 10, paso=1e-3, adaptativo=adaptativo)
+        assert np.allclose(resultado.raiz, esperado, atol=1e-6)
+
+
+def test_sin_raices():
+    assert localizar_raices(lambda x: x**2 + 1, 0, 10, paso=0.01, adaptativo=True).raiz.size == 0
+
+
+def test_find_roots_bruteforce_intervalos():
+    intervalos = find_roots_bruteforce(lambda x: np.cos(x), 0, 7, step=0.5)
+    assert len(intervalos) == 2
+    for (a, b), r in zip(intervalos, [np.pi / 2, 3 * np.pi / 2]):
+        assert a < r < b and b - a <= 0.5 + 1e-12
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from splines import SplineCubico, cubic_spline_clamped, cubic_spline_natural, evaluate_spline
+
+
+def cubica(x):
+    return x**3 - 2 * x**2 + x + 1
+
+
+def dcubica(x):
+    return 3 * x**2 - 4 * x + 1
+
+
+def test_condicionado_reproduce_cubica():
+    xs = np.array([-1.0, -0.3, 0.2, 1.1, 1.5, 3.0])
+    coef = cubic_spline_clamped(xs, cubica(xs), dcubica(xs[0]), dcubica(xs[-1]))
+    x = np.linspace(-1, 3, 401)
+    assert np.allclose(evaluate_spline(xs, coef, x), cubica(x), atol=1e-12)
+    assert np.allclose(evaluate_spline(xs, coef, x, derivada=1), dcubica(x), atol=1e-12)
+    assert np.allclose(evaluate_spline(xs, coef, x, derivada=2), 6 * x - 4, atol=1e-11)
+
+
+def test_condicionado_seno():
+    xs = np.linspace(0, np.pi, 21)
+    spline = SplineCubico(xs, np.sin(xs), "condicionada", B0=1.0, Bn=-1.0)
+    x = np.linspace(0, np.pi, 1001)
+    assert np.max(np.abs(spline(x) - np.sin(x))) < 1e-5
+    assert np.max(np.abs(spline(x, derivada=1) - np.cos(x))) < 1e-3
+    assert spline(0.0, derivada=1) == pytest.approx(1.0)
+    assert spline(np.pi, derivada=1) == pytest.approx(-1.0)
+
+
+def test_natural_frontera_y_continuidad():
+    xs = np.array([0.0, 0.5, 1.7, 2.0, 3.5])
+    ys = np.array([1.0, -2.0, 0.3, 4.0, 2.0])
+    coef = cubic_spline_natural(xs, ys)
+    assert coef.shape == (4, 4)
+    assert np.allclose(evaluate_spline(xs, coef, xs), ys)
+    assert evaluate_spline(xs, coef, xs[0], derivada=2) == pytest.approx(0.0, abs=1e-12)
+    assert evaluate_spline(xs, coef, xs[-1], derivada=2) == pytest.approx(0.0, abs=1e-12)
+    # S, S' y S'' continuas en los nodos interiores: tramo anterior evaluado en x_{j+1}
+    a, b, c, d = coef[:-1].T
+    h = np.diff(xs)[:-1]
+    assert np.allclose(a + b * h + c * h**2 + d * h**3, coef[1:, 0])
+    assert np.allclose(b + 2 * c * h + 3 * d * h**2, coef[1:, 1])
+    assert np.allclose(c + 3 * d * h, coef[1:, 2])
+
+
+def test_natural_reproduce_recta():
+    xs = np.array([0.0, 1.0, 1.5, 4.0])
+    spline = SplineCubico(xs, 2 * xs - 1)
+    x = np.linspace(-1, 5, 50)  # incluye extrapolación
+    assert np.allclose(spline(x), 2 * x - 1)
+
+
+def test_dos_nodos():
+    xs = np.array([1.0, 2.0])
+    natural = cubic_spline_natural(xs, [3.0, 5.0])
+    assert np.allclose(natural, [[3.0, 2.0, 0.0, 0.0]])
+    condicionado = cubic_spline_clamped(xs, cubica(xs), dcubica(1.0), dcubica(2.0))
+    x = np.linspace(1, 2, 11)
+    assert np.allclose(evaluate_spline(xs, condicionado, x), cubica(x))
+
+
+@pytest.mark.parametrize("m", [3, 20])
+def test_series_por_lotes(m):
+    rng = np.random.default_rng(0)
+    xs = np.sort(rng.uniform(0, 10, 30))
+    ys = rng.standard_normal((m, 30))
+    B0, Bn = rng.standard_normal(m), rng.standard_normal(m)
+
+    naturales = cubic_spline_natural(xs, ys)
+    condicionados = cubic_spline_clamped(xs, ys, B0, Bn)
+    assert naturales.shape == condicionados.shape == (m, 29, 4)
+    for k in range(m):
+        assert np.allclose(naturales[k], cubic_spline_natural(xs, ys[k]))
+        assert np.allclose(condicionados[k], cubic_spline_clamped(xs, ys[k], B0[k], Bn[k]))
+
+    x = rng.uniform(0, 10, (4, 5))
+    valores = SplineCubico(xs, ys)(x)
+    assert valores.shape == (m, 4, 5)
+    assert np.allclose(valores[1], evaluate_spline(xs, naturales[1], x))